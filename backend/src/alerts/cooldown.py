@@ -1,11 +1,20 @@
 """Alert cooldown logic to prevent spam."""
-from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional
+from typing import Optional
 
 from sqlalchemy import text
 
 from src.infrastructure.database.postgres_client import postgres_client
 
+# Constant statement text (NULL means "no filter") so the plan can be cached.
+_COOLDOWN_SQL = text("""
+    SELECT COUNT(*) FROM alerts
+    WHERE rule_id = :rule_id
+      AND created_at > now() - make_interval(mins => :cooldown_minutes)
+      AND status != 'dismissed'
+      AND (CAST(:business_id AS text) IS NULL OR business_id = :business_id)
+      AND (CAST(:entity_id AS text) IS NULL OR entity_id = :entity_id)
+""")
+
 
 def check_cooldown(
     rule_id: str,
@@ -21,27 +30,16 @@ def check_cooldown(
     if cooldown_minutes <= 0:
         return False
 
-    cutoff = datetime.now(timezone.utc) - timedelta(minutes=cooldown_minutes)
-
     # Check for recent alert of same rule for same entity
-    conditions = ["rule_id = :rule_id", "created_at > :cutoff", "status != 'dismissed'"]
-    params = {"rule_id": rule_id, "cutoff": cutoff}
-
-    if business_id:
-        conditions.append("business_id = :business_id")
-        params["business_id"] = business_id
-    if entity_id:
-        conditions.append("entity_id = :entity_id")
-        params["entity_id"] = entity_id
+    params = {
+        "rule_id": rule_id,
+        "cooldown_minutes": cooldown_minutes,
+        "business_id": business_id or None,
+        "entity_id": entity_id or None,
+    }
 
     with postgres_client.get_session() as s:
-        r = s.execute(
-            text(f"""
-            SELECT COUNT(*) FROM alerts
-            WHERE {' AND '.join(conditions)}
-            """),
-            params,
-        )
+        r = s.execute(_COOLDOWN_SQL, params)
         count = r.fetchone()[0]
 
     return count > 0
@@ -1,20 +1,31 @@
 """Alert engine - rule evaluation and alert creation."""
+import os
+import time
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
 
+from src.infrastructure.database.neo4j_client import neo4j_client
 from src.infrastructure.logging import get_logger
 
 from .cooldown import check_cooldown
 from .models import Alert, AlertRule, AlertSeverity, AlertStatus, AlertType
-from .persistence import create_alert
-from .routing import route_alert
-from .rules import evaluate_condition, get_default_rules
+from .persistence import create_alert, create_alerts_bulk, list_pending_route_alerts, mark_alert_routed
+from .routing import alert_router, route_alert
+from .rules import compile_condition, get_default_rules
 
 logger = get_logger(__name__)
 
 # In-memory rule store (could be moved to DB later)
 _rules: Dict[str, AlertRule] = {}
+# IDs of enabled rules; rebuilt whenever _rules changes so evaluation can bail
+# out before touching the rule model.
+_enabled_rule_ids: FrozenSet[str] = frozenset()
+# Rule conditions compiled to predicates when rules are loaded.
+_compiled_conditions: Dict[str, Callable[[Dict[str, Any]], bool]] = {}
+# JSON-ready routing config per rule, dumped once when rules are loaded since
+# routing is static; reused for every alert the rule fires.
+_routing_configs: Dict[str, Dict[str, Any]] = {}
 
 
 def initialize_rules() -> None:
@@ -22,9 +33,20 @@ def initialize_rules() -> None:
     global _rules
     for rule in get_default_rules():
         _rules[rule.id] = rule
+    _rebuild_rule_indexes()
     logger.info("Alert rules initialized", count=len(_rules))
 
 
+def _rebuild_rule_indexes() -> None:
+    """Refresh the enabled-rule set and compiled conditions from the rule store."""
+    global _enabled_rule_ids, _compiled_conditions, _routing_configs
+    _enabled_rule_ids = frozenset(rule_id for rule_id, rule in _rules.items() if rule.enabled)
+    _compiled_conditions = {rule_id: compile_condition(rule.condition) for rule_id, rule in _rules.items()}
+    _routing_configs = {
+        rule_id: rule.model_dump(mode="json", include={"routing"})["routing"] for rule_id, rule in _rules.items()
+    }
+
+
 def get_rule(rule_id: str) -> Optional[AlertRule]:
     """Get rule by ID."""
     return _rules.get(rule_id)
@@ -47,12 +69,12 @@ def evaluate_and_trigger(
 
     Returns Alert if triggered, None if condition not met or suppressed.
     """
-    rule = get_rule(rule_id)
-    if not rule or not rule.enabled:
+    if rule_id not in _enabled_rule_ids:
         return None
+    rule = _rules[rule_id]
 
     # Evaluate condition
-    if not evaluate_condition(rule.condition, data):
+    if not _compiled_conditions[rule_id](data):
         return None
 
     # Check cooldown
@@ -61,38 +83,145 @@ def evaluate_and_trigger(
         return None
 
     # Create alert
-    alert_id = str(uuid.uuid4())
-    message = _build_message(rule, data)
+    alert = _new_alert(rule, data, business_id, entity_type, entity_id)
+
+    # Persist
+    try:
+        create_alert(alert)
+    except Exception as e:
+        logger.exception("Failed to create alert", alert_id=alert.id, error=str(e))
+        return None
+
+    # Route
+    _route(alert, rule)
+
+    logger.info("Alert triggered", alert_id=alert.id, rule_id=rule_id, severity=rule.severity.value)
+    return alert
+
+
+def evaluate_cypher_rule(
+    rule_id: str,
+    query: str,
+    params: Optional[Dict[str, Any]] = None,
+) -> List[Alert]:
+    """
+    Evaluate a rule whose condition is computed inside Neo4j.
+
+    The query must return one row per triggering entity with a business_id
+    column plus whatever fields the alert message uses; rows that do not meet
+    the condition should already be filtered out by the query. Each row
+    becomes an alert (subject to cooldown) and all alerts are inserted in
+    a single batch.
+    """
+    if rule_id not in _enabled_rule_ids:
+        return []
+    rule = _rules[rule_id]
+
+    rows = neo4j_client.execute_cypher(query, params or {}, skip_tenant_filter=True)
+    alerts: List[Alert] = []
+    for row in rows:
+        business_id = row.get("business_id")
+        if check_cooldown(rule_id, business_id, None, rule.cooldown_minutes):
+            continue
+        alerts.append(_new_alert(rule, dict(row), business_id))
+
+    try:
+        create_alerts_bulk(alerts)
+    except Exception as e:
+        logger.exception("Failed to create alerts", rule_id=rule_id, count=len(alerts), error=str(e))
+        return []
+
+    for alert in alerts:
+        _route(alert, rule)
+    logger.info("Cypher rule evaluated", rule_id=rule_id, triggered=len(alerts))
+    return alerts
+
 
-    alert = Alert(
-        id=alert_id,
-        rule_id=rule_id,
+def _new_alert(
+    rule: AlertRule,
+    data: Dict[str, Any],
+    business_id: Optional[str] = None,
+    entity_type: Optional[str] = None,
+    entity_id: Optional[str] = None,
+) -> Alert:
+    """
+    Build a pending alert for a rule that fired.
+
+    created_at is provisional; persistence replaces it with the database
+    timestamp when the alert is inserted.
+    """
+    return Alert(
+        id=str(_uuid7()),
+        rule_id=rule.id,
         alert_type=rule.alert_type,
         severity=rule.severity,
         status=AlertStatus.PENDING,
         business_id=business_id,
         entity_type=entity_type,
         entity_id=entity_id,
-        message=message,
+        message=_build_message(rule, data),
         details=data,
         created_at=datetime.now(timezone.utc),
     )
 
-    # Persist
+
+def _route(alert: Alert, rule: AlertRule) -> None:
+    """
+    Route a persisted alert to the rule's channels.
+
+    Routing is handed to the background router when it is running so the
+    caller does not block on email/Slack/webhook I/O. The alert stays
+    pending_route in the table until every channel has taken it.
+    """
+    payload = alert.model_dump(mode="json")
+    routing = _routing_configs.get(rule.id, rule.routing)
+    if alert_router.enqueue(payload, routing):
+        return
     try:
-        create_alert(alert)
+        if route_alert(payload, routing):
+            mark_alert_routed(alert.id)
     except Exception as e:
-        logger.exception("Failed to create alert", alert_id=alert_id, error=str(e))
-        return None
+        logger.exception("Failed to route alert", alert_id=alert.id, error=str(e))
 
-    # Route
+
+def redrive_pending_routes() -> int:
+    """
+    Re-route alerts left pending_route, e.g. queued when the process stopped.
+
+    Call at startup after the router is started. Returns the number of alerts
+    re-routed.
+    """
     try:
-        route_alert(alert.model_dump(mode="json"), rule.routing)
+        pending = list_pending_route_alerts()
     except Exception as e:
-        logger.exception("Failed to route alert", alert_id=alert_id, error=str(e))
+        logger.exception("Failed to load alerts pending routing", error=str(e))
+        return 0
+    count = 0
+    for alert in pending:
+        rule = _rules.get(alert.rule_id)
+        if rule is None:
+            logger.warning("Pending alert has no rule; not re-routed", alert_id=alert.id, rule_id=alert.rule_id)
+            continue
+        _route(alert, rule)
+        count += 1
+    if count:
+        logger.info("Re-routed pending alerts", count=count)
+    return count
+
+
+def _uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562).
 
-    logger.info("Alert triggered", alert_id=alert_id, rule_id=rule_id, severity=rule.severity.value)
-    return alert
+    The leading 48 bits are the Unix timestamp in milliseconds, so new alert IDs
+    append to the right edge of the primary-key index instead of landing on
+    random pages like uuid4.
+    """
+    value = (time.time_ns() // 1_000_000) << 80
+    value |= int.from_bytes(os.urandom(10), "big") & ((1 << 80) - 1)
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
 
 
 def _build_message(rule: AlertRule, data: Dict[str, Any]) -> str:
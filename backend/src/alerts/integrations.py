@@ -1,7 +1,44 @@
 """Integration hooks for triggering alerts from other systems."""
-from typing import Optional
+from typing import List, Optional
 
-from src.alerts.engine import evaluate_and_trigger
+from src.alerts.engine import evaluate_and_trigger, evaluate_cypher_rule, get_rule
+from src.infrastructure.logging import get_logger
+from src.tenancy.context import get_current_tenant
+
+logger = get_logger(__name__)
+
+# Transaction.type values that move money into / out of the business, as
+# written by the ingestion graph writer (payment_in/payment_out) and read by
+# the cash flow calculator (inflow/outflow).
+_INFLOW_TYPES = ["payment_in", "inflow"]
+_OUTFLOW_TYPES = ["payment_out", "outflow"]
+
+# Net each month in the trailing window, then count the run of consecutive
+# negative months ending at the latest month with activity (a non-negative or
+# missing month ends the run). Only businesses at or above the threshold come
+# back, so non-triggering series never leave the database. Uses the same
+# Transaction properties as the ingestion writer and the cash flow calculator
+# (t.type, and t.date stored as an ISO date). The query runs without the
+# tenant rewriter, so it carries its own tenant predicate.
+_NEGATIVE_CASHFLOW_QUERY = """
+MATCH (b:Business)-[:INVOLVES]-(t:Transaction)
+WHERE b.tenant_id = $tenant_id AND t.tenant_id = $tenant_id
+WITH b, t, date(t.date) AS day
+WHERE day >= date() - duration({months: $months})
+WITH b, date.truncate('month', day) AS m,
+     sum(CASE WHEN t.type IN $inflow_types THEN t.amount
+              WHEN t.type IN $outflow_types THEN -t.amount
+              ELSE 0 END) AS net
+WITH b, m, net
+ORDER BY m DESC
+WITH b, collect({m: m, net: net}) AS months
+WITH b, size(months) AS n,
+     [i IN range(0, size(months) - 1)
+      WHERE months[i].net >= 0 OR months[i].m <> months[0].m - duration({months: i}) | i] AS breaks
+WITH b, coalesce(head(breaks), n) AS consecutive_negative_months
+WHERE consecutive_negative_months >= $threshold
+RETURN b.id AS business_id, consecutive_negative_months
+"""
 
 
 def check_risk_score_alert(business_id: str, risk_score: float) -> Optional[str]:
@@ -54,3 +91,35 @@ def check_supplier_concentration_alert(business_id: str, top_supplier_share: flo
         business_id=business_id,
     )
     return alert.id if alert else None
+
+
+def scan_all_businesses_for_cashflow(months: int = 6, tenant_id: Optional[str] = None) -> List[str]:
+    """
+    Scheduled entrypoint: evaluate the negative cashflow rule for every business of a tenant.
+
+    tenant_id defaults to the current tenant; without one nothing is scanned.
+    The monthly aggregation and threshold check run in Neo4j; only businesses
+    whose latest consecutive negative months reach the rule's threshold come
+    back. Returns the IDs of alerts created.
+    """
+    rule = get_rule("negative_cashflow")
+    if not rule:
+        return []
+    if tenant_id is None:
+        tenant = get_current_tenant()
+        if not tenant:
+            logger.warning("Cashflow scan skipped without tenant context")
+            return []
+        tenant_id = tenant.tenant_id
+    alerts = evaluate_cypher_rule(
+        "negative_cashflow",
+        _NEGATIVE_CASHFLOW_QUERY,
+        {
+            "tenant_id": tenant_id,
+            "months": months,
+            "threshold": rule.condition.get("value", 3),
+            "inflow_types": _INFLOW_TYPES,
+            "outflow_types": _OUTFLOW_TYPES,
+        },
+    )
+    return [a.id for a in alerts]
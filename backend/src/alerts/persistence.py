@@ -1,7 +1,7 @@
 """Alert persistence and history tracking."""
 import json
-from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
 from sqlalchemy import text
 
@@ -14,6 +14,28 @@ logger = get_logger(__name__)
 
 ALERTS_TABLE = "alerts"
 
+# routing_status tracks channel delivery separately from the workflow status:
+# alerts are inserted as pending_route and flipped to routed once delivered,
+# so alerts still queued when the process stops can be re-driven on startup.
+ROUTING_PENDING = "pending_route"
+ROUTING_DONE = "routed"
+
+# Optional filters are expressed as "(param IS NULL OR column = param)" so the
+# SQL text stays identical across filter combinations.
+_BUSINESS_FILTER = "(CAST(:business_id AS text) IS NULL OR business_id = :business_id)"
+
+_LIST_ALERTS_SQL = text(f"""
+    SELECT * FROM {ALERTS_TABLE}
+    WHERE {_BUSINESS_FILTER}
+      AND (CAST(:status AS text) IS NULL OR status = :status)
+      AND (CAST(:severity AS text) IS NULL OR severity = :severity)
+      AND (CAST(:alert_type AS text) IS NULL OR alert_type = :alert_type)
+      AND (CAST(:cursor_ts AS timestamptz) IS NULL
+           OR (created_at, id) < (CAST(:cursor_ts AS timestamptz), CAST(:cursor_id AS text)))
+    ORDER BY created_at DESC, id DESC
+    LIMIT :limit OFFSET :offset
+""")
+
 
 def ensure_alerts_table() -> None:
     """Create alerts table if it does not exist."""
@@ -33,44 +55,102 @@ def ensure_alerts_table() -> None:
         acknowledged_at TIMESTAMPTZ,
         acknowledged_by VARCHAR(255),
         resolved_at TIMESTAMPTZ,
-        resolved_by VARCHAR(255)
+        resolved_by VARCHAR(255),
+        routing_status VARCHAR(20) NOT NULL DEFAULT '{ROUTING_PENDING}'
     );
+    -- rows from before routing was tracked count as routed
+    ALTER TABLE {ALERTS_TABLE} ADD COLUMN IF NOT EXISTS routing_status VARCHAR(20) NOT NULL DEFAULT '{ROUTING_DONE}';
+    ALTER TABLE {ALERTS_TABLE} ALTER COLUMN routing_status SET DEFAULT '{ROUTING_PENDING}';
     CREATE INDEX IF NOT EXISTS idx_alerts_business_id ON {ALERTS_TABLE}(business_id);
     CREATE INDEX IF NOT EXISTS idx_alerts_created_at ON {ALERTS_TABLE}(created_at);
     CREATE INDEX IF NOT EXISTS idx_alerts_status ON {ALERTS_TABLE}(status);
     CREATE INDEX IF NOT EXISTS idx_alerts_rule_id ON {ALERTS_TABLE}(rule_id);
+    CREATE INDEX IF NOT EXISTS idx_alerts_business_created_id ON {ALERTS_TABLE}(business_id, created_at DESC, id DESC);
+    CREATE INDEX IF NOT EXISTS idx_alerts_pending_route ON {ALERTS_TABLE}(created_at) WHERE routing_status = '{ROUTING_PENDING}';
     """
     with postgres_client.get_session() as s:
         for stmt in (x.strip() for x in sql.split(";") if x.strip()):
             s.execute(text(stmt))
 
 
+# created_at is left to the column default (now()) so the database clock is
+# the single source of truth for alert timestamps.
+_INSERT_ALERT = f"""
+    INSERT INTO {ALERTS_TABLE}
+    (id, rule_id, alert_type, severity, status, business_id, entity_type, entity_id,
+     message, details)
+    VALUES
+    (:id, :rule_id, :alert_type, :severity, :status, :business_id, :entity_type, :entity_id,
+     :message, CAST(:details AS jsonb))
+"""
+_INSERT_ALERT_SQL = text(_INSERT_ALERT)
+_INSERT_ALERT_RETURNING_SQL = text(_INSERT_ALERT + " RETURNING created_at")
+
+
 def create_alert(alert: Alert) -> None:
-    """Create a new alert."""
+    """Create a new alert; alert.created_at is set to the stored timestamp."""
+    with postgres_client.get_session() as s:
+        r = s.execute(_INSERT_ALERT_RETURNING_SQL, _alert_params(alert))
+        alert.created_at = r.scalar_one()
+
+
+def create_alerts_bulk(alerts: List[Alert]) -> None:
+    """Create several alerts in one transaction using a single executemany."""
+    if not alerts:
+        return
+    with postgres_client.get_session() as s:
+        s.execute(_INSERT_ALERT_SQL, [_alert_params(a) for a in alerts])
+        # now() is fixed for the transaction, so it equals every row's default.
+        created_at = s.execute(text("SELECT now()")).scalar_one()
+    for alert in alerts:
+        alert.created_at = created_at
+
+
+def _alert_params(alert: Alert) -> Dict:
+    """Bind parameters for inserting an alert."""
+    return {
+        "id": alert.id,
+        "rule_id": alert.rule_id,
+        "alert_type": alert.alert_type.value,
+        "severity": alert.severity.value,
+        "status": alert.status.value,
+        "business_id": alert.business_id,
+        "entity_type": alert.entity_type,
+        "entity_id": alert.entity_id,
+        "message": alert.message,
+        "details": json.dumps(alert.details),
+    }
+
+
+def mark_alert_routed(alert_id: str) -> None:
+    """Record that an alert has been handed to all of its channels."""
     with postgres_client.get_session() as s:
         s.execute(
+            text(f"UPDATE {ALERTS_TABLE} SET routing_status = :routed WHERE id = :alert_id"),
+            {"alert_id": alert_id, "routed": ROUTING_DONE},
+        )
+
+
+def list_pending_route_alerts(min_age_seconds: int = 60, limit: int = 1000) -> List[Alert]:
+    """
+    List alerts still waiting to be routed, oldest first.
+
+    Alerts younger than min_age_seconds are skipped so alerts another process
+    has only just queued are not routed twice.
+    """
+    with postgres_client.get_session() as s:
+        r = s.execute(
             text(f"""
-            INSERT INTO {ALERTS_TABLE}
-            (id, rule_id, alert_type, severity, status, business_id, entity_type, entity_id,
-             message, details, created_at)
-            VALUES
-            (:id, :rule_id, :alert_type, :severity, :status, :business_id, :entity_type, :entity_id,
-             :message, CAST(:details AS jsonb), :created_at)
+            SELECT * FROM {ALERTS_TABLE}
+            WHERE routing_status = :pending
+              AND created_at < now() - make_interval(secs => :min_age)
+            ORDER BY created_at
+            LIMIT :limit
             """),
-            {
-                "id": alert.id,
-                "rule_id": alert.rule_id,
-                "alert_type": alert.alert_type.value,
-                "severity": alert.severity.value,
-                "status": alert.status.value,
-                "business_id": alert.business_id,
-                "entity_type": alert.entity_type,
-                "entity_id": alert.entity_id,
-                "message": alert.message,
-                "details": json.dumps(alert.details),
-                "created_at": alert.created_at,
-            },
+            {"pending": ROUTING_PENDING, "min_age": min_age_seconds, "limit": limit},
         )
+        rows = r.fetchall()
+    return [_row_to_alert(dict(row._mapping)) for row in rows]
 
 
 def acknowledge_alert(alert_id: str, user_id: str) -> Optional[Alert]:
@@ -79,10 +159,10 @@ def acknowledge_alert(alert_id: str, user_id: str) -> Optional[Alert]:
         s.execute(
             text(f"""
             UPDATE {ALERTS_TABLE}
-            SET status = 'acknowledged', acknowledged_at = :now, acknowledged_by = :user_id
+            SET status = 'acknowledged', acknowledged_at = now(), acknowledged_by = :user_id
             WHERE id = :alert_id AND status = 'pending'
             """),
-            {"alert_id": alert_id, "user_id": user_id, "now": datetime.now(timezone.utc)},
+            {"alert_id": alert_id, "user_id": user_id},
         )
     return get_alert(alert_id)
 
@@ -93,10 +173,10 @@ def resolve_alert(alert_id: str, user_id: str) -> Optional[Alert]:
         s.execute(
             text(f"""
             UPDATE {ALERTS_TABLE}
-            SET status = 'resolved', resolved_at = :now, resolved_by = :user_id
+            SET status = 'resolved', resolved_at = now(), resolved_by = :user_id
             WHERE id = :alert_id
             """),
-            {"alert_id": alert_id, "user_id": user_id, "now": datetime.now(timezone.utc)},
+            {"alert_id": alert_id, "user_id": user_id},
         )
     return get_alert(alert_id)
 
@@ -121,50 +201,55 @@ def list_alerts(
     alert_type: Optional[AlertType] = None,
     limit: int = 100,
     offset: int = 0,
+    cursor: Optional[Tuple[datetime, str]] = None,
 ) -> List[Alert]:
-    """List alerts with filters."""
-    conditions = ["1=1"]
-    params = {"limit": limit, "offset": offset}
-
-    if business_id:
-        conditions.append("business_id = :business_id")
-        params["business_id"] = business_id
-    if status:
-        conditions.append("status = :status")
-        params["status"] = status.value
-    if severity:
-        conditions.append("severity = :severity")
-        params["severity"] = severity.value
-    if alert_type:
-        conditions.append("alert_type = :alert_type")
-        params["alert_type"] = alert_type.value
+    """List alerts with filters.
+
+    The statement text is constant for every filter combination (unused
+    filters are passed as NULL) so Postgres can reuse a cached plan.
+
+    cursor: (created_at, id) of the last alert on the previous page. When
+    given, the page is located by an index range scan instead of OFFSET.
+    """
+    cursor_ts, cursor_id = cursor if cursor else (None, None)
+    params = {
+        "business_id": business_id or None,
+        "status": status.value if status else None,
+        "severity": severity.value if severity else None,
+        "alert_type": alert_type.value if alert_type else None,
+        "cursor_ts": cursor_ts,
+        "cursor_id": cursor_id,
+        "limit": limit,
+        "offset": 0 if cursor else offset,
+    }
 
     with postgres_client.get_session() as s:
-        r = s.execute(
-            text(f"""
-            SELECT * FROM {ALERTS_TABLE}
-            WHERE {' AND '.join(conditions)}
-            ORDER BY created_at DESC
-            LIMIT :limit OFFSET :offset
-            """),
-            params,
-        )
+        r = s.execute(_LIST_ALERTS_SQL, params)
         rows = r.fetchall()
     return [_row_to_alert(dict(row._mapping)) for row in rows]
 
 
+def encode_cursor(alert: Alert) -> str:
+    """Build an opaque keyset cursor pointing just past the given alert."""
+    return f"{alert.created_at.isoformat()}|{alert.id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Parse a cursor produced by encode_cursor."""
+    ts, sep, alert_id = cursor.partition("|")
+    if not sep or not alert_id:
+        raise ValueError("invalid cursor")
+    return datetime.fromisoformat(ts), alert_id
+
+
 def get_alert_metrics(business_id: Optional[str] = None) -> AlertMetrics:
     """Get alert statistics."""
-    conditions = ["1=1"]
-    params = {}
-    if business_id:
-        conditions.append("business_id = :business_id")
-        params["business_id"] = business_id
+    params = {"business_id": business_id or None}
 
     with postgres_client.get_session() as s:
         # Total count
         r = s.execute(
-            text(f"SELECT COUNT(*) FROM {ALERTS_TABLE} WHERE {' AND '.join(conditions)}"),
+            text(f"SELECT COUNT(*) FROM {ALERTS_TABLE} WHERE {_BUSINESS_FILTER}"),
             params,
         )
         total = r.fetchone()[0]
@@ -174,7 +259,7 @@ def get_alert_metrics(business_id: Optional[str] = None) -> AlertMetrics:
             text(f"""
             SELECT severity, COUNT(*) as cnt
             FROM {ALERTS_TABLE}
-            WHERE {' AND '.join(conditions)}
+            WHERE {_BUSINESS_FILTER}
             GROUP BY severity
             """),
             params,
@@ -186,7 +271,7 @@ def get_alert_metrics(business_id: Optional[str] = None) -> AlertMetrics:
             text(f"""
             SELECT alert_type, COUNT(*) as cnt
             FROM {ALERTS_TABLE}
-            WHERE {' AND '.join(conditions)}
+            WHERE {_BUSINESS_FILTER}
             GROUP BY alert_type
             """),
             params,
@@ -198,7 +283,7 @@ def get_alert_metrics(business_id: Optional[str] = None) -> AlertMetrics:
             text(f"""
             SELECT status, COUNT(*) as cnt
             FROM {ALERTS_TABLE}
-            WHERE {' AND '.join(conditions)}
+            WHERE {_BUSINESS_FILTER}
             GROUP BY status
             """),
             params,
@@ -209,7 +294,7 @@ def get_alert_metrics(business_id: Optional[str] = None) -> AlertMetrics:
         r = s.execute(
             text(f"""
             SELECT COUNT(*) FROM {ALERTS_TABLE}
-            WHERE {' AND '.join(conditions)} AND status = 'pending'
+            WHERE {_BUSINESS_FILTER} AND status = 'pending'
             """),
             params,
         )
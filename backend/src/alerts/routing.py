@@ -1,12 +1,62 @@
 """Alert routing to email, Slack, webhooks."""
-from typing import Any, Dict, Optional
+import json
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+import httpx
+
+from src.infrastructure.cache.redis_client import redis_client
 from src.infrastructure.logging import get_logger
 
+from .persistence import mark_alert_routed
+
 logger = get_logger(__name__)
 
+# Redis pub/sub channels carrying {"alert": ..., "routing": ...} messages to
+# the delivery workers (see src.alerts.worker), one channel per delivery
+# channel so the publisher can tell which channels have a live worker.
+ALERTS_CHANNEL_PREFIX = "alerts."
+
+
+def alerts_channel(channel: str) -> str:
+    """Pub/sub channel the worker for a delivery channel subscribes to."""
+    return ALERTS_CHANNEL_PREFIX + channel
+
+# Shared HTTP client for Slack/webhook delivery: keep-alive connections are
+# reused across alerts instead of paying a TCP/TLS handshake per POST.
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    timeout=5.0,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+                )
+    return _http_client
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
 
-def route_alert(alert: Dict[str, Any], routing_config: Dict[str, Any]) -> None:
+
+def route_alert(
+    alert: Dict[str, Any],
+    routing_config: Dict[str, Any],
+    channels: Optional[Iterable[str]] = None,
+) -> bool:
     """
     Route alert to configured channels (email, Slack, webhook).
 
@@ -15,15 +65,72 @@ def route_alert(alert: Dict[str, Any], routing_config: Dict[str, Any]) -> None:
         "slack": {"enabled": true, "webhook_url": "https://..."},
         "webhook": {"enabled": true, "url": "https://...", "headers": {...}}
     }
+    channels: restrict delivery to these channels (default: all)
+
+    Returns True if every channel delivered.
+    """
+    # One attempt per channel; a failing channel does not stop the others.
+    delivered = True
+    for channel in CHANNEL_SENDERS if channels is None else channels:
+        delivered = deliver(channel, alert, routing_config, retries=1) and delivered
+    return delivered
+
+
+def publish_alert(alert: Dict[str, Any], routing_config: Dict[str, Any]) -> List[str]:
     """
-    if routing_config.get("email", {}).get("enabled"):
-        _send_email(alert, routing_config.get("email", {}))
+    Publish alert to the worker of each enabled channel.
 
-    if routing_config.get("slack", {}).get("enabled"):
-        _send_slack(alert, routing_config.get("slack", {}))
+    Returns the enabled channels no worker received it on (Redis unavailable
+    or no worker subscribed); the caller should deliver those inline.
+    """
+    enabled = [c for c in CHANNEL_SENDERS if routing_config.get(c, {}).get("enabled")]
+    try:
+        message = json.dumps({"alert": alert, "routing": routing_config}, default=str)
+    except Exception as e:
+        logger.warning("Failed to publish alert", alert_id=alert.get("id"), error=str(e))
+        return enabled
+    undelivered = []
+    for channel in enabled:
+        try:
+            if redis_client.publish(alerts_channel(channel), message) > 0:
+                continue
+        except Exception as e:
+            logger.warning("Failed to publish alert", alert_id=alert.get("id"), channel=channel, error=str(e))
+        undelivered.append(channel)
+    return undelivered
+
+
+def deliver(
+    channel: str,
+    alert: Dict[str, Any],
+    routing_config: Dict[str, Any],
+    retries: int = 3,
+    backoff_seconds: float = 1.0,
+) -> bool:
+    """
+    Deliver alert on a single channel if it is enabled, retrying on failure.
 
-    if routing_config.get("webhook", {}).get("enabled"):
-        _send_webhook(alert, routing_config.get("webhook", {}))
+    Returns True if delivered or the channel is disabled.
+    """
+    config = routing_config.get(channel, {})
+    if not config.get("enabled"):
+        return True
+    sender = CHANNEL_SENDERS[channel]
+    for attempt in range(1, retries + 1):
+        try:
+            sender(alert, config)
+            return True
+        except Exception as e:
+            logger.warning(
+                "Alert delivery failed",
+                channel=channel,
+                alert_id=alert.get("id"),
+                attempt=attempt,
+                error=str(e),
+            )
+            if attempt < retries:
+                time.sleep(backoff_seconds * attempt)
+    return False
 
 
 def _send_email(alert: Dict[str, Any], config: Dict[str, Any]) -> None:
@@ -36,19 +143,105 @@ def _send_email(alert: Dict[str, Any], config: Dict[str, Any]) -> None:
 
 
 def _send_slack(alert: Dict[str, Any], config: Dict[str, Any]) -> None:
-    """Send alert to Slack webhook (stub - integrate with requests)."""
+    """Send alert to Slack incoming webhook."""
     webhook_url = config.get("webhook_url")
     if not webhook_url:
         return
-    # TODO: POST to Slack webhook
+    text = alert.get("message") or f"Alert {alert.get('id')}"
+    response = _get_http_client().post(webhook_url, json={"text": text})
+    response.raise_for_status()
     logger.info("Slack alert sent", alert_id=alert.get("id"), webhook_url=webhook_url[:50])
 
 
 def _send_webhook(alert: Dict[str, Any], config: Dict[str, Any]) -> None:
-    """Send alert to custom webhook (stub - integrate with requests)."""
+    """Send alert to custom webhook."""
     url = config.get("url")
     if not url:
         return
     headers = config.get("headers", {})
-    # TODO: POST to webhook URL
+    response = _get_http_client().post(url, json=alert, headers=headers)
+    response.raise_for_status()
     logger.info("Webhook alert sent", alert_id=alert.get("id"), url=url[:50])
+
+
+CHANNEL_SENDERS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], None]] = {
+    "email": _send_email,
+    "slack": _send_slack,
+    "webhook": _send_webhook,
+}
+
+
+class AlertRouter:
+    """
+    Routes alerts on a background thread so callers do not wait on channel I/O.
+
+    Alerts are published to Redis for the per-channel workers; the thread
+    delivers on any enabled channel that has no worker listening. Alerts are
+    marked routed once handed off; ones lost with the queue on a restart stay
+    pending_route in the alerts table and are re-driven at startup.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        """
+        Initialize alert router.
+
+        Args:
+            maxsize: Maximum number of alerts waiting to be routed
+        """
+        self._queue: "queue.Queue[Optional[Tuple[Dict[str, Any], Dict[str, Any]]]]" = queue.Queue(maxsize)
+        self.running = False
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the routing worker."""
+        if self.running:
+            return
+
+        self.running = True
+        self.thread = threading.Thread(target=self._route_loop, daemon=True)
+        self.thread.start()
+        logger.info("Alert router started")
+
+    def stop(self):
+        """Stop the routing worker after draining queued alerts."""
+        if not self.running:
+            return
+        self.running = False
+        self._queue.put(None)
+        if self.thread:
+            self.thread.join(timeout=5)
+        close_http_client()
+        logger.info("Alert router stopped")
+
+    def enqueue(self, alert: Dict[str, Any], routing_config: Dict[str, Any]) -> bool:
+        """
+        Queue an alert for routing.
+
+        Returns False when the worker is not running or the queue is full; the
+        caller should then route inline.
+        """
+        if not self.running:
+            return False
+        try:
+            self._queue.put_nowait((alert, routing_config))
+        except queue.Full:
+            logger.warning("Alert routing queue full", alert_id=alert.get("id"))
+            return False
+        return True
+
+    def _route_loop(self):
+        """Main routing loop."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            alert, routing_config = item
+            try:
+                if route_alert(alert, routing_config, publish_alert(alert, routing_config)):
+                    mark_alert_routed(alert["id"])
+            except Exception as e:
+                logger.exception("Failed to route alert", alert_id=alert.get("id"), error=str(e))
+
+
+# Global router instance
+alert_router = AlertRouter()
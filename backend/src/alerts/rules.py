@@ -1,53 +1,74 @@
 """Alert rule definitions and condition evaluation."""
-from typing import Any, Dict, List
+import operator
+from typing import Any, Callable, Dict, List, Tuple
 
 from src.alerts.models import AlertRule, AlertSeverity, AlertType
 
+# Built once at import; AlertRule validation is not re-run per call.
+_DEFAULT_RULES: Tuple[AlertRule, ...] = (
+    AlertRule(
+        id="high_risk_score",
+        name="High Risk Score",
+        alert_type=AlertType.HIGH_RISK_SCORE,
+        condition={"field": "risk_score", "operator": ">", "value": 80},
+        severity=AlertSeverity.HIGH,
+        cooldown_minutes=1440,  # 24 hours
+    ),
+    AlertRule(
+        id="payment_default",
+        name="Payment Default",
+        alert_type=AlertType.PAYMENT_DEFAULT,
+        condition={"field": "days_overdue", "operator": ">=", "value": 60},
+        severity=AlertSeverity.CRITICAL,
+        cooldown_minutes=1440,
+    ),
+    AlertRule(
+        id="fraud_pattern",
+        name="Fraud Pattern Detected",
+        alert_type=AlertType.FRAUD_PATTERN,
+        condition={"field": "fraud_score", "operator": ">", "value": 50},
+        severity=AlertSeverity.CRITICAL,
+        cooldown_minutes=60,
+    ),
+    AlertRule(
+        id="negative_cashflow",
+        name="Negative Cash Flow",
+        alert_type=AlertType.NEGATIVE_CASHFLOW,
+        condition={"field": "consecutive_negative_months", "operator": ">=", "value": 3},
+        severity=AlertSeverity.HIGH,
+        cooldown_minutes=1440,
+    ),
+    AlertRule(
+        id="supplier_concentration",
+        name="Supplier Concentration Risk",
+        alert_type=AlertType.SUPPLIER_CONCENTRATION,
+        condition={"field": "top_supplier_share", "operator": ">", "value": 0.5},
+        severity=AlertSeverity.MEDIUM,
+        cooldown_minutes=1440,
+    ),
+)
+
 
 def get_default_rules() -> List[AlertRule]:
     """Return predefined alert rules."""
-    return [
-        AlertRule(
-            id="high_risk_score",
-            name="High Risk Score",
-            alert_type=AlertType.HIGH_RISK_SCORE,
-            condition={"field": "risk_score", "operator": ">", "value": 80},
-            severity=AlertSeverity.HIGH,
-            cooldown_minutes=1440,  # 24 hours
-        ),
-        AlertRule(
-            id="payment_default",
-            name="Payment Default",
-            alert_type=AlertType.PAYMENT_DEFAULT,
-            condition={"field": "days_overdue", "operator": ">=", "value": 60},
-            severity=AlertSeverity.CRITICAL,
-            cooldown_minutes=1440,
-        ),
-        AlertRule(
-            id="fraud_pattern",
-            name="Fraud Pattern Detected",
-            alert_type=AlertType.FRAUD_PATTERN,
-            condition={"field": "fraud_score", "operator": ">", "value": 50},
-            severity=AlertSeverity.CRITICAL,
-            cooldown_minutes=60,
-        ),
-        AlertRule(
-            id="negative_cashflow",
-            name="Negative Cash Flow",
-            alert_type=AlertType.NEGATIVE_CASHFLOW,
-            condition={"field": "consecutive_negative_months", "operator": ">=", "value": 3},
-            severity=AlertSeverity.HIGH,
-            cooldown_minutes=1440,
-        ),
-        AlertRule(
-            id="supplier_concentration",
-            name="Supplier Concentration Risk",
-            alert_type=AlertType.SUPPLIER_CONCENTRATION,
-            condition={"field": "top_supplier_share", "operator": ">", "value": 0.5},
-            severity=AlertSeverity.MEDIUM,
-            cooldown_minutes=1440,
-        ),
-    ]
+    return list(_DEFAULT_RULES)
+
+
+# Ordering operators compare numerically (operands coerced to float).
+_NUMERIC_OPS: Dict[str, Callable[[Any, Any], bool]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+# Remaining operators compare the raw values.
+_OPS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "in": lambda value, threshold: value in threshold,
+    "contains": lambda value, threshold: threshold in str(value),
+}
 
 
 def evaluate_condition(condition: Dict[str, Any], data: Dict[str, Any]) -> bool:
@@ -58,29 +79,56 @@ def evaluate_condition(condition: Dict[str, Any], data: Dict[str, Any]) -> bool:
     data: {"risk_score": 85, "business_id": "b123"}
     """
     field = condition.get("field")
-    operator = condition.get("operator")
-    threshold = condition.get("value")
-
     if field not in data:
         return False
 
+    op = condition.get("operator")
     value = data[field]
+    threshold = condition.get("value")
 
-    if operator == ">":
-        return float(value) > float(threshold)
-    elif operator == ">=":
-        return float(value) >= float(threshold)
-    elif operator == "<":
-        return float(value) < float(threshold)
-    elif operator == "<=":
-        return float(value) <= float(threshold)
-    elif operator == "==":
-        return value == threshold
-    elif operator == "!=":
-        return value != threshold
-    elif operator == "in":
-        return value in threshold
-    elif operator == "contains":
-        return threshold in str(value)
-    else:
+    fn = _NUMERIC_OPS.get(op)
+    if fn is not None:
+        if not (isinstance(value, (int, float)) and isinstance(threshold, (int, float))):
+            value, threshold = float(value), float(threshold)
+        return fn(value, threshold)
+
+    fn = _OPS.get(op)
+    if fn is None:
         return False
+    return fn(value, threshold)
+
+
+def compile_condition(condition: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Compile an alert condition into a predicate over data.
+
+    Equivalent to evaluate_condition, but the field, operator and threshold are
+    resolved once (numeric thresholds are coerced to float up front) instead of
+    on every evaluation.
+    """
+    field = condition.get("field")
+    op = condition.get("operator")
+    threshold = condition.get("value")
+
+    fn = _NUMERIC_OPS.get(op)
+    if fn is not None:
+        limit = float(threshold)
+
+        def check(value: Any) -> bool:
+            if not isinstance(value, (int, float)):
+                value = float(value)
+            return fn(value, limit)
+    else:
+        fn = _OPS.get(op)
+        if fn is None:
+            return lambda data: False
+
+        def check(value: Any) -> bool:
+            return fn(value, threshold)
+
+    def predicate(data: Dict[str, Any]) -> bool:
+        if field not in data:
+            return False
+        return check(data[field])
+
+    return predicate
@@ -0,0 +1,56 @@
+"""
+Alert delivery worker.
+
+Subscribes to the pub/sub channel of one delivery channel (email, slack or
+webhook) and delivers the alerts published there, so a slow or failing
+channel does not hold up the others. Run one process per channel:
+
+    python -m src.alerts.worker email
+"""
+import json
+import sys
+
+from src.infrastructure.cache.redis_client import redis_client
+from src.infrastructure.logging import get_logger
+
+from .routing import CHANNEL_SENDERS, alerts_channel, close_http_client, deliver
+
+logger = get_logger(__name__)
+
+
+def run_worker(channel: str) -> None:
+    """Consume published alerts and deliver those enabled for channel."""
+    if channel not in CHANNEL_SENDERS:
+        raise ValueError(f"Unknown alert channel: {channel}")
+
+    pubsub = redis_client.client.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(alerts_channel(channel))
+    logger.info("Alert worker started", channel=channel)
+    try:
+        for message in pubsub.listen():
+            try:
+                payload = json.loads(message["data"])
+            except (TypeError, ValueError) as e:
+                logger.warning("Discarding malformed alert message", error=str(e))
+                continue
+            alert = payload.get("alert", {})
+            if not deliver(channel, alert, payload.get("routing", {})):
+                logger.error("Alert delivery gave up", channel=channel, alert_id=alert.get("id"))
+    finally:
+        pubsub.close()
+        close_http_client()
+
+
+def _main() -> None:
+    if len(sys.argv) != 2:
+        print(f"usage: python -m src.alerts.worker {{{'|'.join(CHANNEL_SENDERS)}}}")
+        sys.exit(2)
+    redis_client.connect()
+    try:
+        run_worker(sys.argv[1])
+    finally:
+        redis_client.close()
+
+
+if __name__ == "__main__":
+    _main()
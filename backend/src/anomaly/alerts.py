@@ -1,6 +1,9 @@
 """Anomaly alert management."""
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import text
 
 from src.infrastructure.database.postgres_client import postgres_client
 from src.anomaly.models import AnomalyAlert
@@ -8,122 +11,144 @@ from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+MIGRATION_FILE = (
+    Path(__file__).resolve().parents[1]
+    / "infrastructure" / "database" / "migrations" / "002_create_anomaly_alerts.sql"
+)
+
+
+def ensure_anomaly_alerts_table() -> None:
+    """
+    Create the anomaly_alerts table and indexes (002_create_anomaly_alerts.sql).
 
-def ensure_alerts_table():
-    """Create table for storing anomaly alerts."""
-    query = """
-    CREATE TABLE IF NOT EXISTS anomaly_alerts (
-        id VARCHAR(255) PRIMARY KEY,
-        entity_id VARCHAR(255) NOT NULL,
-        entity_type VARCHAR(50) NOT NULL,
-        anomaly_score FLOAT NOT NULL,
-        severity VARCHAR(20) NOT NULL,
-        description TEXT NOT NULL,
-        detected_at TIMESTAMP NOT NULL,
-        acknowledged BOOLEAN DEFAULT FALSE,
-        acknowledged_at TIMESTAMP,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    );
-    CREATE INDEX IF NOT EXISTS idx_anomaly_alerts_entity ON anomaly_alerts(entity_id);
-    CREATE INDEX IF NOT EXISTS idx_anomaly_alerts_severity ON anomaly_alerts(severity);
-    CREATE INDEX IF NOT EXISTS idx_anomaly_alerts_acknowledged ON anomaly_alerts(acknowledged);
+    Called once at application startup; statements are issued one at a time.
     """
-    postgres_client.execute_query(query)
+    with postgres_client.get_session() as s:
+        for stmt in (x.strip() for x in MIGRATION_FILE.read_text().split(";")):
+            lines = [ln for ln in stmt.splitlines() if not ln.strip().startswith("--")]
+            if any(ln.strip() for ln in lines):
+                s.execute(text("\n".join(lines)))
 
 
 def save_alert(alert: AnomalyAlert) -> str:
     """Save an anomaly alert to database."""
-    ensure_alerts_table()
-
-    query = """
-    INSERT INTO anomaly_alerts 
-    (id, entity_id, entity_type, anomaly_score, severity, description, detected_at, acknowledged)
-    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-    ON CONFLICT (id) DO NOTHING
-    RETURNING id
-    """
-    rows = postgres_client.execute_query(
-        query,
-        (
-            alert.id,
-            alert.entity_id,
-            alert.entity_type,
-            alert.anomaly_score,
-            alert.severity,
-            alert.description,
-            alert.detected_at,
-            alert.acknowledged,
-        ),
-    )
-
-    if rows:
-        return rows[0]["id"]
+    save_alerts([alert])
     return alert.id
 
 
-def list_alerts(
-    entity_id: Optional[str] = None,
-    severity: Optional[str] = None,
-    acknowledged: Optional[bool] = None,
-    limit: int = 100,
-) -> List[AnomalyAlert]:
-    """List anomaly alerts with filters."""
-    ensure_alerts_table()
+# Rows per multi-row INSERT; keeps bind parameters well under PG's 65535 limit.
+_SAVE_BATCH_SIZE = 1000
 
-    conditions = []
-    params = []
 
-    if entity_id:
-        conditions.append("entity_id = $" + str(len(params) + 1))
-        params.append(entity_id)
+def save_alerts(alerts: List[AnomalyAlert]) -> List[str]:
+    """
+    Save many anomaly alerts using one multi-row INSERT per batch.
 
-    if severity:
-        conditions.append("severity = $" + str(len(params) + 1))
-        params.append(severity)
+    Returns the IDs of alerts that were newly inserted.
+    """
+    if not alerts:
+        return []
+    saved: List[str] = []
+    with postgres_client.get_session() as s:
+        for start in range(0, len(alerts), _SAVE_BATCH_SIZE):
+            values = []
+            params: Dict[str, Any] = {}
+            for i in range(start, min(start + _SAVE_BATCH_SIZE, len(alerts))):
+                alert = alerts[i]
+                values.append(
+                    f"(:id{i}, :entity_id{i}, :entity_type{i}, :anomaly_score{i}, :severity{i}, "
+                    f":description{i}, :detected_at{i}, :acknowledged{i})"
+                )
+                params.update({
+                    f"id{i}": alert.id,
+                    f"entity_id{i}": alert.entity_id,
+                    f"entity_type{i}": alert.entity_type,
+                    f"anomaly_score{i}": alert.anomaly_score,
+                    f"severity{i}": alert.severity,
+                    f"description{i}": alert.description,
+                    f"detected_at{i}": alert.detected_at,
+                    f"acknowledged{i}": alert.acknowledged,
+                })
+            r = s.execute(
+                text(f"""
+                INSERT INTO anomaly_alerts
+                (id, entity_id, entity_type, anomaly_score, severity, description, detected_at, acknowledged)
+                VALUES {", ".join(values)}
+                ON CONFLICT (id) DO NOTHING
+                RETURNING id
+                """),
+                params,
+            )
+            saved.extend(r.scalars().all())
 
-    if acknowledged is not None:
-        conditions.append("acknowledged = $" + str(len(params) + 1))
-        params.append(acknowledged)
+    return saved
 
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    params.append(limit)
 
-    query = f"""
+# Optional filters are passed as NULL when unused so the statement text is
+# the same for every filter combination.
+_LIST_ALERTS_SQL = text("""
     SELECT * FROM anomaly_alerts
-    WHERE {where_clause}
-    ORDER BY detected_at DESC
-    LIMIT ${len(params)}
+    WHERE (CAST(:entity_id AS text) IS NULL OR entity_id = :entity_id)
+      AND (CAST(:severity AS text) IS NULL OR severity = :severity)
+      AND (CAST(:acknowledged AS boolean) IS NULL OR acknowledged = :acknowledged)
+      AND (CAST(:before_ts AS timestamp) IS NULL
+           OR (detected_at, id) < (CAST(:before_ts AS timestamp), CAST(:before_id AS text)))
+    ORDER BY detected_at DESC, id DESC
+    LIMIT :limit
+""")
+
+
+def list_alerts(
+    entity_id: Optional[str] = None,
+    severity: Optional[str] = None,
+    acknowledged: Optional[bool] = None,
+    limit: int = 100,
+    before: Optional[Tuple[datetime, str]] = None,
+) -> List[AnomalyAlert]:
     """
-    rows = postgres_client.execute_query(query, tuple(params))
-
-    alerts = []
-    for row in rows:
-        alerts.append(
-            AnomalyAlert(
-                id=row["id"],
-                entity_id=row["entity_id"],
-                entity_type=row["entity_type"],
-                anomaly_score=float(row["anomaly_score"]),
-                severity=row["severity"],
-                description=row["description"],
-                detected_at=row["detected_at"],
-                acknowledged=row.get("acknowledged", False),
-            )
-        )
+    List anomaly alerts with filters.
 
-    return alerts
+    before: (detected_at, id) of the last alert on the previous page. When
+    given, the next page is fetched with an index range scan rather than an
+    OFFSET; the id breaks ties between alerts detected at the same instant.
+    """
+    before_ts, before_id = before if before else (None, None)
+    params = {
+        "entity_id": entity_id or None,
+        "severity": severity or None,
+        "acknowledged": acknowledged,
+        "before_ts": before_ts,
+        "before_id": before_id,
+        "limit": limit,
+    }
+    with postgres_client.get_session() as s:
+        rows = [dict(row._mapping) for row in s.execute(_LIST_ALERTS_SQL, params).fetchall()]
+
+    return [
+        AnomalyAlert(
+            id=row["id"],
+            entity_id=row["entity_id"],
+            entity_type=row["entity_type"],
+            anomaly_score=float(row["anomaly_score"]),
+            severity=row["severity"],
+            description=row["description"],
+            detected_at=row["detected_at"],
+            acknowledged=row.get("acknowledged", False),
+        )
+        for row in rows
+    ]
 
 
 def acknowledge_alert(alert_id: str) -> bool:
     """Acknowledge an anomaly alert."""
-    ensure_alerts_table()
-
-    query = """
-    UPDATE anomaly_alerts
-    SET acknowledged = TRUE, acknowledged_at = CURRENT_TIMESTAMP
-    WHERE id = $1
-    RETURNING id
-    """
-    rows = postgres_client.execute_query(query, (alert_id,))
-
-    return len(rows) > 0
+    with postgres_client.get_session() as s:
+        r = s.execute(
+            text("""
+            UPDATE anomaly_alerts
+            SET acknowledged = TRUE, acknowledged_at = CURRENT_TIMESTAMP
+            WHERE id = :alert_id
+            RETURNING id
+            """),
+            {"alert_id": alert_id},
+        )
+        return r.first() is not None
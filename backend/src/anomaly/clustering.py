@@ -6,14 +6,31 @@ from sklearn.cluster import KMeans, DBSCAN
 from sklearn.preprocessing import StandardScaler
 from datetime import datetime
 
+from src.cache.config import CacheKey, CacheTTL
+from src.cache.service import cache_aside, make_cache_key
 from src.infrastructure.database.neo4j_client import neo4j_client
 from src.ml.features import extract_features
 from src.anomaly.models import AnomalyScore
+from src.anomaly.utils import normalize01
 from src.infrastructure.logging import get_logger
+from src.tenancy.context import get_current_tenant
 
 logger = get_logger(__name__)
 
 
+def _features_cache_key(business_id: str) -> str:
+    """Key cached features by tenant, since the feature queries are tenant-filtered."""
+    tenant = get_current_tenant()
+    return make_cache_key(CacheKey.ML_FEATURES, "features", tenant.tenant_id if tenant else "-", business_id)
+
+
+# Feature extraction issues several graph queries per business; reuse results
+# across detection runs within the TTL.
+_extract_features_cached = cache_aside(
+    CacheKey.ML_FEATURES, ttl=CacheTTL.ML_FEATURES, key_func=_features_cache_key
+)(extract_features)
+
+
 def detect_business_anomalies(
     n_clusters: int = 5,
     min_cluster_size: int = 3,
@@ -46,7 +63,7 @@ def detect_business_anomalies(
     
     for business_id in business_ids:
         try:
-            features = extract_features(business_id)
+            features = _extract_features_cached(business_id)
             features_list.append(features)
             valid_business_ids.append(business_id)
         except Exception as e:
@@ -62,10 +79,10 @@ def detect_business_anomalies(
 
     # Select numeric features
     numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-    X = df[numeric_cols].values
+    X = df[numeric_cols].to_numpy(dtype=np.float32)
 
-    # Scale features
-    scaler = StandardScaler()
+    # Scale features (in place; float32 halves memory traffic)
+    scaler = StandardScaler(copy=False)
     X_scaled = scaler.fit_transform(X)
 
     # Cluster
@@ -80,59 +97,48 @@ def detect_business_anomalies(
 
     # Calculate distances to cluster centers (for KMeans)
     if method == "kmeans" and centers is not None:
-        distances = []
-        for i, point in enumerate(X_scaled):
-            cluster_id = labels[i]
-            if cluster_id >= 0:
-                center = centers[cluster_id]
-                distance = np.linalg.norm(point - center)
-                distances.append(distance)
-            else:
-                distances.append(np.inf)  # Noise points in DBSCAN
-        distances = np.array(distances)
-        
+        distances = np.linalg.norm(X_scaled - centers[labels], axis=1)
+        distances[labels < 0] = np.inf  # Noise points in DBSCAN
+
         # Normalize distances to 0-1
-        if distances.max() > distances.min():
-            normalized_distances = (distances - distances.min()) / (distances.max() - distances.min())
-        else:
-            normalized_distances = np.zeros_like(distances)
+        normalized_distances = normalize01(distances)
     else:
         # For DBSCAN, noise points are anomalies
         normalized_distances = np.array([1.0 if label == -1 else 0.0 for label in labels])
 
-    # Count cluster sizes
-    cluster_sizes = {}
-    for label in labels:
-        cluster_sizes[label] = cluster_sizes.get(label, 0) + 1
+    # Count cluster sizes (DBSCAN noise, label -1, is counted separately)
+    cluster_counts = np.bincount(labels[labels >= 0], minlength=1)
+    noise_count = int(np.count_nonzero(labels < 0))
+    point_sizes = np.where(labels >= 0, cluster_counts[np.maximum(labels, 0)], noise_count)
+
+    # Anomaly if: small cluster, noise point, or far from center
+    is_anomaly = (
+        (labels == -1)  # Noise point in DBSCAN
+        | (point_sizes < min_cluster_size)  # Small cluster
+        | (normalized_distances > 0.7)  # Far from cluster center
+    )
 
     # Identify anomalies
+    top_cols = numeric_cols[:5]  # Top 5 features
+    top_values = df[top_cols].to_numpy(dtype=float)
     results = []
-    for i, business_id in enumerate(valid_business_ids):
-        label = labels[i]
+    for i in np.flatnonzero(is_anomaly):
+        label = int(labels[i])
         score = float(normalized_distances[i])
-        cluster_size = cluster_sizes.get(label, 0)
-
-        # Anomaly if: small cluster, noise point, or far from center
-        is_anomaly = (
-            label == -1  # Noise point in DBSCAN
-            or cluster_size < min_cluster_size  # Small cluster
-            or score > 0.7  # Far from cluster center
-        )
-
-        if is_anomaly:
-            explanation = _explain_business_anomaly(label, cluster_size, score, method)
-            results.append(
-                AnomalyScore(
-                    entity_id=business_id,
-                    entity_type="business",
-                    score=score,
-                    is_anomaly=True,
-                    detection_method=f"clustering_{method}",
-                    features={col: float(df.iloc[i][col]) for col in numeric_cols[:5]},  # Top 5 features
-                    explanation=explanation,
-                    detected_at=datetime.now(),
-                )
+        cluster_size = int(point_sizes[i])
+        explanation = _explain_business_anomaly(label, cluster_size, score, method)
+        results.append(
+            AnomalyScore.model_construct(
+                entity_id=valid_business_ids[i],
+                entity_type="business",
+                score=score,
+                is_anomaly=True,
+                detection_method=f"clustering_{method}",
+                features=dict(zip(top_cols, top_values[i].tolist())),
+                explanation=explanation,
+                detected_at=datetime.now(),
             )
+        )
 
     return results
 
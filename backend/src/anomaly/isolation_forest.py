@@ -2,11 +2,11 @@
 from typing import List, Dict, Optional
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import IsolationForest
 from datetime import datetime
 
 from src.infrastructure.database.neo4j_client import neo4j_client
 from src.anomaly.models import AnomalyScore
+from src.anomaly.utils import build_isolation_forest, normalize01
 from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
@@ -49,95 +49,82 @@ def detect_transaction_anomalies(
     if not rows or len(rows) < 10:
         return []
 
-    # Prepare features
-    transactions = []
-    for row in rows:
-        amount = float(row.get("amount", 0) or 0)
-        timestamp = row.get("timestamp")
-        
-        # Convert timestamp to numeric features
-        if timestamp:
-            if isinstance(timestamp, str):
-                from dateutil import parser
-                ts = parser.parse(timestamp)
-            else:
-                ts = timestamp
-            hour = ts.hour
-            day_of_week = ts.weekday()
-            day_of_month = ts.day
-        else:
-            hour = 0
-            day_of_week = 0
-            day_of_month = 0
-
-        transactions.append({
-            "id": row["id"],
-            "node_id": row["node_id"],
-            "amount": amount,
-            "hour": hour,
-            "day_of_week": day_of_week,
-            "day_of_month": day_of_month,
-            "log_amount": np.log1p(abs(amount)),
-        })
-
-    df = pd.DataFrame(transactions)
-    
+    # Prepare features in one columnar pass
+    df = pd.DataFrame.from_records(rows, columns=["id", "amount", "timestamp", "type", "node_id"])
+    df["amount"] = pd.to_numeric(df["amount"], errors="coerce").fillna(0.0).astype(float)
+
+    # Convert timestamp to numeric features (normalized to UTC; missing -> 0)
+    ts = pd.to_datetime(
+        df["timestamp"].map(_to_native, na_action="ignore"),
+        errors="coerce",
+        utc=True,
+        format="mixed",
+    )
+    df["hour"] = ts.dt.hour.fillna(0).astype(int)
+    df["day_of_week"] = ts.dt.weekday.fillna(0).astype(int)
+    df["day_of_month"] = ts.dt.day.fillna(0).astype(int)
+    df["log_amount"] = np.log1p(df["amount"].abs())
+
     # Feature matrix
     feature_cols = ["amount", "hour", "day_of_week", "day_of_month", "log_amount"]
     X = df[feature_cols].values
 
     # Train Isolation Forest
-    iso_forest = IsolationForest(
-        contamination=contamination,
-        random_state=42,
-        n_estimators=100,
-    )
+    iso_forest = build_isolation_forest(contamination, len(X))
     predictions = iso_forest.fit_predict(X)
     anomaly_scores = -iso_forest.score_samples(X)  # Negative scores (higher = more anomalous)
     
     # Normalize scores to 0-1
-    min_score = anomaly_scores.min()
-    max_score = anomaly_scores.max()
-    if max_score > min_score:
-        normalized_scores = (anomaly_scores - min_score) / (max_score - min_score)
-    else:
-        normalized_scores = np.zeros_like(anomaly_scores)
+    normalized_scores = normalize01(anomaly_scores)
 
     # Create results
+    ids = df["id"].to_numpy()
+    amounts = df["amount"].to_numpy()
+    hours = df["hour"].to_numpy()
+    days_of_week = df["day_of_week"].to_numpy()
+    typical_amount = float(np.median(np.abs(amounts)))
+
+    anomaly_mask = (predictions == -1) | (normalized_scores > 0.7)  # Threshold for anomalies
     results = []
-    for idx, row in df.iterrows():
-        is_anomaly = predictions[idx] == -1
-        score = float(normalized_scores[idx])
-        
-        if is_anomaly or score > 0.7:  # Threshold for anomalies
-            results.append(
-                AnomalyScore(
-                    entity_id=str(row["id"]),
-                    entity_type="transaction",
-                    score=score,
-                    is_anomaly=True,
-                    detection_method="isolation_forest",
-                    features={
-                        "amount": float(row["amount"]),
-                        "hour": int(row["hour"]),
-                        "day_of_week": int(row["day_of_week"]),
-                    },
-                    explanation=_explain_transaction_anomaly(row, score),
-                    detected_at=datetime.now(),
-                )
+    for i in np.flatnonzero(anomaly_mask):
+        score = float(normalized_scores[i])
+        amount = float(amounts[i])
+        hour = int(hours[i])
+        results.append(
+            AnomalyScore.model_construct(
+                entity_id=str(ids[i]),
+                entity_type="transaction",
+                score=score,
+                is_anomaly=True,
+                detection_method="isolation_forest",
+                features={
+                    "amount": amount,
+                    "hour": float(hour),
+                    "day_of_week": float(days_of_week[i]),
+                },
+                explanation=_explain_transaction_anomaly(amount, hour, typical_amount, score),
+                detected_at=datetime.now(),
             )
+        )
 
     return results
 
 
-def _explain_transaction_anomaly(transaction: pd.Series, score: float) -> str:
+def _to_native(value):
+    """Convert Neo4j temporal values to Python datetimes; pass others through."""
+    return value.to_native() if hasattr(value, "to_native") else value
+
+
+def _explain_transaction_anomaly(
+    amount: float, hour: int, typical_amount: float, score: float
+) -> str:
     """Generate explanation for transaction anomaly."""
     reasons = []
     
-    if abs(transaction["amount"]) > transaction["amount"] * 2:  # Simplified check
+    if typical_amount > 0 and abs(amount) > typical_amount * 2:  # Well above the median size
         reasons.append("unusual amount")
     
-    if transaction["hour"] not in range(9, 17):  # Outside business hours
+    if hour not in range(9, 17):  # Outside business hours
         reasons.append("unusual time")
     
     if not reasons:
@@ -1,4 +1,9 @@
-"""Anomaly detection models and results."""
+"""Anomaly detection models and results.
+
+Detectors build these with ``model_construct()``: their values are already
+typed, so per-instance validation is skipped on the hot path. Field types must
+therefore be exact at construction time (e.g. floats in ``features``).
+"""
 from typing import Dict, List, Optional
 from datetime import datetime
 from pydantic import BaseModel
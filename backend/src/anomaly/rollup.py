@@ -0,0 +1,47 @@
+"""Materialized daily transaction rollups for time-series detection."""
+from typing import Optional
+
+from src.infrastructure.database.neo4j_client import neo4j_client
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Days of history kept fresh on each refresh (matches the detector's 365-point window)
+ROLLUP_DAYS = 365
+
+# Aggregates transactions per business per day into
+# (:Business)-[:HAS_DAILY_ROLLUP]->(:DailyTxnStats) so time-series reads scan
+# at most one node per day instead of every transaction.
+_REFRESH_QUERY = """
+MATCH (b:Business)<-[:INVOLVES]-(t:Transaction)
+WHERE ($business_id IS NULL OR b.id = $business_id)
+  AND date(t.timestamp) >= date() - duration({days: $days})
+WITH b, date(t.timestamp) AS day,
+     count(t) AS volume,
+     sum(CASE WHEN t.transaction_type = 'payment' THEN 1 ELSE 0 END) AS payment_count,
+     sum(CASE WHEN t.transaction_type = 'payment' THEN t.amount ELSE 0 END) AS payment_amount
+MERGE (b)-[:HAS_DAILY_ROLLUP]->(d:DailyTxnStats {business_id: b.id, day: day})
+SET d.volume = volume,
+    d.payment_count = payment_count,
+    d.payment_amount = payment_amount,
+    d.tenant_id = b.tenant_id,
+    d.updated_at = datetime()
+RETURN count(d) AS rollups
+"""
+
+
+def refresh_daily_rollups(business_id: Optional[str] = None, days: int = ROLLUP_DAYS) -> int:
+    """
+    Recompute DailyTxnStats for the last `days` days.
+
+    Runs across all tenants (a system job), or for a single business when
+    business_id is given. Returns the number of rollup nodes written.
+    """
+    rows = neo4j_client.execute_cypher(
+        _REFRESH_QUERY,
+        {"business_id": business_id, "days": days},
+        skip_tenant_filter=True,
+    )
+    count = rows[0]["rollups"] if rows else 0
+    logger.info("Daily rollups refreshed", business_id=business_id, rollups=count)
+    return count
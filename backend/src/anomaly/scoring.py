@@ -1,5 +1,10 @@
 """Anomaly scoring and aggregation."""
-from typing import List, Dict
+import contextvars
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Optional, Tuple
 from datetime import datetime
 
 from src.anomaly.models import AnomalyScore, AnomalyAlert
@@ -8,9 +13,47 @@ from src.anomaly.clustering import detect_business_anomalies
 from src.anomaly.timeseries import detect_timeseries_anomalies
 from src.anomaly.graph_embedding import detect_graph_anomalies
 from src.infrastructure.logging import get_logger
+from src.tenancy.context import get_current_tenant
 
 logger = get_logger(__name__)
 
+# Detector results are reused for this long so per-entity scoring does not
+# re-run a full detection pass on every lookup.
+DETECTION_CACHE_TTL_SECONDS = 60
+
+# Keyed by (tenant_id, entity_type): detector queries are tenant-filtered, so
+# a batch must only be reused for the tenant it was computed for.
+_DetectionKey = Tuple[Optional[str], str]
+_detection_cache: Dict[_DetectionKey, Tuple[float, Dict[str, AnomalyScore]]] = {}
+_detection_lock = threading.Lock()
+
+
+def _detection_key(entity_type: str) -> _DetectionKey:
+    """Cache key for entity_type detections under the current tenant."""
+    tenant = get_current_tenant()
+    return (tenant.tenant_id if tenant else None, entity_type)
+
+
+def _store_detections(entity_type: str, anomalies: List[AnomalyScore]) -> Dict[str, AnomalyScore]:
+    """Index a detection batch by entity ID and cache it for the current tenant."""
+    by_entity: Dict[str, AnomalyScore] = {}
+    for anomaly in anomalies:
+        by_entity.setdefault(anomaly.entity_id, anomaly)
+    with _detection_lock:
+        _detection_cache[_detection_key(entity_type)] = (time.monotonic(), by_entity)
+    return by_entity
+
+
+def _cached_detections(
+    entity_type: str, detector: Callable[[], List[AnomalyScore]]
+) -> Dict[str, AnomalyScore]:
+    """Return the current tenant's cached anomalies by entity ID, re-detecting when stale."""
+    with _detection_lock:
+        entry = _detection_cache.get(_detection_key(entity_type))
+    if entry and time.monotonic() - entry[0] < DETECTION_CACHE_TTL_SECONDS:
+        return entry[1]
+    return _store_detections(entity_type, detector())
+
 
 def compute_anomaly_score(
     entity_id: str,
@@ -32,16 +75,14 @@ def compute_anomaly_score(
 
     if entity_type == "transaction":
         # Use Isolation Forest
-        anomalies = detect_transaction_anomalies()
-        entity_anomalies = [a for a in anomalies if a.entity_id == entity_id]
-        if entity_anomalies:
-            scores.append(entity_anomalies[0].score)
+        anomaly = _cached_detections("transaction", detect_transaction_anomalies).get(entity_id)
+        if anomaly:
+            scores.append(anomaly.score)
     elif entity_type == "business":
         # Use clustering
-        anomalies = detect_business_anomalies()
-        entity_anomalies = [a for a in anomalies if a.entity_id == entity_id]
-        if entity_anomalies:
-            scores.append(entity_anomalies[0].score)
+        anomaly = _cached_detections("business", detect_business_anomalies).get(entity_id)
+        if anomaly:
+            scores.append(anomaly.score)
         
         # Also check time series
         try:
@@ -57,7 +98,7 @@ def compute_anomaly_score(
     else:
         final_score = 0.0
 
-    return AnomalyScore(
+    return AnomalyScore.model_construct(
         entity_id=entity_id,
         entity_type=entity_type,
         score=final_score,
@@ -68,32 +109,38 @@ def compute_anomaly_score(
 
 
 def detect_all_anomalies() -> List[AnomalyScore]:
-    """Run all anomaly detection methods and return combined results."""
-    all_anomalies = []
-
-    try:
-        # Transaction anomalies
-        transaction_anomalies = detect_transaction_anomalies()
-        all_anomalies.extend(transaction_anomalies)
-        logger.info(f"Detected {len(transaction_anomalies)} transaction anomalies")
-    except Exception as e:
-        logger.error(f"Transaction anomaly detection failed: {e}")
-
-    try:
-        # Business anomalies
-        business_anomalies = detect_business_anomalies()
-        all_anomalies.extend(business_anomalies)
-        logger.info(f"Detected {len(business_anomalies)} business anomalies")
-    except Exception as e:
-        logger.error(f"Business anomaly detection failed: {e}")
-
-    try:
-        # Graph embedding anomalies
-        graph_anomalies = detect_graph_anomalies()
-        all_anomalies.extend(graph_anomalies)
-        logger.info(f"Detected {len(graph_anomalies)} graph anomalies")
-    except Exception as e:
-        logger.error(f"Graph embedding detection failed: {e}")
+    """
+    Run all anomaly detection methods and return combined results.
+
+    The detectors are independent (each queries Neo4j and fits its own model),
+    so they run concurrently; results are combined in a fixed order.
+    """
+    detectors = [
+        ("transaction", detect_transaction_anomalies),
+        ("business", detect_business_anomalies),
+        ("graph", detect_graph_anomalies),
+    ]
+
+    with ThreadPoolExecutor(max_workers=len(detectors)) as executor:
+        # Each worker runs in a copy of the caller's context so tenant
+        # filtering in neo4j_client still applies.
+        futures = [
+            (name, executor.submit(contextvars.copy_context().run, detector))
+            for name, detector in detectors
+        ]
+
+        all_anomalies = []
+        for name, future in futures:
+            try:
+                anomalies = future.result()
+            except Exception as e:
+                logger.error(f"{name.capitalize()} anomaly detection failed: {e}")
+                continue
+            if name != "graph":
+                # Stored from the caller's thread, so keyed to the caller's tenant
+                _store_detections(name, anomalies)
+            all_anomalies.extend(anomalies)
+            logger.info(f"Detected {len(anomalies)} {name} anomalies")
 
     return all_anomalies
 
@@ -110,7 +157,12 @@ def create_anomaly_alert(anomaly: AnomalyScore) -> AnomalyAlert:
     else:
         severity = "low"
 
-    alert_id = f"{anomaly.entity_type}_{anomaly.entity_id}_{anomaly.detected_at.timestamp()}"
+    # Deterministic, fixed-width (32 hex chars) ID so re-saving the same anomaly
+    # still dedups via ON CONFLICT and the primary-key index stays compact.
+    alert_id = hashlib.blake2b(
+        f"{anomaly.entity_type}|{anomaly.entity_id}|{anomaly.detected_at.isoformat()}".encode(),
+        digest_size=16,
+    ).hexdigest()
 
     description = (
         f"Anomaly detected in {anomaly.entity_type} {anomaly.entity_id}. "
@@ -119,7 +171,7 @@ def create_anomaly_alert(anomaly: AnomalyScore) -> AnomalyAlert:
         f"{anomaly.explanation or ''}"
     )
 
-    return AnomalyAlert(
+    return AnomalyAlert.model_construct(
         id=alert_id,
         entity_id=anomaly.entity_id,
         entity_type=anomaly.entity_type,
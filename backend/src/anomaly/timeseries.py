@@ -1,13 +1,15 @@
 """Time series anomaly detection."""
-from typing import List, Optional
-import pandas as pd
+from typing import List, Optional, Tuple
 import numpy as np
-from datetime import datetime, timedelta
-from sklearn.preprocessing import StandardScaler
+from datetime import date, datetime
 
+from src.cache.config import CacheKey, CacheTTL
+from src.cache.service import cache_aside, make_cache_key
 from src.infrastructure.database.neo4j_client import neo4j_client
 from src.anomaly.models import AnomalyScore
+from src.anomaly.utils import rolling_mean_std
 from src.infrastructure.logging import get_logger
+from src.tenancy.context import get_current_tenant
 
 logger = get_logger(__name__)
 
@@ -30,88 +32,154 @@ def detect_timeseries_anomalies(
     Returns:
         List of AnomalyScore objects for detected anomalies
     """
-    # Fetch time series data
-    if metric == "transaction_volume":
-        query = """
+    # Fetch time series data, oldest first (cached per business, metric and day)
+    series = _fetch_series_cached(business_id, metric, date.today().isoformat())
+    if not series or len(series[0]) < window_size:
+        return []
+
+    dates, raw_values = series
+    values = np.asarray(raw_values, dtype=np.float64)
+    np.nan_to_num(values, copy=False)
+
+    # Calculate rolling statistics over full windows only; the first
+    # window_size - 1 points get NaN and are never flagged
+    rolling_mean, rolling_std = rolling_mean_std(values, window_size, min_periods=window_size)
+
+    # Identify anomalies (values beyond threshold_std from rolling mean)
+    rolling_std += 1e-6
+    z_scores = values - rolling_mean
+    z_scores /= rolling_std
+    abs_z = np.abs(z_scores)
+    with np.errstate(invalid="ignore"):
+        mask = abs_z > threshold_std
+
+    # Calculate anomaly scores (normalized z-score, capped at 1) in the |z|
+    # buffer; |z| >= 0, so no lower clip is needed
+    anomaly_scores = np.divide(abs_z, threshold_std, out=abs_z)
+    np.minimum(anomaly_scores, 1.0, out=anomaly_scores)
+
+    # Create results from the masked arrays
+    idx = np.flatnonzero(mask)
+    days = [dates[i] for i in idx]
+    selected_z = z_scores[idx].tolist()
+    selected_scores = anomaly_scores[idx].tolist()
+    detected_at = datetime.now()
+
+    # One %-template per batch; only the direction and numbers vary
+    template = (
+        f"Anomaly in {metric.replace('%', '%%')}: value %s normal range "
+        "(z-score: %.2f, score: %.2f)"
+    )
+    explanations = [
+        template % ("above" if z_score > 0 else "below", abs(z_score), score)
+        for z_score, score in zip(selected_z, selected_scores)
+    ]
+
+    return [
+        AnomalyScore.model_construct(
+            entity_id=f"{business_id}_{day}",
+            entity_type="time_series_point",
+            score=score,
+            is_anomaly=True,
+            detection_method="time_series",
+            features={
+                "value": value,
+                "rolling_mean": mean,
+                "z_score": z_score,
+            },
+            explanation=explanation,
+            detected_at=detected_at,
+        )
+        for day, value, mean, z_score, score, explanation in zip(
+            days,
+            values[idx].tolist(),
+            rolling_mean[idx].tolist(),
+            selected_z,
+            selected_scores,
+            explanations,
+        )
+    ]
+
+
+# Daily series read from DailyTxnStats (see src.anomaly.rollup)
+_ROLLUP_QUERIES = {
+    "transaction_volume": """
+        MATCH (b:Business {id: $business_id})-[:HAS_DAILY_ROLLUP]->(d:DailyTxnStats)
+        RETURN d.day as day, d.volume as value
+        ORDER BY d.day DESC
+        LIMIT 365
+        """,
+    "payment_amount": """
+        MATCH (b:Business {id: $business_id})-[:HAS_DAILY_ROLLUP]->(d:DailyTxnStats)
+        WHERE d.payment_count > 0
+        RETURN d.day as day, d.payment_amount as value
+        ORDER BY d.day DESC
+        LIMIT 365
+        """,
+}
+
+# Fallbacks used until refresh_daily_rollups has materialized a business
+_RAW_QUERIES = {
+    "transaction_volume": """
         MATCH (b:Business {id: $business_id})<-[:INVOLVES]-(t:Transaction)
-        WITH date(t.timestamp) as day, count(t) as volume
+        WITH date(t.timestamp) as day, count(t) as value
         ORDER BY day DESC
         LIMIT 365
-        RETURN day, volume
-        """
-        rows = neo4j_client.execute_cypher(query, {"business_id": business_id})
-        data = [(row["day"], float(row.get("volume", 0))) for row in rows]
-    elif metric == "payment_amount":
-        query = """
+        RETURN day, value
+        """,
+    "payment_amount": """
         MATCH (b:Business {id: $business_id})<-[:INVOLVES]-(t:Transaction)
         WHERE t.transaction_type = 'payment'
         WITH date(t.timestamp) as day, sum(t.amount) as total_amount
         ORDER BY day DESC
         LIMIT 365
         RETURN day, total_amount as value
-        """
-        rows = neo4j_client.execute_cypher(query, {"business_id": business_id})
-        data = [(row["day"], float(row.get("value", 0))) for row in rows]
+        """,
+}
+
+
+def _fetch_series(
+    business_id: str, metric: str, day: str
+) -> Optional[Tuple[List[str], List[float]]]:
+    """
+    Fetch a metric as parallel (dates, values) lists in chronological order.
+
+    day only buckets the cache key, so cached series roll over daily. Dates
+    are returned as ISO strings so the series round-trips through the cache.
+    Returns None when the series is empty or the cash flow series cannot be
+    computed, so neither is cached.
+    """
+    if metric in _ROLLUP_QUERIES:
+        rows = neo4j_client.execute_cypher(_ROLLUP_QUERIES[metric], {"business_id": business_id})
+        if not rows:
+            # Rollups not built yet for this business; aggregate transactions directly
+            rows = neo4j_client.execute_cypher(_RAW_QUERIES[metric], {"business_id": business_id})
+        if not rows:
+            return None
+        rows.reverse()
+        return [str(row["day"]) for row in rows], [row.get("value") or 0 for row in rows]
     else:
         # Cash flow metric
         try:
             from src.risk.cashflow.calculator import compute_cash_health
             cash_health = compute_cash_health(business_id)
-            data = [
-                (m.month, m.net) for m in cash_health.series if hasattr(m, "month")
-            ]
+            months = [m for m in cash_health.series if hasattr(m, "month")]
+            if not months:
+                return None
+            return [str(m.month) for m in months], [m.net for m in months]
         except Exception:
-            return []
+            return None
 
-    if len(data) < window_size:
-        return []
 
-    # Convert to DataFrame
-    df = pd.DataFrame(data, columns=["date", "value"])
-    df = df.sort_values("date")
-    df["value"] = pd.to_numeric(df["value"], errors="coerce").fillna(0)
-
-    # Calculate rolling statistics
-    df["rolling_mean"] = df["value"].rolling(window=window_size, min_periods=1).mean()
-    df["rolling_std"] = df["value"].rolling(window=window_size, min_periods=1).std()
-
-    # Identify anomalies (values beyond threshold_std from rolling mean)
-    df["z_score"] = (df["value"] - df["rolling_mean"]) / (df["rolling_std"] + 1e-6)
-    df["is_anomaly"] = np.abs(df["z_score"]) > threshold_std
-
-    # Calculate anomaly scores (normalized z-score)
-    df["anomaly_score"] = np.clip(
-        np.abs(df["z_score"]) / threshold_std, 0, 1
+def _series_cache_key(business_id: str, metric: str, day: str) -> str:
+    """Key cached series by tenant: business_id comes from the URL, not the tenant."""
+    tenant = get_current_tenant()
+    return make_cache_key(
+        CacheKey.TIME_SERIES, "series", tenant.tenant_id if tenant else "-", business_id, metric, day
     )
 
-    # Create results
-    results = []
-    for _, row in df[df["is_anomaly"]].iterrows():
-        results.append(
-            AnomalyScore(
-                entity_id=f"{business_id}_{row['date']}",
-                entity_type="time_series_point",
-                score=float(row["anomaly_score"]),
-                is_anomaly=True,
-                detection_method="time_series",
-                features={
-                    "value": float(row["value"]),
-                    "rolling_mean": float(row["rolling_mean"]),
-                    "z_score": float(row["z_score"]),
-                },
-                explanation=_explain_timeseries_anomaly(row, metric),
-                detected_at=datetime.now(),
-            )
-        )
-
-    return results
 
+_fetch_series_cached = cache_aside(
+    CacheKey.TIME_SERIES, ttl=CacheTTL.TIME_SERIES, key_func=_series_cache_key
+)(_fetch_series)
 
-def _explain_timeseries_anomaly(row: pd.Series, metric: str) -> str:
-    """Generate explanation for time series anomaly."""
-    direction = "above" if row["z_score"] > 0 else "below"
-    deviation = abs(row["z_score"])
-    return (
-        f"Anomaly in {metric}: value {direction} normal range "
-        f"(z-score: {deviation:.2f}, score: {row['anomaly_score']:.2f})"
-    )
@@ -0,0 +1,74 @@
+"""Shared numeric helpers for anomaly detectors."""
+from typing import Tuple
+
+import numpy as np
+from sklearn.ensemble import IsolationForest
+
+
+def normalize01(x: np.ndarray) -> np.ndarray:
+    """
+    Min-max scale scores to [0, 1] in place and return the same array.
+
+    A constant array (zero range) becomes all zeros. x must be a float array
+    the caller owns, since it is overwritten.
+    """
+    mn = x.min()
+    rng = np.ptp(x)
+    if rng == 0:
+        x.fill(0.0)
+        return x
+    np.subtract(x, mn, out=x)
+    x /= rng
+    return x
+
+
+def rolling_mean_std(
+    x: np.ndarray, window: int, min_periods: int = 1
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Trailing rolling mean and sample std (ddof=1) from one cumulative-sum pass.
+
+    Matches pandas ``rolling(window, min_periods=min_periods)``: windows with
+    fewer than min_periods values are NaN, and the std is also NaN where a
+    window holds a single value.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    # Centre the data so the sum-of-squares identity does not cancel badly
+    shift = x.mean() if x.size else 0.0
+    centred = x - shift
+    c1 = np.concatenate(([0.0], np.cumsum(centred)))
+    c2 = np.concatenate(([0.0], np.cumsum(centred * centred)))
+
+    end = np.arange(1, x.size + 1)
+    start = np.maximum(end - window, 0)
+    n = (end - start).astype(np.float64)
+    s = c1[end] - c1[start]
+    s2 = c2[end] - c2[start]
+
+    mean = s / n + shift
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var = (s2 - s * s / n) / (n - 1)
+    std = np.sqrt(np.maximum(var, 0.0))
+    std[n < 2] = np.nan
+    if min_periods > 1:
+        short = n < min_periods
+        mean[short] = np.nan
+        std[short] = np.nan
+    return mean, std
+
+
+def build_isolation_forest(contamination: float, n_samples: int) -> IsolationForest:
+    """
+    Create an IsolationForest sized to the data.
+
+    Trees are built and scored in parallel across cores. Small inputs get
+    fewer trees (32 up to 100, one per 100 samples), and each tree sees at
+    most 256 samples.
+    """
+    return IsolationForest(
+        contamination=contamination,
+        random_state=42,
+        n_estimators=min(100, max(32, n_samples // 100)),
+        max_samples=min(256, n_samples),
+        n_jobs=-1,
+    )
@@ -3,10 +3,13 @@
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import time
+
+import anyio.to_thread
 
 from src.config.settings import settings
 from src.infrastructure.logging import configure_logging, get_logger
-from src.infrastructure.database.neo4j_client import neo4j_client
+from src.infrastructure.database.neo4j_client import NEO4J_POOL_SIZE, neo4j_client
 from src.infrastructure.database.postgres_client import postgres_client
 from src.infrastructure.cache.redis_client import redis_client
 from src.infrastructure.queue.rabbitmq_client import rabbitmq_client
@@ -26,8 +29,10 @@ from src.api.utils.errors import (
     validation_exception_handler,
 )
 from src.api.utils.rate_limit import RateLimitMiddleware
-from src.alerts.engine import initialize_rules
+from src.alerts.engine import initialize_rules, redrive_pending_routes
+from src.alerts.routing import alert_router
 from src.alerts.persistence import ensure_alerts_table
+from src.anomaly.alerts import ensure_anomaly_alerts_table
 from src.auth.service import ensure_users_table
 from src.deduplication.merge_history import ensure_merge_history_table
 from src.ingestion.pipeline.job_store import ensure_ingestion_jobs_table
@@ -45,6 +50,10 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting AfricGraph application")
     try:
+        # Sync handlers block a threadpool worker per Neo4j round-trip; let as
+        # many run at once as there are pooled Bolt connections (default is 40)
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        limiter.total_tokens = max(limiter.total_tokens, NEO4J_POOL_SIZE)
         neo4j_client.connect()
         postgres_client.connect()
         redis_client.connect()
@@ -55,7 +64,11 @@ async def lifespan(app: FastAPI):
         ensure_ingestion_jobs_table()
         ensure_merge_history_table()
         ensure_alerts_table()
+        if settings.auto_ddl:
+            ensure_anomaly_alerts_table()
         initialize_rules()
+        alert_router.start()
+        redrive_pending_routes()
         
         # Start system metrics collection
         system_metrics_collector.start()
@@ -72,6 +85,7 @@ async def lifespan(app: FastAPI):
     
     # Stop system metrics collection
     system_metrics_collector.stop()
+    alert_router.stop()
     
     neo4j_client.close()
     postgres_client.close()
@@ -150,10 +164,22 @@ async def root():
     }
 
 
+# Liveness probes can fire every second; reuse the last result briefly so probe
+# frequency does not translate into pings against every backing service.
+HEALTH_CACHE_TTL_SECONDS = 2.0
+_health_cache = (0.0, None)
+
+
 @app.get("/health")
 async def health_check():
-    """Health check endpoint for all services."""
-    return {
+    """Health check endpoint for all services (cached for a couple of seconds)."""
+    global _health_cache
+    checked_at, result = _health_cache
+    now = time.monotonic()
+    if result is not None and now - checked_at < HEALTH_CACHE_TTL_SECONDS:
+        return result
+
+    result = {
         "status": "healthy",
         "services": {
             "neo4j": neo4j_client.health_check(),
@@ -163,3 +189,5 @@ async def health_check():
             "elasticsearch": elasticsearch_client.health_check(),
         }
     }
+    _health_cache = (now, result)
+    return result
@@ -1,13 +1,15 @@
 """Alert system API endpoints."""
-from typing import Optional
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 
 from src.alerts.engine import evaluate_and_trigger, get_rule, initialize_rules, list_rules
-from src.alerts.models import AlertSeverity, AlertStatus, AlertType
+from src.alerts.models import Alert, AlertSeverity, AlertStatus, AlertType
 from src.alerts.persistence import (
     acknowledge_alert,
+    decode_cursor,
+    encode_cursor,
     ensure_alerts_table,
     get_alert,
     get_alert_metrics,
@@ -26,6 +28,11 @@ class TriggerAlertRequest(BaseModel):
     entity_id: Optional[str] = None
 
 
+class AlertPage(BaseModel):
+    alerts: List[Alert]
+    next_cursor: Optional[str] = None
+
+
 @router.post("/trigger")
 def trigger_alert(body: TriggerAlertRequest) -> dict:
     """Manually trigger an alert evaluation."""
@@ -56,7 +63,7 @@ def get_rule_endpoint(rule_id: str) -> dict:
     return rule.model_dump()
 
 
-@router.get("")
+@router.get("", response_model=AlertPage)
 def get_alerts(
     business_id: Optional[str] = None,
     status: Optional[str] = None,
@@ -64,8 +71,17 @@ def get_alerts(
     alert_type: Optional[str] = None,
     limit: int = 100,
     offset: int = 0,
-) -> dict:
-    """List alerts with optional filters."""
+    cursor: Optional[str] = None,
+) -> Response:
+    """List alerts with optional filters.
+
+    Pass the returned next_cursor back as cursor to fetch the following page
+    without OFFSET scanning; offset is kept for backward compatibility.
+    """
+    try:
+        cursor_key = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid cursor")
     status_enum = AlertStatus(status) if status else None
     severity_enum = AlertSeverity(severity) if severity else None
     type_enum = AlertType(alert_type) if alert_type else None
@@ -77,8 +93,12 @@ def get_alerts(
         alert_type=type_enum,
         limit=limit,
         offset=offset,
+        cursor=cursor_key,
     )
-    return {"alerts": [a.model_dump(mode="json") for a in alerts]}
+    next_cursor = encode_cursor(alerts[-1]) if alerts and len(alerts) == limit else None
+    # Serialize straight to JSON bytes (no intermediate dicts)
+    page = AlertPage(alerts=alerts, next_cursor=next_cursor)
+    return Response(content=page.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{alert_id}")
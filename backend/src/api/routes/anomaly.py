@@ -1,34 +1,73 @@
 """Anomaly detection API endpoints."""
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional, List
+import asyncio
+from datetime import datetime
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
+from typing import Literal, Optional, List
+from pydantic import TypeAdapter
 
 from src.anomaly.scoring import (
     compute_anomaly_score,
     detect_all_anomalies,
     create_anomaly_alert,
 )
-from src.anomaly.alerts import list_alerts, acknowledge_alert, save_alert, ensure_alerts_table
+from src.anomaly.alerts import list_alerts, acknowledge_alert, save_alerts
 from src.anomaly.isolation_forest import detect_transaction_anomalies
 from src.anomaly.clustering import detect_business_anomalies
 from src.anomaly.timeseries import detect_timeseries_anomalies
 from src.anomaly.graph_embedding import detect_graph_anomalies
 from src.anomaly.models import AnomalyScore, AnomalyAlert
+from src.ingestion.pipeline.job_store import (
+    STATUS_FAILED,
+    STATUS_RUNNING,
+    STATUS_SUCCESS,
+    create_job,
+    update_job_status,
+)
+from src.tenancy.context import get_current_tenant, set_current_tenant
+from src.infrastructure.logging import get_logger
+
+# Detection endpoints return large float-heavy lists; orjson renders them faster
+router = APIRouter(
+    prefix="/anomaly",
+    tags=["anomaly-detection"],
+    default_response_class=ORJSONResponse,
+)
+logger = get_logger(__name__)
 
-router = APIRouter(prefix="/anomaly", tags=["anomaly-detection"])
+_ALERT_LIST = TypeAdapter(List[AnomalyAlert])
 
 
-@router.post("/detect/all", response_model=List[AnomalyScore])
-def detect_all():
-    """Run all anomaly detection methods."""
-    anomalies = detect_all_anomalies()
-    
-    # Create and save alerts for high-severity anomalies
-    for anomaly in anomalies:
-        if anomaly.score >= 0.7:
-            alert = create_anomaly_alert(anomaly)
-            save_alert(alert)
-    
-    return anomalies
+def _run_detect_all(job_id: str, tenant) -> None:
+    """Run all detectors and save high-severity alerts, recording progress on the job."""
+    set_current_tenant(tenant)
+    update_job_status(job_id, STATUS_RUNNING)
+    try:
+        anomalies = detect_all_anomalies()
+        # Create and save alerts for high-severity anomalies in one batch
+        saved = save_alerts([create_anomaly_alert(a) for a in anomalies if a.score >= 0.7])
+    except Exception as e:
+        logger.error("Anomaly detection job failed", job_id=job_id, error=str(e))
+        update_job_status(job_id, STATUS_FAILED, error_message=str(e))
+        return
+    update_job_status(
+        job_id,
+        STATUS_SUCCESS,
+        stats={"anomalies": len(anomalies), "alerts_saved": len(saved)},
+    )
+
+
+@router.post("/detect/all", status_code=202)
+def detect_all(background_tasks: BackgroundTasks) -> dict:
+    """
+    Queue all anomaly detection methods. Returns job_id to poll status.
+
+    Progress is tracked in the ingestion job store (GET /ingestion/jobs/{job_id});
+    detected anomalies are persisted as alerts (GET /anomaly/alerts).
+    """
+    jid = create_job("anomaly_detection")
+    background_tasks.add_task(_run_detect_all, jid, get_current_tenant())
+    return {"job_id": jid, "status": "pending"}
 
 
 @router.post("/detect/transaction", response_model=List[AnomalyScore])
@@ -58,18 +97,28 @@ def detect_business_anomalies_endpoint(
 
 
 @router.post("/detect/timeseries/{business_id}", response_model=List[AnomalyScore])
-def detect_timeseries_anomalies_endpoint(
+async def detect_timeseries_anomalies_endpoint(
     business_id: str,
-    metric: str = Query("transaction_volume", pattern="^(transaction_volume|payment_amount|cashflow)$"),
+    metric: List[Literal["transaction_volume", "payment_amount", "cashflow"]] = Query(
+        ["transaction_volume"], description="Repeat to analyze several metrics in one request"
+    ),
     threshold_std: float = Query(3.0, ge=1.0, le=5.0),
 ):
-    """Detect time series anomalies for a business."""
-    anomalies = detect_timeseries_anomalies(
-        business_id=business_id,
-        metric=metric,
-        threshold_std=threshold_std,
+    """Detect time series anomalies for a business across one or more metrics."""
+    # Metrics are fetched concurrently in worker threads (which inherit the
+    # tenant context), so several metrics cost about one Neo4j round-trip.
+    results = await asyncio.gather(
+        *(
+            asyncio.to_thread(
+                detect_timeseries_anomalies,
+                business_id=business_id,
+                metric=m,
+                threshold_std=threshold_std,
+            )
+            for m in dict.fromkeys(metric)
+        )
     )
-    return anomalies
+    return [anomaly for anomalies in results for anomaly in anomalies]
 
 
 @router.post("/detect/graph", response_model=List[AnomalyScore])
@@ -109,22 +158,26 @@ def get_alerts(
     severity: Optional[str] = Query(None, pattern="^(low|medium|high|critical)$"),
     acknowledged: Optional[bool] = None,
     limit: int = Query(100, ge=1, le=1000),
+    before: Optional[datetime] = Query(None, description="detected_at of the last alert on the previous page"),
+    before_id: Optional[str] = Query(None, description="id of the last alert on the previous page"),
 ):
     """List anomaly alerts."""
-    ensure_alerts_table()
+    if (before is None) != (before_id is None):
+        raise HTTPException(status_code=400, detail="before and before_id must be given together")
     alerts = list_alerts(
         entity_id=entity_id,
         severity=severity,
         acknowledged=acknowledged,
         limit=limit,
+        before=(before, before_id) if before is not None else None,
     )
-    return alerts
+    # Serialize straight to JSON bytes (no intermediate dicts)
+    return Response(content=_ALERT_LIST.dump_json(alerts), media_type="application/json")
 
 
 @router.post("/alerts/{alert_id}/acknowledge")
 def acknowledge_anomaly_alert(alert_id: str):
     """Acknowledge an anomaly alert."""
-    ensure_alerts_table()
     success = acknowledge_alert(alert_id)
     if not success:
         raise HTTPException(status_code=404, detail="Alert not found")
@@ -10,13 +10,16 @@ from src.auth.jwt_handler import validate_access_token
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+_BEARER_PREFIX = "Bearer "
+
+
 def get_current_user_id(authorization: Optional[str] = Header(None)) -> Optional[str]:
     """Extract user ID from JWT token in Authorization header."""
-    if not authorization:
+    if not authorization or not authorization.startswith(_BEARER_PREFIX):
         return None
     try:
         # Extract token from "Bearer <token>"
-        token = authorization.replace("Bearer ", "").strip()
+        token = authorization[len(_BEARER_PREFIX):].strip()
         payload = validate_access_token(token)
         if payload:
             return payload.get("sub")
@@ -1,22 +1,61 @@
 """Backup management API endpoints."""
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+import functools
+from pathlib import Path
+from datetime import datetime, timezone
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Response
+from fastapi.responses import ORJSONResponse
 from typing import Dict, List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from src.api.utils.responses import cached_orjson_response
 from src.backup.orchestrator import BackupOrchestrator, CloudProvider
 from src.backup.retention import RetentionPolicy
 from src.backup.testing import BackupTester
+from src.ingestion.pipeline.job_store import (
+    STATUS_FAILED,
+    STATUS_RUNNING,
+    STATUS_SUCCESS,
+    create_job,
+    get_job,
+    update_job_status,
+)
+from src.cache.config import CacheKey
+from src.cache.service import CacheService
 from src.infrastructure.logging import get_logger
 from src.config.settings import settings
 
-router = APIRouter(prefix="/backup", tags=["backup"])
+router = APIRouter(prefix="/backup", tags=["backup"], default_response_class=ORJSONResponse)
 logger = get_logger(__name__)
 
+_LIST_CACHE_NAME = "backups"  # cached GET /backup/list response
+
+# Backup settings are fixed for the life of the process; resolve them once.
+_BACKUP_DIR = getattr(settings, "backup_dir", "/var/backups/africgraph")
+_PROVIDER = getattr(settings, "backup_cloud_provider", None)
+_S3_CFG = {
+    "bucket": getattr(settings, "backup_s3_bucket", "africgraph-backups"),
+    "aws_access_key_id": getattr(settings, "backup_aws_access_key", None),
+    "aws_secret_access_key": getattr(settings, "backup_aws_secret_key", None),
+    "region": getattr(settings, "backup_aws_region", "us-east-1"),
+}
+_GCS_CFG = {
+    "bucket": getattr(settings, "backup_gcs_bucket", "africgraph-backups"),
+    "project_id": getattr(settings, "backup_gcp_project", None),
+}
+
+_BACKUP_ROOT = Path(_BACKUP_DIR).resolve()
+_TESTER = BackupTester()
+_RETENTION = RetentionPolicy()  # immutable config, shared by backup runs and cleanup
+
 
 class BackupRequest(BaseModel):
     """Backup request model."""
     backup_type: str = "incremental"  # full or incremental
     cloud_upload: bool = False
+    upload_concurrency: int = Field(8, ge=1, le=32)  # parallel multipart streams
+    multipart_chunksize_mb: int = Field(8, ge=5, le=512)  # S3 minimum part size is 5 MB
+    upload_buffer_kb: int = Field(8192, ge=256, le=65536)  # per-request IO buffer for uploads
+    download_buffer_kb: int = Field(1536, ge=256, le=65536)  # per-request IO buffer for downloads
 
 
 class BackupResponse(BaseModel):
@@ -26,96 +65,139 @@ class BackupResponse(BaseModel):
     neo4j_backup: Optional[str] = None
     postgres_backup: Optional[str] = None
     cloud_uploaded: bool = False
+    job_id: Optional[str] = None
     message: str
 
 
-@router.post("/run", response_model=BackupResponse)
+@functools.lru_cache(maxsize=1)
+def _get_status_orchestrator() -> BackupOrchestrator:
+    """Shared read-only orchestrator for the status and list endpoints."""
+    return BackupOrchestrator(
+        backup_dir=_BACKUP_DIR,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_orchestrator(
+    cloud_provider: Optional[CloudProvider],
+    cloud_config_items: Optional[frozenset],
+) -> BackupOrchestrator:
+    """Orchestrator for a cloud configuration, reused across backup runs."""
+    return BackupOrchestrator(
+        backup_dir=_BACKUP_DIR,
+        neo4j_container="africgraph-neo4j",
+        postgres_container="africgraph-postgres",
+        cloud_provider=cloud_provider,
+        cloud_config=dict(cloud_config_items) if cloud_config_items else None,
+        retention_policy=_RETENTION,
+    )
+
+
+def _build_orchestrator(request: BackupRequest) -> BackupOrchestrator:
+    """Return an orchestrator configured for the requested backup."""
+    # Configure cloud storage if enabled
+    cloud_provider = None
+    cloud_config = None
+
+    if request.cloud_upload:
+        transfer_config = {
+            "upload_concurrency": request.upload_concurrency,
+            "multipart_chunksize_mb": request.multipart_chunksize_mb,
+            "upload_buffer_bytes": request.upload_buffer_kb * 1024,
+            "download_buffer_bytes": request.download_buffer_kb * 1024,
+        }
+        if _PROVIDER == "s3":
+            cloud_provider = CloudProvider.S3
+            cloud_config = {**_S3_CFG, **transfer_config}
+        elif _PROVIDER == "gcs":
+            cloud_provider = CloudProvider.GCS
+            cloud_config = {**_GCS_CFG, **transfer_config}
+
+    # Keyed on the effective config so repeat runs reuse the cloud client
+    return _get_orchestrator(
+        cloud_provider,
+        frozenset(cloud_config.items()) if cloud_config else None,
+    )
+
+
+def _run_backup_job(job_id: str, request: BackupRequest) -> None:
+    """Run a backup in the background, recording progress on the job."""
+    update_job_status(job_id, STATUS_RUNNING)
+    try:
+        orchestrator = _build_orchestrator(request)
+        if request.backup_type == "full":
+            results = orchestrator.run_full_backup()
+        else:
+            results = orchestrator.run_incremental_backup()
+    except Exception as e:
+        logger.exception("Backup failed", job_id=job_id)
+        update_job_status(job_id, STATUS_FAILED, error_message=str(e)[:2000])
+        return
+    CacheService.invalidate_pattern(CacheKey.LIST_RESPONSE, f"{_LIST_CACHE_NAME}:*")
+    update_job_status(job_id, STATUS_SUCCESS, stats=results)
+
+
+@router.post("/run", response_model=BackupResponse, status_code=202)
 def run_backup(
     request: BackupRequest,
     background_tasks: BackgroundTasks,
 ) -> BackupResponse:
     """
-    Trigger a backup operation.
+    Queue a backup operation. Returns job_id to poll via GET /backup/jobs/{job_id}.
 
-    Can run in background for long-running operations.
+    Dumps and cloud uploads can take minutes, so they run after the response.
     """
     try:
-        # Configure cloud storage if enabled
-        cloud_provider = None
-        cloud_config = None
-
-        if request.cloud_upload:
-            # Get cloud provider from settings
-            provider = getattr(settings, "backup_cloud_provider", None)
-            if provider == "s3":
-                cloud_provider = CloudProvider.S3
-                cloud_config = {
-                    "bucket": getattr(settings, "backup_s3_bucket", "africgraph-backups"),
-                    "aws_access_key_id": getattr(settings, "backup_aws_access_key", None),
-                    "aws_secret_access_key": getattr(settings, "backup_aws_secret_key", None),
-                    "region": getattr(settings, "backup_aws_region", "us-east-1"),
-                }
-            elif provider == "gcs":
-                cloud_provider = CloudProvider.GCS
-                cloud_config = {
-                    "bucket": getattr(settings, "backup_gcs_bucket", "africgraph-backups"),
-                    "project_id": getattr(settings, "backup_gcp_project", None),
-                }
-
-        # Initialize orchestrator
-        orchestrator = BackupOrchestrator(
-            backup_dir=getattr(settings, "backup_dir", "/var/backups/africgraph"),
-            neo4j_container="africgraph-neo4j",
-            postgres_container="africgraph-postgres",
-            cloud_provider=cloud_provider,
-            cloud_config=cloud_config,
-            retention_policy=RetentionPolicy(),
-        )
-
-        # Run backup
-        if request.backup_type == "full":
-            results = orchestrator.run_full_backup()
-        else:
-            results = orchestrator.run_incremental_backup()
-
-        return BackupResponse(
-            success=True,
-            timestamp=results.get("timestamp", ""),
-            neo4j_backup=results.get("neo4j"),
-            postgres_backup=results.get("postgres"),
-            cloud_uploaded=results.get("cloud_uploaded", False),
-            message="Backup completed successfully",
-        )
-
-    except Exception as e:
-        logger.exception("Backup failed", error=str(e))
-        raise HTTPException(status_code=500, detail=f"Backup failed: {str(e)}")
+        jid = create_job("backup", request.model_dump())
+    except Exception:
+        logger.exception("Failed to queue backup")
+        raise HTTPException(status_code=500, detail="Failed to queue backup")
+
+    background_tasks.add_task(_run_backup_job, jid, request)
+    return BackupResponse(
+        success=True,
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        job_id=jid,
+        message="Backup queued",
+    )
+
+
+@router.get("/jobs/{job_id}")
+def get_backup_job(job_id: str) -> Dict:
+    """Return backup job status; stats hold the backup results once it succeeds."""
+    job = get_job(job_id)
+    if not job or job["source"] != "backup":
+        raise HTTPException(status_code=404, detail="job not found")
+    return {
+        "job_id": job["id"],
+        "status": job["status"],
+        "created_at": job["created_at"],
+        "started_at": job["started_at"],
+        "completed_at": job["finished_at"],
+        "error_message": job["error_message"],
+        "results": job["stats"],
+    }
 
 
 @router.get("/status")
 def get_backup_status() -> Dict:
     """Get backup status and statistics."""
     try:
-        orchestrator = BackupOrchestrator(
-            backup_dir=getattr(settings, "backup_dir", "/var/backups/africgraph"),
-        )
+        orchestrator = _get_status_orchestrator()
         return orchestrator.get_backup_status()
-    except Exception as e:
-        logger.exception("Failed to get backup status", error=str(e))
-        raise HTTPException(status_code=500, detail=f"Failed to get status: {str(e)}")
+    except Exception:
+        logger.exception("Failed to get backup status")
+        raise HTTPException(status_code=500, detail="Failed to get status")
 
 
-@router.get("/list")
-def list_backups() -> Dict[str, List[Dict]]:
+@router.get("/list", response_model=Dict[str, List[Dict]])
+def list_backups() -> Response:
     """List all available backups."""
     try:
-        orchestrator = BackupOrchestrator(
-            backup_dir=getattr(settings, "backup_dir", "/var/backups/africgraph"),
-        )
-        return orchestrator.list_backups()
-    except Exception as e:
-        logger.exception("Failed to list backups", error=str(e))
-        raise HTTPException(status_code=500, detail=f"Failed to list backups: {str(e)}")
+        return cached_orjson_response(_LIST_CACHE_NAME, {}, _get_status_orchestrator().list_backups)
+    except Exception:
+        logger.exception("Failed to list backups")
+        raise HTTPException(status_code=500, detail="Failed to list backups")
 
 
 @router.post("/test/{backup_file:path}")
@@ -126,31 +208,31 @@ def test_backup(backup_file: str) -> Dict[str, bool]:
     Args:
         backup_file: Path to backup file (relative to backup directory)
     """
-    try:
-        backup_path = f"/var/backups/africgraph/{backup_file}"
-        tester = BackupTester()
+    backup_path = (_BACKUP_ROOT / backup_file).resolve()
+    if not backup_path.is_relative_to(_BACKUP_ROOT):
+        raise HTTPException(status_code=400, detail="Backup path is outside the backup directory")
+    relative = backup_path.relative_to(_BACKUP_ROOT).as_posix()
+    if "neo4j" in relative:
+        test = _TESTER.test_neo4j_backup
+    elif "postgres" in relative:
+        test = _TESTER.test_postgres_backup
+    else:
+        raise HTTPException(status_code=400, detail="Unknown backup type")
 
-        if "neo4j" in backup_file:
-            results = tester.test_neo4j_backup(backup_path)
-        elif "postgres" in backup_file:
-            results = tester.test_postgres_backup(backup_path)
-        else:
-            raise HTTPException(status_code=400, detail="Unknown backup type")
-
-        return results
-
-    except Exception as e:
-        logger.exception("Backup test failed", error=str(e))
-        raise HTTPException(status_code=500, detail=f"Test failed: {str(e)}")
+    try:
+        return test(str(backup_path))
+    except Exception:
+        logger.exception("Backup test failed")
+        raise HTTPException(status_code=500, detail="Test failed")
 
 
 @router.post("/cleanup")
 def cleanup_backups() -> Dict[str, int]:
     """Run retention policy cleanup."""
     try:
-        policy = RetentionPolicy()
-        results = policy.cleanup(getattr(settings, "backup_dir", "/var/backups/africgraph"))
+        results = _RETENTION.cleanup(_BACKUP_DIR)
+        CacheService.invalidate_pattern(CacheKey.LIST_RESPONSE, f"{_LIST_CACHE_NAME}:*")
         return results
-    except Exception as e:
-        logger.exception("Cleanup failed", error=str(e))
-        raise HTTPException(status_code=500, detail=f"Cleanup failed: {str(e)}")
+    except Exception:
+        logger.exception("Cleanup failed")
+        raise HTTPException(status_code=500, detail="Cleanup failed")
@@ -1,5 +1,6 @@
 """Cache management API endpoints."""
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 
 from src.cache.service import CacheService
@@ -12,7 +13,7 @@ from src.cache.invalidation import (
     invalidate_risk_cache,
 )
 
-router = APIRouter(prefix="/cache", tags=["cache"])
+router = APIRouter(prefix="/cache", tags=["cache"], default_response_class=ORJSONResponse)
 
 
 @router.post("/warm")
@@ -110,12 +111,13 @@ def invalidate_risk(business_id: Optional[str] = None):
 
 
 @router.delete("/clear")
-def clear_cache():
+def clear_cache(async_delete: bool = Query(True, description="Free keys in a Redis background thread")):
     """Clear all cache (use with caution)."""
     try:
-        # Clear all cache keys (this is destructive)
+        # Clear all cache keys (this is destructive). FLUSHDB ASYNC returns
+        # immediately instead of blocking Redis while every key is freed.
         from src.infrastructure.cache.redis_client import redis_client
-        redis_client.client.flushdb()
+        redis_client.client.flushdb(asynchronous=async_delete)
         return {"status": "success", "message": "All cache cleared"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Cache clear failed: {str(e)}")
@@ -127,20 +129,23 @@ def get_cache_stats():
     try:
         from src.infrastructure.cache.redis_client import redis_client
         
-        info = redis_client.client.info("stats")
-        keyspace = redis_client.client.info("keyspace")
-        
+        # One round-trip for all three commands
+        pipe = redis_client.client.pipeline(transaction=False)
+        pipe.info("stats")
+        pipe.info("keyspace")
+        pipe.dbsize()
+        info, keyspace, total_keys = pipe.execute()
+        hits = info.get("keyspace_hits", 0)
+        misses = info.get("keyspace_misses", 0)
+        lookups = hits + misses
+
         return {
             "status": "success",
             "stats": {
-                "total_keys": redis_client.client.dbsize(),
-                "hits": info.get("keyspace_hits", 0),
-                "misses": info.get("keyspace_misses", 0),
-                "hit_rate": (
-                    info.get("keyspace_hits", 0)
-                    / (info.get("keyspace_hits", 0) + info.get("keyspace_misses", 1))
-                    * 100
-                ),
+                "total_keys": total_keys,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": 100.0 * hits / lookups if lookups else 0.0,
                 "keyspace": keyspace,
             },
         }
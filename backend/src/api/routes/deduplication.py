@@ -1,16 +1,31 @@
 """Deduplication: candidates, merge, auto-merge, merge history, unmerge."""
-from typing import Optional
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from uuid import UUID
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
+from src.api.utils.responses import cached_orjson_response, orjson_response
 from src.config.settings import settings
 from src.deduplication.candidates import find_candidates
 from src.deduplication.merge import merge_nodes, unmerge
-from src.deduplication.merge_history import get_merge_history, get_merge_record, insert_merge_record, mark_undone
+from src.deduplication.merge_history import (
+    LIST_CACHE_NAME,
+    MergeRow,
+    get_merge_history,
+    get_merge_record,
+    insert_merge_record,
+    insert_merge_records_bulk,
+    mark_undone,
+)
 from src.infrastructure.database.neo4j_client import neo4j_client
 
-router = APIRouter(prefix="/deduplication", tags=["deduplication"])
+router = APIRouter(prefix="/deduplication", tags=["deduplication"], default_response_class=ORJSONResponse)
+
+AUTO_MERGE_WORKERS = 8
 
 
 class MergeBody(BaseModel):
@@ -35,13 +50,13 @@ def get_candidates(
     label: str,
     min_confidence: float = 0.8,
     limit: int = 100,
-) -> dict:
+) -> Response:
     """Return merge candidates: pairs of nodes with similarity >= min_confidence."""
     try:
         cands = find_candidates(neo4j_client, label, min_confidence=min_confidence, limit=limit)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    return {"candidates": cands}
+    return orjson_response({"candidates": cands})
 
 
 @router.post("/merge")
@@ -64,19 +79,50 @@ def post_auto_merge(body: AutoMergeBody) -> dict:
         cands = find_candidates(neo4j_client, body.label, min_confidence=body.min_confidence, limit=getattr(settings, "deduplication_candidates_limit", 500))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    merged = []
-    for c in cands:
+
+    def _merge_one(c: Dict[str, Any]) -> Optional[MergeRow]:
         a, b = c["node_a_id"], c["node_b_id"]
         conf = c.get("confidence") or 0
         try:
             details = merge_nodes(neo4j_client, a, b, body.label, merged_by="auto", confidence=conf)
-            rid = insert_merge_record(a, b, body.label, "auto", conf, details)
-            merged.append({"merge_history_id": rid, "merged_id": a, "survivor_id": b})
         except Exception:
-            continue
+            return None
+        return (a, b, body.label, "auto", conf, details)
+
+    rows: List[MergeRow] = []
+    with ThreadPoolExecutor(max_workers=AUTO_MERGE_WORKERS) as executor:
+        for batch in _disjoint_rounds(cands):
+            # Workers run in a copy of the request context (tenant filtering)
+            futures = [executor.submit(contextvars.copy_context().run, _merge_one, c) for c in batch]
+            rows.extend(r for r in (f.result() for f in futures) if r)
+    # History for the whole run is written in one transaction
+    ids = insert_merge_records_bulk(rows)
+    merged = [
+        {"merge_history_id": rid, "merged_id": row[0], "survivor_id": row[1]}
+        for rid, row in zip(ids, rows)
+    ]
     return {"merged": merged}
 
 
+def _disjoint_rounds(cands: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """
+    Group candidates into rounds in which no node id appears twice, so merges in
+    a round can run concurrently without contending for the same nodes. A pair
+    always lands after every earlier pair sharing one of its ids, preserving the
+    serial outcome for chained candidates (A->B then B->C).
+    """
+    rounds: List[List[Dict[str, Any]]] = []
+    last_round: Dict[str, int] = {}
+    for c in cands:
+        a, b = c["node_a_id"], c["node_b_id"]
+        i = max(last_round.get(a, -1), last_round.get(b, -1)) + 1
+        if i == len(rounds):
+            rounds.append([])
+        rounds[i].append(c)
+        last_round[a] = last_round[b] = i
+    return rounds
+
+
 @router.get("/merge-history")
 def get_history(
     label: Optional[str] = None,
@@ -85,10 +131,25 @@ def get_history(
     undone: Optional[bool] = None,
     limit: int = 100,
     offset: int = 0,
-) -> dict:
-    """Query merge history. undone=false: only active; undone=true: only undone."""
-    items = get_merge_history(label=label, merged_id=merged_id, survivor_id=survivor_id, undone=undone, limit=limit, offset=offset)
-    return {"items": items, "limit": limit, "offset": offset}
+    after_id: Optional[UUID] = Query(None, description="next_after from the previous page"),
+) -> Response:
+    """Query merge history, newest first. undone=false: only active; undone=true: only undone."""
+    params = {
+        "label": label,
+        "merged_id": merged_id,
+        "survivor_id": survivor_id,
+        "undone": undone,
+        "limit": limit,
+        "offset": offset,
+        "after_id": str(after_id) if after_id else None,
+    }
+
+    def _page() -> dict:
+        items = get_merge_history(**params)
+        next_after = items[-1]["id"] if len(items) == limit else None
+        return {"items": items, "limit": limit, "offset": offset, "next_after": next_after}
+
+    return cached_orjson_response(LIST_CACHE_NAME, params, _page)
 
 
 @router.post("/unmerge")
@@ -3,19 +3,35 @@ from __future__ import annotations
 
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
 
-from src.fraud.alerts import list_alerts, mark_false_positive
+from src.api.utils.responses import cached_body_response, cached_orjson_response
+from src.cache.config import CacheKey, CacheTTL
+from src.cache.service import make_cache_key
+from src.fraud.alerts import LIST_CACHE_NAME, list_alerts, mark_false_positive
 from src.fraud.detector import run_fraud_checks_for_business
+from src.tenancy.context import get_current_tenant
 
-router = APIRouter(prefix="/fraud", tags=["fraud"])
+router = APIRouter(prefix="/fraud", tags=["fraud"], default_response_class=ORJSONResponse)
 
 
 @router.post("/business/{business_id}/scan")
-def scan_business_for_fraud(business_id: str) -> dict:
-    """Run fraud checks for a business and create an alert if needed."""
-    result = run_fraud_checks_for_business(business_id)
-    return result
+def scan_business_for_fraud(business_id: str) -> Response:
+    """
+    Run fraud checks for a business and create an alert if needed.
+
+    Repeat scans of the same business within CacheTTL.FRAUD_SCAN return the
+    previous result instead of re-running every detector (and raising a
+    duplicate alert).
+    """
+    tenant = get_current_tenant()
+    cache_key = make_cache_key(CacheKey.FRAUD_SCAN, business_id, tenant.tenant_id if tenant else "-")
+    return cached_body_response(
+        cache_key,
+        CacheTTL.FRAUD_SCAN,
+        lambda: run_fraud_checks_for_business(business_id),
+    )
 
 
 @router.get("/alerts")
@@ -24,10 +40,17 @@ def get_alerts(
     status: Optional[str] = None,
     limit: int = 50,
     offset: int = 0,
-) -> dict:
-    """List fraud alerts (manual review queue)."""
-    items = list_alerts(business_id=business_id, status=status, limit=limit, offset=offset)
-    return {"items": items, "limit": limit, "offset": offset}
+    after_id: Optional[int] = Query(None, description="next_after from the previous page"),
+) -> Response:
+    """List fraud alerts (manual review queue), newest first."""
+    params = {"business_id": business_id, "status": status, "limit": limit, "offset": offset, "after_id": after_id}
+
+    def _page() -> dict:
+        items = list_alerts(**params)
+        next_after = items[-1]["id"] if len(items) == limit else None
+        return {"items": items, "limit": limit, "offset": offset, "next_after": next_after}
+
+    return cached_orjson_response(LIST_CACHE_NAME, params, _page)
 
 
 @router.post("/alerts/{alert_id}/false-positive")
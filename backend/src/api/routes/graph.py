@@ -1,22 +1,41 @@
 """Graph traversal and analysis API endpoints."""
-from typing import List, Optional
+import itertools
+from typing import Iterator, List, Literal, Optional
 
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
 
 from src.graph.common_ownership import find_common_owners, find_ownership_path
 from src.graph.components import find_connected_components, get_component_for_node
 from src.graph.cycles import detect_cycles
+from src.api.utils.responses import (
+    cached_body_response,
+    cached_orjson_response,
+    etag_response,
+    orjson_response,
+)
+from src.cache.config import CacheKey, CacheTTL
+from src.cache.service import make_cache_key
 from src.graph.export import (
+    export_cypher,
     export_path_for_visualization,
+    export_subgraph_dict_for_visualization,
     export_subgraph_for_visualization,
 )
 from src.graph.metrics import compute_node_metrics, compute_pagerank_for_subgraph
+from src.graph.models import ConnectedComponent, Cycle, GraphMetrics, Path, Subgraph
 from src.graph.relationship_search import find_connections
 from src.graph.shared_directors import find_director_network_path, find_shared_directors
-from src.graph.traversal import extract_subgraph, find_all_paths, find_shortest_path
+from src.graph.traversal import extract_subgraph, find_shortest_path, iter_all_paths
+from src.infrastructure.database.neo4j_client import neo4j_client
+from src.infrastructure.logging import get_logger
+from src.tenancy.context import get_current_tenant
+
+logger = get_logger(__name__)
 
-router = APIRouter(prefix="/graph", tags=["graph"])
+router = APIRouter(prefix="/graph", tags=["graph"], default_response_class=ORJSONResponse)
 
 
 class PathRequest(BaseModel):
@@ -26,20 +45,87 @@ class PathRequest(BaseModel):
     rel_types: Optional[List[str]] = None
 
 
+class PathList(BaseModel):
+    paths: List[Path]
+    count: int
+
+
+class CycleList(BaseModel):
+    cycles: List[Cycle]
+    count: int
+
+
+class ComponentList(BaseModel):
+    components: List[ConnectedComponent]
+    count: int
+
+
+def _model_response(model: BaseModel) -> Response:
+    """Serialize a model straight to JSON bytes (no intermediate dicts)."""
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _split_csv(value: Optional[str]) -> Optional[List[str]]:
+    """Split a comma-separated query parameter, dropping empty items."""
+    if not value:
+        return None
+    return [item for item in (part.strip() for part in value.split(",")) if item] or None
+
+
+def _subgraph_content(node_id: str, subgraph_result, format: str):
+    """Render an extract_subgraph result (Subgraph, cached dict or JSON string) in the requested format."""
+    # A non-empty string is a JSON-encoded subgraph. The cypher export needs
+    # typed models, so decode straight into them; other formats use the dict form.
+    if isinstance(subgraph_result, str) and subgraph_result.strip():
+        if format == "cypher":
+            try:
+                subgraph_result = Subgraph.model_validate_json(subgraph_result)
+            except ValidationError:
+                subgraph_result = None
+        else:
+            try:
+                subgraph_result = orjson.loads(subgraph_result)
+            except orjson.JSONDecodeError:
+                subgraph_result = None
+
+    # Handle case where cache returns a dict instead of Subgraph object
+    # (cache serializes/deserializes Pydantic models as dicts)
+    if isinstance(subgraph_result, dict):
+        # The cached dict is already JSON-shaped; only the cypher export needs
+        # typed objects, so skip rebuilding models for the other formats.
+        if format == "json":
+            return subgraph_result
+        if format == "visualization":
+            return export_subgraph_dict_for_visualization(subgraph_result)
+        subgraph = Subgraph.model_validate(subgraph_result)
+    elif isinstance(subgraph_result, Subgraph):
+        subgraph = subgraph_result
+    else:
+        # Return empty subgraph if result is None or invalid
+        subgraph = Subgraph(nodes=[], relationships=[], center_node_id=node_id)
+
+    if format == "visualization":
+        return export_subgraph_for_visualization(subgraph)
+    elif format == "cypher":
+        return {"cypher": export_cypher(subgraph)}
+    else:
+        return subgraph.model_dump(mode="json")
+
+
 @router.get("/subgraph/{node_id}")
 def get_subgraph(
     node_id: str,
     max_hops: int = Query(2, ge=1, le=5),
-    rel_types: Optional[List[str]] = Query(None),
-    node_labels: Optional[List[str]] = Query(None),
-    format: str = Query("json", pattern="^(json|visualization|cypher)$"),
-) -> dict:
-    """Extract N-hop neighborhood subgraph."""
-    from src.graph.models import Subgraph, GraphNode, GraphRelationship
-    from src.tenancy.context import get_current_tenant
-    from src.infrastructure.logging import get_logger
-    
-    logger = get_logger(__name__)
+    rel_types: Optional[str] = Query(None, description="Comma-separated relationship types"),
+    node_labels: Optional[str] = Query(None, description="Comma-separated node labels"),
+    format: Literal["json", "visualization", "cypher"] = Query("json"),
+) -> Response:
+    """
+    Extract N-hop neighborhood subgraph.
+
+    The rendered body is cached per format and tenant, so a repeat request is
+    one Redis GET with no model rebuilding or re-encoding.
+    """
     tenant = get_current_tenant()
     
     logger.info(
@@ -50,121 +136,123 @@ def get_subgraph(
         tenant_id=tenant.tenant_id if tenant else None,
     )
     
+    rel_type_list = _split_csv(rel_types)
+    node_label_list = _split_csv(node_labels)
+
+    # Keyed under graph:subgraph with the node id, so invalidate_graph_cache(node_id) drops it
+    cache_key = make_cache_key(
+        CacheKey.SUBGRAPH,
+        "body",
+        format,
+        node_id,
+        max_hops,
+        ",".join(rel_type_list or ()),
+        ",".join(node_label_list or ()),
+        tenant.tenant_id if tenant else "-",
+    )
     try:
-        subgraph_result = extract_subgraph(node_id, max_hops, rel_types, node_labels)
+        return cached_body_response(
+            cache_key,
+            CacheTTL.SUBGRAPH,
+            lambda: _subgraph_content(
+                node_id, extract_subgraph(node_id, max_hops, rel_type_list, node_label_list), format
+            ),
+        )
     except Exception as e:
         logger.error("Error extracting subgraph", error=str(e), node_id=node_id, exc_info=True)
-        # Return empty subgraph on error
-        subgraph = Subgraph(nodes=[], relationships=[], center_node_id=node_id)
-        if format == "visualization":
-            return export_subgraph_for_visualization(subgraph)
-        return subgraph.model_dump(mode="json")
-    
-    # Handle case where cache returns a dict instead of Subgraph object
-    # (cache serializes/deserializes Pydantic models as dicts)
-    if isinstance(subgraph_result, dict):
-        # Reconstruct nested objects
-        nodes = [GraphNode(**n) if isinstance(n, dict) else n for n in subgraph_result.get("nodes", [])]
-        relationships = [GraphRelationship(**r) if isinstance(r, dict) else r for r in subgraph_result.get("relationships", [])]
-        subgraph = Subgraph(
-            nodes=nodes,
-            relationships=relationships,
-            center_node_id=subgraph_result.get("center_node_id")
-        )
-    elif isinstance(subgraph_result, str) and subgraph_result.strip():
-        # If it's a non-empty string, try to parse it as JSON
-        import json
-        try:
-            data = json.loads(subgraph_result)
-            nodes = [GraphNode(**n) for n in data.get("nodes", [])]
-            relationships = [GraphRelationship(**r) for r in data.get("relationships", [])]
-            subgraph = Subgraph(
-                nodes=nodes,
-                relationships=relationships,
-                center_node_id=data.get("center_node_id")
-            )
-        except json.JSONDecodeError:
-            # If JSON parsing fails, return empty subgraph
-            subgraph = Subgraph(nodes=[], relationships=[], center_node_id=node_id)
-    else:
-        # If it's already a Subgraph object or None/empty, use it directly
-        if isinstance(subgraph_result, Subgraph):
-            subgraph = subgraph_result
-        else:
-            # Return empty subgraph if result is None or invalid
-            subgraph = Subgraph(nodes=[], relationships=[], center_node_id=node_id)
-
-    if format == "visualization":
-        return export_subgraph_for_visualization(subgraph)
-    elif format == "cypher":
-        from src.graph.export import export_cypher
+        # Return empty subgraph on error (not cached)
+        return orjson_response(_subgraph_content(node_id, None, format))
 
-        return {"cypher": export_cypher(subgraph)}
-    else:
-        return subgraph.model_dump(mode="json")
 
-
-@router.post("/path/shortest")
-def get_shortest_path(body: PathRequest) -> dict:
+@router.post("/path/shortest", response_model=Path)
+def get_shortest_path(body: PathRequest) -> Response:
     """Find shortest path between two nodes."""
     path = find_shortest_path(body.start_id, body.end_id, body.max_depth, body.rel_types)
     if not path:
         raise HTTPException(status_code=404, detail="No path found")
-    return path.model_dump(mode="json")
+    # Cache hits come back as plain dicts
+    return _model_response(Path.model_validate(path))
 
 
-@router.post("/path/all")
+@router.post("/path/all", response_model=PathList)
 def get_all_paths(
     body: PathRequest,
     limit: int = Query(100, ge=1, le=1000),
-) -> dict:
-    """Find all paths between two nodes."""
-    paths = find_all_paths(body.start_id, body.end_id, body.max_depth, limit, body.rel_types)
-    return {"paths": [p.model_dump(mode="json") for p in paths], "count": len(paths)}
+) -> Response:
+    """
+    Find all paths between two nodes.
 
+    The body is streamed one path at a time as Neo4j returns them, so memory
+    stays at one path instead of up to `limit` paths plus their encoded copy.
+    The query runs and its first record is read before the response starts,
+    so query errors and timeouts still surface as an HTTP error.
+    """
+    paths = iter_all_paths(body.start_id, body.end_id, body.max_depth, limit, body.rel_types)
+    first = next(paths, None)
+
+    def _chunks() -> Iterator[bytes]:
+        yield b'{"paths":['
+        count = 0
+        try:
+            for path in itertools.chain((first,) if first is not None else (), paths):
+                if count:
+                    yield b","
+                yield path.model_dump_json().encode()
+                count += 1
+        except Exception:
+            # Headers are already sent; abort the response (the client sees a
+            # broken transfer, not a well-formed partial body)
+            logger.exception(
+                "All-paths stream failed", start_id=body.start_id, end_id=body.end_id, paths_sent=count
+            )
+            raise
+        finally:
+            # Release the Neo4j session even if the client disconnects early
+            paths.close()
+        yield b'],"count":%d}' % count
 
-@router.get("/cycles")
+    return StreamingResponse(_chunks(), media_type="application/json")
+
+
+@router.get("/cycles", response_model=CycleList)
 def get_cycles(
     node_id: Optional[str] = None,
     max_depth: int = Query(10, ge=2, le=20),
-    rel_types: Optional[List[str]] = Query(None),
-) -> dict:
+    rel_types: Optional[str] = Query(None, description="Comma-separated relationship types"),
+) -> Response:
     """Detect cycles in graph."""
-    cycles = detect_cycles(node_id, max_depth, rel_types)
-    return {"cycles": [c.model_dump(mode="json") for c in cycles], "count": len(cycles)}
+    cycles = detect_cycles(node_id, max_depth, _split_csv(rel_types))
+    return _model_response(CycleList.model_construct(cycles=cycles, count=len(cycles)))
 
 
-@router.get("/components")
+@router.get("/components", response_model=ComponentList)
 def get_components(
     node_label: Optional[str] = None,
-    rel_types: Optional[List[str]] = None,
+    rel_types: Optional[str] = Query(None, description="Comma-separated relationship types"),
     min_size: int = Query(2, ge=1),
-) -> dict:
+) -> Response:
     """Find connected components."""
-    components = find_connected_components(node_label, rel_types, min_size)
-    return {
-        "components": [c.model_dump(mode="json") for c in components],
-        "count": len(components),
-    }
+    components = find_connected_components(node_label, _split_csv(rel_types), min_size)
+    return _model_response(ComponentList.model_construct(components=components, count=len(components)))
 
 
-@router.get("/components/node/{node_id}")
-def get_node_component(node_id: str) -> dict:
+@router.get("/components/node/{node_id}", response_model=ConnectedComponent)
+def get_node_component(node_id: str) -> Response:
     """Get connected component containing a specific node."""
     component = get_component_for_node(node_id)
     if not component:
         raise HTTPException(status_code=404, detail="Node not found or isolated")
-    return component.model_dump(mode="json")
+    return _model_response(component)
 
 
-@router.get("/metrics/{node_id}")
+@router.get("/metrics/{node_id}", response_model=GraphMetrics)
 def get_metrics(
     node_id: str,
     include_centrality: bool = Query(True),
-) -> dict:
+) -> Response:
     """Compute graph metrics for a node."""
     metrics = compute_node_metrics(node_id, include_centrality)
-    return metrics.model_dump(mode="json")
+    return _model_response(metrics)
 
 
 @router.post("/metrics/pagerank")
@@ -192,7 +280,7 @@ def get_connections(
     entity_b_id: str,
     max_depth: int = Query(5, ge=1, le=10),
     include_all_paths: bool = Query(False),
-    format: str = Query("json", pattern="^(json|visualization)$"),
+    format: Literal["json", "visualization"] = Query("json"),
 ) -> dict:
     """
     Find how two entities are connected.
@@ -202,19 +290,19 @@ def get_connections(
     connections = find_connections(entity_a_id, entity_b_id, max_depth, include_all_paths)
 
     if format == "visualization":
-        # Return visualization-ready format
-        result = {
+        # Return visualization-ready format with each connection's metadata merged in
+        return {
             "entity_a_id": entity_a_id,
             "entity_b_id": entity_b_id,
-            "connections": [],
+            "connections": [
+                export_path_for_visualization(conn.path) | {
+                    "strength_score": conn.strength_score,
+                    "connection_type": conn.connection_type,
+                    "details": conn.details,
+                }
+                for conn in connections
+            ],
         }
-        for conn in connections:
-            vis_data = export_path_for_visualization(conn.path)
-            vis_data["strength_score"] = conn.strength_score
-            vis_data["connection_type"] = conn.connection_type
-            vis_data["details"] = conn.details
-            result["connections"].append(vis_data)
-        return result
     else:
         return {
             "entity_a_id": entity_a_id,
@@ -255,101 +343,123 @@ def get_director_path(entity_a_id: str, entity_b_id: str) -> dict:
 
 
 @router.get("/node/{node_id}/details")
-def get_node_details(node_id: str) -> dict:
-    """Get detailed information about a node including connections and owners."""
-    from src.infrastructure.database.neo4j_client import neo4j_client
-    
-    # Get node basic info
-    node_query = """
+def get_node_details(node_id: str) -> Response:
+    """
+    Get detailed information about a node including connections and owners.
+
+    Repeat views within CacheTTL.NODE_DETAILS are served from Redis per tenant;
+    invalidate_graph_cache(node_id) drops the entry.
+    """
+    tenant = get_current_tenant()
+    cache_key = make_cache_key(CacheKey.NODE_DETAILS, node_id, tenant.tenant_id if tenant else "-")
+    return cached_body_response(cache_key, CacheTTL.NODE_DETAILS, lambda: _node_details(node_id))
+
+
+def _node_details(node_id: str) -> dict:
+    """Fetch a node with its owners and 1-hop connections."""
+    # Node, owners and 1-hop connections in one round-trip, already shaped as
+    # response maps. The outer WHERE comes first so the tenant filter lands
+    # on the root node 'n'.
+    query = """
     MATCH (n {id: $node_id})
-    RETURN n, labels(n) as labels
-    LIMIT 1
+    WHERE n.id IS NOT NULL
+    WITH n LIMIT 1
+    CALL {
+        WITH n
+        OPTIONAL MATCH (n)<-[:OWNS]-(owner)
+        WHERE 'Business' IN labels(n)
+        WITH n, owner LIMIT 20
+        RETURN collect(CASE WHEN owner IS NULL THEN NULL ELSE {
+            id: coalesce(owner.id, ''),
+            name: coalesce(owner.name, ''),
+            labels: labels(owner),
+            properties: properties(owner),
+            ownership_percentage: head([(owner)-[r:OWNS]->(n) | r.percentage])
+        } END) AS owners
+    }
+    CALL {
+        WITH n
+        OPTIONAL MATCH (n)-[r]-(connected)
+        WITH r, connected LIMIT 50
+        RETURN collect(CASE WHEN connected IS NULL THEN NULL ELSE {
+            id: coalesce(connected.id, ''),
+            name: coalesce(connected.name, connected.id, ''),
+            labels: labels(connected),
+            properties: properties(connected),
+            relationship_type: type(r),
+            relationship_properties: properties(r)
+        } END) AS connections
+    }
+    RETURN {
+        id: $node_id,
+        name: coalesce(n.name, $node_id),
+        labels: labels(n),
+        properties: properties(n)
+    } AS node, owners, connections
     """
-    node_rows = neo4j_client.execute_cypher(node_query, {"node_id": node_id})
-    if not node_rows:
+    rows = neo4j_client.execute_cypher(query, {"node_id": node_id}, node_alias="n")
+    if not rows:
         raise HTTPException(status_code=404, detail="Node not found")
     
-    node_data = node_rows[0]
-    node_props = dict(node_data.get("n", {}))
-    labels = node_data.get("labels", [])
-    
-    # Get owners (if Business)
-    owners = []
-    if "Business" in labels:
-        owners_query = """
-        MATCH (b:Business {id: $node_id})<-[:OWNS]-(owner)
-        RETURN owner, labels(owner) as owner_labels, 
-               [(owner)-[r:OWNS]->(b) | r.percentage] as ownership_percentages
-        LIMIT 20
-        """
-        owners_rows = neo4j_client.execute_cypher(owners_query, {"node_id": node_id})
-        for row in owners_rows:
-            owner_props = dict(row.get("owner", {}))
-            owner_labels = row.get("owner_labels", [])
-            percentages = row.get("ownership_percentages", [])
-            owners.append({
-                "id": owner_props.get("id", ""),
-                "name": owner_props.get("name", ""),
-                "labels": owner_labels,
-                "properties": owner_props,
-                "ownership_percentage": percentages[0] if percentages else None,
-            })
-    
-    # Get direct connections (1-hop neighbors)
-    connections_query = """
-    MATCH (n {id: $node_id})-[r]-(connected)
-    RETURN connected, labels(connected) as connected_labels, 
-           type(r) as rel_type, properties(r) as rel_props
-    LIMIT 50
-    """
-    connections_rows = neo4j_client.execute_cypher(connections_query, {"node_id": node_id})
-    connections = []
-    for row in connections_rows:
-        connected_props = dict(row.get("connected", {}))
-        connected_labels = row.get("connected_labels", [])
-        connections.append({
-            "id": connected_props.get("id", ""),
-            "name": connected_props.get("name", connected_props.get("id", "")),
-            "labels": connected_labels,
-            "properties": connected_props,
-            "relationship_type": row.get("rel_type", ""),
-            "relationship_properties": row.get("rel_props", {}),
-        })
-    
-    return {
-        "node": {
-            "id": node_id,
-            "name": node_props.get("name", node_id),
-            "labels": labels,
-            "properties": node_props,
-        },
-        "owners": owners,
-        "connections": connections,
-        "owner_count": len(owners),
-        "connection_count": len(connections),
-    }
+    row = rows[0]
+    row["owner_count"] = len(row["owners"])
+    row["connection_count"] = len(row["connections"])
+    return row
+
+
+def _count_past_end(count_query: str, params: dict, node_alias: str, offset: int) -> int:
+    """Total for an empty page: zero unless the page started past the last row."""
+    if offset == 0:
+        return 0
+    count_rows = neo4j_client.execute_cypher(count_query, params, node_alias=node_alias)
+    return count_rows[0]["total"] if count_rows else 0
 
 
 @router.get("/transactions")
 def list_transactions(
+    request: Request,
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
     search: Optional[str] = Query(None),
     transaction_type: Optional[str] = Query(None),
-) -> dict:
-    """List all transactions with pagination and optional filters."""
-    from src.infrastructure.database.neo4j_client import neo4j_client
-    from src.tenancy.context import get_current_tenant
-    from src.infrastructure.logging import get_logger
-    
-    logger = get_logger(__name__)
+) -> Response:
+    """
+    List all transactions with pagination and optional filters.
+
+    Pages are cached per tenant for CacheTTL.LIST_RESPONSE and carry an ETag;
+    a poll with a matching If-None-Match gets an empty 304.
+    """
     tenant = get_current_tenant()
-    logger.info(
+    logger.debug(
         "Transactions endpoint called",
         has_tenant=tenant is not None,
         tenant_id=tenant.tenant_id if tenant else None,
     )
-    
+    cache_params = {
+        "limit": limit,
+        "offset": offset,
+        "search": search,
+        "transaction_type": transaction_type,
+        "tenant_id": tenant.tenant_id if tenant else None,
+    }
+    return etag_response(
+        request,
+        cached_orjson_response(
+            "graph_transactions",
+            cache_params,
+            lambda: _transactions_page(limit, offset, search, transaction_type),
+        ),
+    )
+
+
+def _transactions_page(
+    limit: int,
+    offset: int,
+    search: Optional[str],
+    transaction_type: Optional[str],
+) -> dict:
+    """Fetch one page of transactions with the total match count."""
+    tenant = get_current_tenant()
     conditions = []
     params = {"limit": limit, "offset": offset}
     
@@ -362,40 +472,34 @@ def list_transactions(
     
     where_clause = " AND ".join(conditions) if conditions else "1=1"
     
-    # Get total count - use node_alias='t' to match the Transaction alias
-    count_query = f"MATCH (t:Transaction) WHERE {where_clause} RETURN count(t) as total"
-    logger.info("Executing count query", query=count_query, params=params, tenant_id=tenant.tenant_id if tenant else None)
-    count_rows = neo4j_client.execute_cypher(count_query, params, node_alias="t")
-    total = count_rows[0]["total"] if count_rows else 0
-    logger.info("Count query result", total=total, tenant_id=tenant.tenant_id if tenant else None)
-    
-    # Get transactions - use node_alias='t' to match the Transaction alias
+    # Count and page in one round-trip; the Transaction alias is 't' for tenant filtering
     query = f"""
     MATCH (t:Transaction)
     WHERE {where_clause}
-    OPTIONAL MATCH (t)-[:INVOLVES]->(p:Person)
-    RETURN t, collect(DISTINCT {{id: p.id, name: p.name}}) as people
-    ORDER BY t.date DESC, t.id ASC
-    SKIP $offset LIMIT $limit
+    WITH t ORDER BY t.date DESC, t.id ASC
+    WITH collect(t) AS matched
+    WITH size(matched) AS total, matched[$offset..$offset + $limit] AS page
+    UNWIND page AS t
+    RETURN total, {{
+        id: coalesce(t.id, ''),
+        amount: t.amount,
+        currency: coalesce(t.currency, 'KES'),
+        date: t.date,
+        type: t.type,
+        description: coalesce(t.description, ''),
+        source_provider: coalesce(t.source_provider, ''),
+        people: apoc.coll.toSet([(t)-[:INVOLVES]->(p:Person) | {{id: p.id, name: p.name}}]),
+        properties: properties(t)
+    }} AS tx
     """
-    logger.info("Executing transactions query", query_preview=query[:200], params=params, tenant_id=tenant.tenant_id if tenant else None)
+    logger.debug("Executing transactions query", query_preview=query[:200], params=params, tenant_id=tenant.tenant_id if tenant else None)
     rows = neo4j_client.execute_cypher(query, params, node_alias="t")
-    logger.info("Transactions query result", row_count=len(rows), tenant_id=tenant.tenant_id if tenant else None)
+    total = rows[0]["total"] if rows else _count_past_end(
+        f"MATCH (t:Transaction) WHERE {where_clause} RETURN count(t) as total", params, "t", offset
+    )
+    logger.debug("Transactions query result", row_count=len(rows), total=total, tenant_id=tenant.tenant_id if tenant else None)
     
-    transactions = []
-    for row in rows:
-        tx_props = dict(row["t"])
-        transactions.append({
-            "id": tx_props.get("id", ""),
-            "amount": tx_props.get("amount"),
-            "currency": tx_props.get("currency", "KES"),
-            "date": tx_props.get("date"),
-            "type": tx_props.get("type"),
-            "description": tx_props.get("description", ""),
-            "source_provider": tx_props.get("source_provider", ""),
-            "people": row.get("people", []),
-            "properties": tx_props,
-        })
+    transactions = [row["tx"] for row in rows]
     
     return {
         "transactions": transactions,
@@ -407,13 +511,27 @@ def list_transactions(
 
 @router.get("/people")
 def list_people(
+    request: Request,
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
     search: Optional[str] = Query(None),
-) -> dict:
-    """List all people with pagination and optional search."""
-    from src.infrastructure.database.neo4j_client import neo4j_client
-    
+) -> Response:
+    """List all people with pagination and optional search (cached and ETagged like /transactions)."""
+    tenant = get_current_tenant()
+    cache_params = {
+        "limit": limit,
+        "offset": offset,
+        "search": search,
+        "tenant_id": tenant.tenant_id if tenant else None,
+    }
+    return etag_response(
+        request,
+        cached_orjson_response("graph_people", cache_params, lambda: _people_page(limit, offset, search)),
+    )
+
+
+def _people_page(limit: int, offset: int, search: Optional[str]) -> dict:
+    """Fetch one page of people, busiest first, with the total match count."""
     conditions = []
     params = {"limit": limit, "offset": offset}
     
@@ -423,31 +541,29 @@ def list_people(
     
     where_clause = " AND ".join(conditions) if conditions else "1=1"
     
-    # Get total count - use node_alias='p' to match the Person alias
-    count_query = f"MATCH (p:Person) WHERE {where_clause} RETURN count(p) as total"
-    count_rows = neo4j_client.execute_cypher(count_query, params, node_alias="p")
-    total = count_rows[0]["total"] if count_rows else 0
-    
-    # Get people with transaction counts - use node_alias='p' to match the Person alias
+    # Count and page in one round-trip; the Person alias is 'p' for tenant filtering.
+    # transaction_count is denormalized on the node (see refresh_person_transaction_count_query)
     query = f"""
     MATCH (p:Person)
     WHERE {where_clause}
-    OPTIONAL MATCH (p)<-[:INVOLVES]-(t:Transaction)
-    RETURN p, count(DISTINCT t) as transaction_count
+    WITH p, coalesce(p.transaction_count, 0) as transaction_count
     ORDER BY transaction_count DESC, p.name ASC
-    SKIP $offset LIMIT $limit
+    WITH collect({{p: p, transaction_count: transaction_count}}) AS matched
+    WITH size(matched) AS total, matched[$offset..$offset + $limit] AS page
+    UNWIND page AS row
+    RETURN total, {{
+        id: coalesce(row.p.id, ''),
+        name: coalesce(row.p.name, 'Unknown'),
+        transaction_count: row.transaction_count,
+        properties: properties(row.p)
+    }} AS person
     """
     rows = neo4j_client.execute_cypher(query, params, node_alias="p")
+    total = rows[0]["total"] if rows else _count_past_end(
+        f"MATCH (p:Person) WHERE {where_clause} RETURN count(p) as total", params, "p", offset
+    )
     
-    people = []
-    for row in rows:
-        person_props = dict(row["p"])
-        people.append({
-            "id": person_props.get("id", ""),
-            "name": person_props.get("name", "Unknown"),
-            "transaction_count": row.get("transaction_count", 0),
-            "properties": person_props,
-        })
+    people = [row["person"] for row in rows]
     
     return {
         "people": people,
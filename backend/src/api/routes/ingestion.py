@@ -1,5 +1,6 @@
 """Manual trigger API for ingestion and job status."""
-from typing import Any, Optional
+import asyncio
+from typing import Any, BinaryIO, Optional
 from pathlib import Path
 from datetime import datetime
 import shutil
@@ -13,6 +14,9 @@ from src.ingestion.pipeline.tasks import ingest_accounting, ingest_mobile_money
 
 router = APIRouter(prefix="", tags=["ingestion"])
 
+# Copy buffer for uploads; shutil's 64 KiB default means many more read/write syscalls
+_UPLOAD_COPY_BUFFER = 1 << 20
+
 
 class MobileMoneyTrigger(BaseModel):
     path: str = Field(..., description="Server-accessible path to CSV")
@@ -26,6 +30,12 @@ class AccountingTrigger(BaseModel):
     modified_after: Optional[str] = Field(None, description="ISO datetime for incremental sync")
 
 
+def _save_upload(src: BinaryIO, file_path: Path) -> None:
+    """Copy an uploaded (spooled) file to disk; blocking, so run it in a worker thread."""
+    with open(file_path, "wb") as buffer:
+        shutil.copyfileobj(src, buffer, _UPLOAD_COPY_BUFFER)
+
+
 @router.post("/upload-csv")
 async def upload_csv_file(file: UploadFile = File(...)) -> dict:
     """Upload a CSV file and return the server path."""
@@ -39,12 +49,12 @@ async def upload_csv_file(file: UploadFile = File(...)) -> dict:
     
     # Generate unique filename
     file_id = str(uuid.uuid4())
-    file_path = upload_dir / f"{file_id}_{file.filename}"
+    file_path = upload_dir / f"{file_id}_{Path(file.filename).name}"
     
     # Save file
     try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Off the event loop: the copy can take seconds for large statements
+        await asyncio.to_thread(_save_upload, file.file, file_path)
         
         # Return relative path for Docker compatibility
         return {
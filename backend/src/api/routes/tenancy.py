@@ -48,12 +48,15 @@ def get_migration_manager():
     return migration_manager
 
 
+_BEARER_PREFIX = "Bearer "
+
+
 def get_current_user_id(authorization: Optional[str] = Header(None)) -> Optional[str]:
     """Extract user ID from JWT token in Authorization header."""
-    if not authorization:
+    if not authorization or not authorization.startswith(_BEARER_PREFIX):
         return None
     try:
-        token = authorization.replace("Bearer ", "").strip()
+        token = authorization[len(_BEARER_PREFIX):].strip()
         payload = validate_access_token(token)
         if payload:
             return payload.get("sub")
@@ -0,0 +1,78 @@
+"""JSON response helpers."""
+import hashlib
+from decimal import Decimal
+from typing import Any, Callable
+
+import orjson
+from fastapi import Request, Response
+
+from src.cache.config import CacheKey, get_ttl
+from src.cache.service import make_cache_key
+from src.infrastructure.cache.redis_client import redis_client
+
+
+def _default(obj: Any) -> Any:
+    """Encode types orjson does not handle natively (NUMERIC columns, sets)."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def orjson_response(content: Any, status_code: int = 200) -> Response:
+    """
+    Encode content with orjson in one pass.
+
+    Skips FastAPI's jsonable_encoder walk and the stdlib json encoder; datetimes,
+    UUIDs and numpy scalars are handled natively by orjson.
+    """
+    return Response(
+        content=orjson.dumps(content, default=_default, option=orjson.OPT_SERIALIZE_NUMPY),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def cached_body_response(cache_key: str, ttl: int, build: Callable[[], Any]) -> Response:
+    """
+    Serve an orjson-encoded body from Redis, building and caching it on a miss.
+
+    The encoded body is cached as-is, so a hit is one GET with no decode/re-encode.
+    """
+    cached = redis_client.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    body = orjson.dumps(build(), default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    redis_client.set(cache_key, body.decode(), ttl=ttl)
+    return Response(content=body, media_type="application/json")
+
+
+def cached_orjson_response(name: str, params: dict, build: Callable[[], Any]) -> Response:
+    """
+    Serve a read-only list endpoint from Redis (see cached_body_response).
+
+    Cached under api:list:<name>:<params hash>; invalidate with
+    CacheService.invalidate_pattern(CacheKey.LIST_RESPONSE, f"{name}:*").
+    """
+    digest = hashlib.blake2b(repr(sorted(params.items())).encode(), digest_size=12).hexdigest()
+    cache_key = make_cache_key(CacheKey.LIST_RESPONSE, name, digest)
+    return cached_body_response(cache_key, get_ttl(CacheKey.LIST_RESPONSE), build)
+
+
+def etag_response(request: Request, response: Response) -> Response:
+    """
+    Tag a fully built response with an ETag of its body.
+
+    Returns an empty 304 when the client's If-None-Match already names it, so
+    pollers re-fetching an unchanged page skip the body transfer.
+    """
+    etag = '"%s"' % hashlib.blake2b(response.body, digest_size=16).hexdigest()
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
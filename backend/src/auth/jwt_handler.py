@@ -1,4 +1,6 @@
 """JWT token generation and validation."""
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
@@ -18,6 +20,15 @@ REFRESH = "refresh"
 EXP = "exp"
 ROLE = "role"
 
+# Verified access-token payloads, reused for a short while so a burst of
+# requests with the same token pays for one signature check. Entries never
+# outlive the token's own exp claim. Only valid tokens are cached.
+ACCESS_CACHE_TTL_SECONDS = 60
+ACCESS_CACHE_MAX_SIZE = 10_000
+
+_access_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+_access_cache_lock = threading.Lock()
+
 
 def _now() -> datetime:
     return datetime.now(timezone.utc)
@@ -48,9 +59,21 @@ def decode_token(token: str) -> Optional[dict[str, Any]]:
 
 
 def validate_access_token(token: str) -> Optional[dict[str, Any]]:
+    now = time.time()
+    entry = _access_cache.get(token)
+    if entry and entry[0] > now:
+        return entry[1]
+
     data = decode_token(token)
     if not data or data.get(TYPE) != ACCESS or not data.get(SUB):
         return None
+
+    expires_at = min(now + ACCESS_CACHE_TTL_SECONDS, float(data.get(EXP, now)))
+    with _access_cache_lock:
+        if len(_access_cache) >= ACCESS_CACHE_MAX_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            _access_cache.pop(next(iter(_access_cache)), None)
+        _access_cache[token] = (expires_at, data)
     return data
 
 
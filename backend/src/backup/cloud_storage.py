@@ -8,6 +8,17 @@ from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Parallel multipart upload defaults (overridable via config
+# "upload_concurrency" / "multipart_chunksize_mb")
+DEFAULT_UPLOAD_CONCURRENCY = 8
+DEFAULT_MULTIPART_CHUNKSIZE_MB = 8
+
+# IO buffer per request; SDK defaults (256 KiB for GCS) cost extra round-trips
+# on multi-GB dumps ("upload_buffer_bytes" / "download_buffer_bytes")
+DEFAULT_UPLOAD_BUFFER_BYTES = 8 * 1024 * 1024
+DEFAULT_DOWNLOAD_BUFFER_BYTES = 1536 * 1024
+_GCS_CHUNK_MULTIPLE = 256 * 1024  # GCS resumable chunk sizes must be multiples of 256 KiB
+
 
 class CloudProvider(Enum):
     """Supported cloud storage providers."""
@@ -31,37 +42,62 @@ class CloudStorageBackup:
         self.provider = provider
         self.config = config
         self._client = None
+        self.upload_concurrency = int(config.get("upload_concurrency", DEFAULT_UPLOAD_CONCURRENCY))
+        self.chunk_size = int(config.get("multipart_chunksize_mb", DEFAULT_MULTIPART_CHUNKSIZE_MB)) << 20
+        self.upload_buffer = int(config.get("upload_buffer_bytes", DEFAULT_UPLOAD_BUFFER_BYTES))
+        self.download_buffer = int(config.get("download_buffer_bytes", DEFAULT_DOWNLOAD_BUFFER_BYTES))
+
+    @staticmethod
+    def _gcs_chunk(size: int) -> int:
+        """Round a buffer size down to a valid GCS chunk size."""
+        return max(_GCS_CHUNK_MULTIPLE, size - size % _GCS_CHUNK_MULTIPLE)
 
     def _get_s3_client(self):
-        """Get AWS S3 client."""
+        """Get AWS S3 client (created once; boto3 clients are thread-safe)."""
+        if self._client is not None:
+            return self._client
         try:
             import boto3
-            return boto3.client(
+            from botocore.config import Config
+
+            self._client = boto3.client(
                 "s3",
                 aws_access_key_id=self.config.get("aws_access_key_id"),
                 aws_secret_access_key=self.config.get("aws_secret_access_key"),
                 region_name=self.config.get("region", "us-east-1"),
+                # Enough pooled connections for every parallel part stream
+                config=Config(
+                    tcp_keepalive=True,
+                    max_pool_connections=max(32, self.upload_concurrency),
+                ),
             )
+            return self._client
         except ImportError:
             logger.error("boto3 not installed")
             raise
 
     def _get_gcs_client(self):
-        """Get Google Cloud Storage client."""
+        """Get Google Cloud Storage client (created once)."""
+        if self._client is not None:
+            return self._client
         try:
             from google.cloud import storage
-            return storage.Client(project=self.config.get("project_id"))
+            self._client = storage.Client(project=self.config.get("project_id"))
+            return self._client
         except ImportError:
             logger.error("google-cloud-storage not installed")
             raise
 
     def _get_azure_client(self):
-        """Get Azure Blob Storage client."""
+        """Get Azure Blob Storage client (created once)."""
+        if self._client is not None:
+            return self._client
         try:
             from azure.storage.blob import BlobServiceClient
-            return BlobServiceClient.from_connection_string(
+            self._client = BlobServiceClient.from_connection_string(
                 self.config.get("connection_string")
             )
+            return self._client
         except ImportError:
             logger.error("azure-storage-blob not installed")
             raise
@@ -79,22 +115,48 @@ class CloudStorageBackup:
         """
         try:
             if self.provider == CloudProvider.S3:
+                from boto3.s3.transfer import TransferConfig
+
                 client = self._get_s3_client()
                 bucket = self.config.get("bucket")
-                client.upload_file(local_path, bucket, remote_path)
+                # Multipart parts are sent over parallel streams
+                transfer_config = TransferConfig(
+                    multipart_threshold=self.chunk_size,
+                    multipart_chunksize=self.chunk_size,
+                    max_concurrency=self.upload_concurrency,
+                    io_chunksize=self.upload_buffer,
+                    use_threads=True,
+                )
+                client.upload_file(local_path, bucket, remote_path, Config=transfer_config)
                 logger.info("Uploaded to S3", bucket=bucket, key=remote_path)
 
             elif self.provider == CloudProvider.GCS:
                 client = self._get_gcs_client()
                 bucket = client.bucket(self.config.get("bucket"))
                 blob = bucket.blob(remote_path)
-                blob.upload_from_filename(local_path)
+                if os.path.getsize(local_path) > self.chunk_size:
+                    from google.cloud.storage import transfer_manager
+
+                    # XML multipart upload with chunks sent in parallel
+                    transfer_manager.upload_chunks_concurrently(
+                        local_path,
+                        blob,
+                        chunk_size=self.chunk_size,
+                        max_workers=self.upload_concurrency,
+                    )
+                else:
+                    blob.chunk_size = self._gcs_chunk(self.upload_buffer)
+                    blob.upload_from_filename(local_path)
                 logger.info("Uploaded to GCS", bucket=self.config.get("bucket"), blob=remote_path)
 
             elif self.provider == CloudProvider.AZURE:
                 client = self._get_azure_client()
                 container = client.get_container_client(self.config.get("container"))
-                blob = container.upload_blob(name=remote_path, data=open(local_path, "rb"))
+                blob = container.upload_blob(
+                    name=remote_path,
+                    data=open(local_path, "rb"),
+                    max_concurrency=self.upload_concurrency,
+                )
                 logger.info("Uploaded to Azure", container=self.config.get("container"), blob=remote_path)
 
             else:
@@ -120,15 +182,22 @@ class CloudStorageBackup:
         """
         try:
             if self.provider == CloudProvider.S3:
+                from boto3.s3.transfer import TransferConfig
+
                 client = self._get_s3_client()
                 bucket = self.config.get("bucket")
-                client.download_file(bucket, remote_path, local_path)
+                client.download_file(
+                    bucket,
+                    remote_path,
+                    local_path,
+                    Config=TransferConfig(io_chunksize=self.download_buffer),
+                )
                 logger.info("Downloaded from S3", bucket=bucket, key=remote_path)
 
             elif self.provider == CloudProvider.GCS:
                 client = self._get_gcs_client()
                 bucket = client.bucket(self.config.get("bucket"))
-                blob = bucket.blob(remote_path)
+                blob = bucket.blob(remote_path, chunk_size=self._gcs_chunk(self.download_buffer))
                 blob.download_to_filename(local_path)
                 logger.info("Downloaded from GCS", bucket=self.config.get("bucket"), blob=remote_path)
 
@@ -166,15 +166,25 @@ class Neo4jBackup:
 
     def list_backups(self) -> List[Dict[str, str]]:
         """List all available backups."""
-        backups = []
-        for backup_file in self.backup_dir.glob("*.dump.gz"):
-            stat = backup_file.stat()
-            backups.append({
-                "file": str(backup_file),
+        # One scandir pass; sort on the raw mtime and format only the results
+        try:
+            with os.scandir(self.backup_dir) as entries:
+                found = [
+                    (entry.path, entry.stat())
+                    for entry in entries
+                    if entry.name.endswith(".dump.gz") and not entry.name.startswith(".")
+                ]
+        except FileNotFoundError:
+            return []
+        found.sort(key=lambda item: item[1].st_mtime, reverse=True)
+        return [
+            {
+                "file": path,
                 "size": stat.st_size,
                 "created": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            })
-        return sorted(backups, key=lambda x: x["created"], reverse=True)
+            }
+            for path, stat in found
+        ]
 
     def get_latest_backup(self) -> Optional[str]:
         """Get the latest backup file path."""
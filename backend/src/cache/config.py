@@ -14,6 +14,11 @@ class CacheKey(Enum):
     BUSINESS = "business"
     SUBGRAPH = "graph:subgraph"
     PATH = "graph:path"
+    ML_FEATURES = "ml:features"
+    TIME_SERIES = "anomaly:series"
+    LIST_RESPONSE = "api:list"
+    FRAUD_SCAN = "fraud:scan"
+    NODE_DETAILS = "graph:node"
 
 
 class CacheTTL:
@@ -47,6 +52,21 @@ class CacheTTL:
     # Path queries: 10 minutes
     PATH = 10 * 60  # 10 minutes
 
+    # ML feature vectors: 15 minutes
+    ML_FEATURES = 15 * 60  # 15 minutes
+
+    # Per-business metric time series: 5 minutes
+    TIME_SERIES = 5 * 60  # 5 minutes
+
+    # Dashboard-polled list endpoints: a few seconds
+    LIST_RESPONSE = 5  # 5 seconds
+
+    # Repeat fraud scans of the same business: 30 seconds
+    FRAUD_SCAN = 30  # 30 seconds
+
+    # Node detail panel (re-opened often in a UI session): 30 seconds
+    NODE_DETAILS = 30  # 30 seconds
+
 
 def get_ttl(key_type: CacheKey, default: Optional[int] = None) -> int:
     """Get TTL for a cache key type."""
@@ -59,5 +79,10 @@ def get_ttl(key_type: CacheKey, default: Optional[int] = None) -> int:
         CacheKey.BUSINESS: CacheTTL.BUSINESS,
         CacheKey.SUBGRAPH: CacheTTL.SUBGRAPH,
         CacheKey.PATH: CacheTTL.PATH,
+        CacheKey.ML_FEATURES: CacheTTL.ML_FEATURES,
+        CacheKey.TIME_SERIES: CacheTTL.TIME_SERIES,
+        CacheKey.LIST_RESPONSE: CacheTTL.LIST_RESPONSE,
+        CacheKey.FRAUD_SCAN: CacheTTL.FRAUD_SCAN,
+        CacheKey.NODE_DETAILS: CacheTTL.NODE_DETAILS,
     }
     return ttl_map.get(key_type, default or CacheTTL.API_RESPONSE_MEDIUM)
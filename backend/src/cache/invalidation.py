@@ -44,11 +44,13 @@ def invalidate_graph_cache(node_id: Optional[str] = None):
         CacheService.invalidate_pattern(CacheKey.SUBGRAPH, f"*{node_id}*")
         CacheService.invalidate_pattern(CacheKey.PATH, f"*{node_id}*")
         CacheService.invalidate_pattern(CacheKey.GRAPH_QUERY, f"*{node_id}*")
+        CacheService.invalidate_pattern(CacheKey.NODE_DETAILS, f"{node_id}:*")
     else:
         # Invalidate all graph queries
         CacheService.invalidate_pattern(CacheKey.GRAPH_QUERY)
         CacheService.invalidate_pattern(CacheKey.SUBGRAPH)
         CacheService.invalidate_pattern(CacheKey.PATH)
+        CacheService.invalidate_pattern(CacheKey.NODE_DETAILS)
 
     logger.info("Graph cache invalidated", node_id=node_id)
 
@@ -13,6 +13,8 @@ logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+_SCAN_COUNT = 500  # keys examined per SCAN step in pattern deletes
+
 
 def make_cache_key(key_type: CacheKey, *parts: str) -> str:
     """Create a cache key from parts."""
@@ -176,10 +178,16 @@ class CacheService:
     def delete_pattern(pattern: str) -> int:
         """Delete all keys matching pattern."""
         try:
-            keys = redis_client.client.keys(pattern)
-            if keys:
-                return redis_client.client.delete(*keys)
-            return 0
+            # SCAN walks the keyspace incrementally instead of blocking Redis
+            # like KEYS; UNLINK reclaims memory off the Redis main thread
+            deleted = 0
+            cursor = 0
+            while True:
+                cursor, keys = redis_client.client.scan(cursor, match=pattern, count=_SCAN_COUNT)
+                if keys:
+                    deleted += redis_client.client.unlink(*keys)
+                if cursor == 0:
+                    return deleted
         except Exception as e:
             logger.warning("Failed to delete pattern", pattern=pattern, error=str(e))
             return 0
@@ -26,6 +26,7 @@ class Settings(BaseSettings):
     postgres_db: str = "africgraph"
     postgres_user: str = "africgraph"
     postgres_password: str
+    auto_ddl: bool = True  # Create application tables at startup; disable when migrations run separately
     
     # Redis Configuration
     redis_host: str = "redis"
@@ -1,4 +1,5 @@
 """Merge candidates: fetch nodes from Neo4j, block, pairwise composite similarity."""
+import heapq
 from typing import Any, Dict, List, Optional
 
 from src.domain.ontology import NODE_LABELS
@@ -57,5 +58,5 @@ def find_candidates(
         )
         if score >= min_confidence:
             out.append({"node_a_id": a["id"], "node_b_id": b["id"], "confidence": score, "reasons": reasons})
-    out.sort(key=lambda x: -x["confidence"])
-    return out[:limit]
+    # Top-k selection; same order as a full descending sort, without sorting every match
+    return heapq.nlargest(limit, out, key=lambda x: x["confidence"])
@@ -3,6 +3,12 @@ import json
 from typing import Any, Dict, List, Optional
 
 from src.domain.ontology import NODE_LABELS, RELATIONSHIP_TYPES
+from src.infrastructure.database.cypher_queries import refresh_person_transaction_count_query
+
+
+def _involves_endpoints(rels: List[Dict[str, Any]], start_key: str, end_key: str, type_key: str) -> set:
+    """Node ids on either end of INVOLVES relationships (Person counts depend on them)."""
+    return {r[k] for r in rels if r.get(type_key) == "INVOLVES" for k in (start_key, end_key)}
 
 
 def _props_to_dict(p: Any) -> Dict[str, Any]:
@@ -60,21 +66,30 @@ def merge_nodes(
             p = _props_to_dict(rec["props"])
             rels.append({"rid": rid, "rel_type": rt, "props": p, "start_id": start_id, "end_id": end_id})
 
+        # 3) re-point all relationships at the survivor: one UNWIND merge, one batched delete
         moved = []
+        rows = []
         for r in rels:
             # new endpoints: replace merged_id with survivor_id
             new_start = survivor_id if r["start_id"] == merged_id else r["start_id"]
             new_end = survivor_id if r["end_id"] == merged_id else r["end_id"]
             on_create = {**r["props"], "merged_from_id": merged_id}
+            rows.append({"from_id": new_start, "to_id": new_end, "rel_type": r["rel_type"], "on_create": on_create})
+            moved.append({"from_id": r["start_id"], "to_id": r["end_id"], "type": r["rel_type"], "props": r["props"]})
+        if rows:
             tx.run(
-                "MATCH (fn {id: $from_id}), (tn {id: $to_id}) CALL apoc.merge.relationship(fn, $rel_type, {}, tn, $on_create, {}) YIELD rel RETURN 1",
-                {"from_id": new_start, "to_id": new_end, "rel_type": r["rel_type"], "on_create": on_create},
+                "UNWIND $rows AS row MATCH (fn {id: row.from_id}), (tn {id: row.to_id}) "
+                "CALL apoc.merge.relationship(fn, row.rel_type, {}, tn, row.on_create, {}) YIELD rel RETURN count(rel)",
+                {"rows": rows},
             )
-            tx.run("MATCH ()-[r]-() WHERE id(r) = $rid DELETE r", {"rid": r["rid"]})
-            moved.append({"from_id": r["start_id"], "to_id": r["end_id"], "type": r["rel_type"], "props": r["props"]})
+            tx.run("MATCH ()-[r]->() WHERE id(r) IN $rids DELETE r", {"rids": list({r["rid"] for r in rels})})
 
         tx.run(f"MATCH (a:{label} {{id: $mid}}) DETACH DELETE a", {"mid": merged_id})
 
+        person_ids = {survivor_id} | _involves_endpoints(rels, "start_id", "end_id", "rel_type")
+        person_ids.discard(merged_id)
+        tx.run(refresh_person_transaction_count_query(), {"person_ids": list(person_ids)})
+
         return {"merged_props": merged_props, "moved_relationships": moved}
 
     details = neo4j_client.write_transaction(_tx)
@@ -112,25 +127,24 @@ def unmerge(
     def _tx(tx):
         # 1) CREATE (n:Label $props)
         tx.run(f"CREATE (n:{label}) SET n = $props", {"props": merged_props})
-        # 2) CREATE each original relationship (from_id)-[type]-(to_id)
-        for m in moved:
-            t = m.get("type") or ""
-            if t not in RELATIONSHIP_TYPES:
-                continue
+        # 2) CREATE each original relationship (from_id)-[type]-(to_id), batched
+        valid = [m for m in moved if (m.get("type") or "") in RELATIONSHIP_TYPES]
+        if valid:
             tx.run(
-                f"MATCH (a {{id: $from_id}}), (b {{id: $to_id}}) CREATE (a)-[r:{t}]->(b) SET r = $props",
-                {"from_id": m["from_id"], "to_id": m["to_id"], "props": m.get("props") or {}},
+                "UNWIND $rows AS row MATCH (a {id: row.from_id}), (b {id: row.to_id}) "
+                "CALL apoc.create.relationship(a, row.type, row.props, b) YIELD rel RETURN count(rel)",
+                {"rows": [{"from_id": m["from_id"], "to_id": m["to_id"], "type": m["type"], "props": m.get("props") or {}} for m in valid]},
             )
-        # 3) DELETE (other)-[r:type]-(survivor) WHERE r.merged_from_id = merged_id
-        for m in moved:
-            t = m.get("type") or ""
-            if t not in RELATIONSHIP_TYPES:
-                continue
-            other = m["to_id"] if m["from_id"] == merged_id else m["from_id"]
+            # 3) DELETE (other)-[r:type]-(survivor) WHERE r.merged_from_id = merged_id
+            targets = {(m["to_id"] if m["from_id"] == merged_id else m["from_id"], m["type"]) for m in valid}
             tx.run(
-                f"MATCH (o {{id: $oid}})-[r:{t}]-(s {{id: $sid}}) WHERE r.merged_from_id = $mid DELETE r",
-                {"oid": other, "sid": survivor_id, "mid": merged_id},
+                "UNWIND $rows AS row MATCH (o {id: row.oid})-[r]-(s {id: $sid}) "
+                "WHERE type(r) = row.type AND r.merged_from_id = $mid DELETE r",
+                {"rows": [{"oid": oid, "type": t} for oid, t in targets], "sid": survivor_id, "mid": merged_id},
             )
+        # 4) refresh Person.transaction_count on both sides of moved INVOLVES edges
+        person_ids = {merged_id, survivor_id} | _involves_endpoints(valid, "from_id", "to_id", "type")
+        tx.run(refresh_person_transaction_count_query(), {"person_ids": list(person_ids)})
 
     neo4j_client.write_transaction(_tx)
     mark_undone_fn(merge_history_id, "api")
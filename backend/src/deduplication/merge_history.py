@@ -1,13 +1,21 @@
 """Merge history tracking (PostgreSQL) for deduplication and unmerge."""
 import json
+import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from sqlalchemy import text
 
+from src.cache.config import CacheKey
+from src.cache.service import CacheService
 from src.infrastructure.database.postgres_client import postgres_client
 
 TABLE = "merge_history"
+LIST_CACHE_NAME = "merge_history"  # cached GET /deduplication/merge-history pages
+_BULK_PAGE_SIZE = 500
+
+# (merged_id, survivor_id, label, merged_by, confidence, details)
+MergeRow = Tuple[str, str, str, str, Optional[float], Dict[str, Any]]
 
 
 def _serialize(v: Any) -> Any:
@@ -18,6 +26,10 @@ def _serialize(v: Any) -> Any:
     return v
 
 
+def _invalidate_list_cache() -> None:
+    CacheService.invalidate_pattern(CacheKey.LIST_RESPONSE, f"{LIST_CACHE_NAME}:*")
+
+
 def ensure_merge_history_table() -> None:
     sql = f"""
     CREATE TABLE IF NOT EXISTS {TABLE} (
@@ -60,9 +72,39 @@ def insert_merge_record(
             {"merged_id": merged_id, "survivor_id": survivor_id, "label": label, "merged_by": merged_by, "confidence": confidence, "details": payload},
         )
         (jid,) = r.fetchone()
+    _invalidate_list_cache()
     return str(jid)
 
 
+def insert_merge_records_bulk(rows: Sequence[MergeRow]) -> List[str]:
+    """Insert many merge records with one multi-row INSERT per page; returns ids in row order."""
+    ids = [str(uuid.uuid4()) for _ in rows]
+    if not rows:
+        return ids
+    with postgres_client.get_session() as s:
+        for start in range(0, len(rows), _BULK_PAGE_SIZE):
+            values = []
+            params: Dict[str, Any] = {}
+            for i in range(start, min(start + _BULK_PAGE_SIZE, len(rows))):
+                merged_id, survivor_id, label, merged_by, confidence, details = rows[i]
+                values.append(f"(:id{i}, :merged_id{i}, :survivor_id{i}, :label{i}, :merged_by{i}, :confidence{i}, CAST(:details{i} AS jsonb))")
+                params.update({
+                    f"id{i}": ids[i],
+                    f"merged_id{i}": merged_id,
+                    f"survivor_id{i}": survivor_id,
+                    f"label{i}": label,
+                    f"merged_by{i}": merged_by,
+                    f"confidence{i}": confidence,
+                    f"details{i}": json.dumps(details, default=_serialize),
+                })
+            s.execute(
+                text(f"INSERT INTO {TABLE} (id, merged_id, survivor_id, label, merged_by, confidence, details) VALUES {', '.join(values)}"),
+                params,
+            )
+    _invalidate_list_cache()
+    return ids
+
+
 def get_merge_history(
     label: Optional[str] = None,
     merged_id: Optional[str] = None,
@@ -70,9 +112,15 @@ def get_merge_history(
     undone: Optional[bool] = None,
     limit: int = 100,
     offset: int = 0,
+    after_id: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
+    """Newest first. after_id (last id of the previous page) switches to keyset paging; offset is then ignored."""
     conditions = ["1=1"]
     params: Dict[str, Any] = {"limit": limit, "offset": offset}
+    if after_id:
+        conditions.append(f"(merged_at, id) < (SELECT merged_at, id FROM {TABLE} WHERE id = CAST(:after_id AS uuid))")
+        params["after_id"] = after_id
+        params["offset"] = 0
     if label:
         conditions.append("label = :label")
         params["label"] = label
@@ -90,7 +138,7 @@ def get_merge_history(
         r = s.execute(
             text(f"""
             SELECT id, merged_id, survivor_id, label, merged_at, merged_by, confidence, details, undone_at, undone_by
-            FROM {TABLE} WHERE {" AND ".join(conditions)} ORDER BY merged_at DESC LIMIT :limit OFFSET :offset
+            FROM {TABLE} WHERE {" AND ".join(conditions)} ORDER BY merged_at DESC, id DESC LIMIT :limit OFFSET :offset
             """),
             params,
         )
@@ -118,3 +166,4 @@ def mark_undone(record_id: str, undone_by: Optional[str] = None) -> None:
             text(f"UPDATE {TABLE} SET undone_at = now(), undone_by = :ub WHERE id = :id"),
             {"id": record_id, "ub": undone_by or "api"},
         )
+    _invalidate_list_cache()
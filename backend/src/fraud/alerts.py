@@ -6,6 +6,8 @@ from typing import Any, Dict, List, Optional
 
 from sqlalchemy import text
 
+from src.cache.config import CacheKey
+from src.cache.service import CacheService
 from src.infrastructure.database.postgres_client import postgres_client
 from src.infrastructure.logging import get_logger
 
@@ -14,6 +16,11 @@ from .models import AlertSeverity, FraudAlert, FraudPatternHit
 logger = get_logger(__name__)
 
 TABLE = "fraud_alerts"
+LIST_CACHE_NAME = "fraud_alerts"  # cached GET /fraud/alerts pages
+
+
+def _invalidate_list_cache() -> None:
+    CacheService.invalidate_pattern(CacheKey.LIST_RESPONSE, f"{LIST_CACHE_NAME}:*")
 
 
 def ensure_alerts_table() -> None:
@@ -92,6 +99,7 @@ def create_alert_from_hits(business_id: str, hits: List[FraudPatternHit]) -> Opt
             },
         )
         (alert_id,) = r.fetchone()
+    _invalidate_list_cache()
     return FraudAlert(
         id=alert_id,
         business_id=business_id,
@@ -109,11 +117,21 @@ def list_alerts(
     status: Optional[str] = None,
     limit: int = 50,
     offset: int = 0,
+    after_id: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
-    """List alerts, optionally filtered by business and status."""
+    """
+    List alerts, newest first, optionally filtered by business and status.
+
+    after_id: id of the last alert on the previous page. When given, the page
+    starts right after that alert (keyset pagination) and offset is ignored.
+    """
     ensure_alerts_table()
     conditions = ["1=1"]
     params: Dict[str, Any] = {"limit": limit, "offset": offset}
+    if after_id is not None:
+        conditions.append(f"(created_at, id) < (SELECT created_at, id FROM {TABLE} WHERE id = :after_id)")
+        params["after_id"] = after_id
+        params["offset"] = 0
     if business_id:
         conditions.append("business_id = :business_id")
         params["business_id"] = business_id
@@ -128,7 +146,7 @@ def list_alerts(
                        metadata, is_false_positive, status, created_at, updated_at
                 FROM {TABLE}
                 WHERE {" AND ".join(conditions)}
-                ORDER BY created_at DESC
+                ORDER BY created_at DESC, id DESC
                 LIMIT :limit OFFSET :offset
                 """
             ),
@@ -155,7 +173,7 @@ def mark_false_positive(alert_id: int, *, note: Optional[str] = None) -> None:
     """Mark an alert as false positive and close it."""
     ensure_alerts_table()
     with postgres_client.get_session() as s:
-        s.execute(
+        r = s.execute(
             text(
                 f"""
                 UPDATE {TABLE}
@@ -168,8 +186,14 @@ def mark_false_positive(alert_id: int, *, note: Optional[str] = None) -> None:
                         to_jsonb(:note)
                     )
                 WHERE id = :id
+                RETURNING business_id
                 """
             ),
             {"id": alert_id, "note": note or ""},
         )
+        row = r.fetchone()
+    _invalidate_list_cache()
+    if row:
+        # A cached scan result would still show the alert as open
+        CacheService.invalidate_pattern(CacheKey.FRAUD_SCAN, f"{row[0]}:*")
 
@@ -1,6 +1,8 @@
 """Fraud detection orchestrator and scoring."""
 from __future__ import annotations
 
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 from src.infrastructure.logging import get_logger
@@ -34,12 +36,18 @@ def run_fraud_checks_for_business(business_id: str) -> Dict[str, object]:
             detect_unusual_patterns,
         ]
 
-        for fn in detectors:
-            try:
-                hits = fn(business_id)
-                all_hits.extend(hits)
-            except Exception as e:
-                logger.exception("fraud detector failed", pattern_fn=fn.__name__, business_id=business_id, error=str(e))
+        # Detectors are independent Neo4j reads; overlap their round-trips. Each
+        # worker gets a copy of the caller's context so tenant filtering applies.
+        with ThreadPoolExecutor(max_workers=len(detectors)) as executor:
+            futures = [
+                (fn, executor.submit(contextvars.copy_context().run, fn, business_id))
+                for fn in detectors
+            ]
+            for fn, future in futures:
+                try:
+                    all_hits.extend(future.result())
+                except Exception as e:
+                    logger.exception("fraud detector failed", pattern_fn=fn.__name__, business_id=business_id, error=str(e))
 
         alert = create_alert_from_hits(business_id, all_hits)
         
@@ -42,6 +42,42 @@ def export_subgraph_for_visualization(subgraph: Subgraph) -> Dict:
     }
 
 
+def export_subgraph_dict_for_visualization(data: Dict) -> Dict:
+    """
+    Same as export_subgraph_for_visualization, for a subgraph already in its
+    JSON (model_dump) form, e.g. a cache hit; skips rebuilding the models.
+    """
+    nodes = [
+        {
+            "id": n["id"],
+            "label": n["properties"].get("name") or n["id"],
+            "labels": n["labels"],
+            "properties": n["properties"],
+            "riskScore": n["properties"].get("risk_score") or n["properties"].get("riskScore"),
+        }
+        for n in data.get("nodes", [])
+    ]
+
+    edges = [
+        {
+            "id": f"{r['from_id']}-{r['to_id']}-{r['type']}",
+            "source": r["from_id"],
+            "target": r["to_id"],
+            "type": r["type"],
+            "properties": r.get("properties", {}),
+        }
+        for r in data.get("relationships", [])
+    ]
+
+    return {
+        "nodes": nodes,
+        "edges": edges,
+        "center_node_id": data.get("center_node_id"),
+        "node_count": len(nodes),
+        "edge_count": len(edges),
+    }
+
+
 def export_path_for_visualization(path) -> Dict:
     """Export path in visualization format."""
     nodes = [
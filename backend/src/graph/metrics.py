@@ -1,7 +1,11 @@
 """Graph metrics: centrality, PageRank."""
+import hashlib
 from typing import List, Optional
 
+from src.cache.config import CacheKey, CacheTTL
+from src.cache.service import cache_aside, make_cache_key
 from src.infrastructure.database.neo4j_client import neo4j_client
+from src.tenancy.context import get_current_tenant
 
 from .models import GraphMetrics
 
@@ -85,28 +89,51 @@ def compute_node_metrics(node_id: str, include_centrality: bool = True) -> Graph
     return metrics
 
 
+def _pagerank_cache_key(node_ids: List[str], iterations: int = 20) -> str:
+    """
+    Key PageRank runs by tenant, iterations and the (order-insensitive) node set.
+
+    Node ids appear only as a digest, so invalidate_graph_cache(node_id)
+    patterns never match these keys.
+    """
+    tenant = get_current_tenant()
+    digest = hashlib.blake2b(",".join(sorted(set(node_ids))).encode(), digest_size=16).hexdigest()
+    return make_cache_key(
+        CacheKey.GRAPH_QUERY, "pagerank", tenant.tenant_id if tenant else "-", iterations, digest
+    )
+
+
+@cache_aside(CacheKey.GRAPH_QUERY, ttl=CacheTTL.GRAPH_QUERY_MEDIUM, key_func=_pagerank_cache_key)
+def _apoc_pagerank(node_ids: List[str], iterations: int = 20) -> dict:
+    """Run APOC PageRank over the given nodes (cached; failures are not)."""
+    query = """
+    UNWIND $node_ids as node_id
+    MATCH (n) WHERE id(n) = node_id
+    WITH collect(n) as nodes
+    CALL apoc.algo.pageRankWithConfig(nodes, {iterations: $iterations}) 
+    YIELD node, score
+    RETURN id(node) as node_id, score as pagerank
+    """
+    rows = neo4j_client.execute_cypher(
+        query, {"node_ids": [int(nid) for nid in node_ids], "iterations": iterations}
+    )
+    return {str(row["node_id"]): float(row["pagerank"]) for row in rows}
+
+
 def compute_pagerank_for_subgraph(node_ids: List[str], iterations: int = 20) -> dict:
     """
     Compute PageRank for a subgraph of nodes.
 
-    Returns dict mapping node_id to pagerank score.
+    Returns dict mapping node_id to pagerank score. Results are cached per
+    tenant and node set. The key holds only a digest of the node set, so
+    per-node invalidation does not reach it: entries are evicted by a full
+    graph cache invalidation or when the TTL expires.
     """
     if not node_ids:
         return {}
 
     try:
-        query = """
-        UNWIND $node_ids as node_id
-        MATCH (n) WHERE id(n) = node_id
-        WITH collect(n) as nodes
-        CALL apoc.algo.pageRankWithConfig(nodes, {iterations: $iterations}) 
-        YIELD node, score
-        RETURN id(node) as node_id, score as pagerank
-        """
-        rows = neo4j_client.execute_cypher(
-            query, {"node_ids": [int(nid) for nid in node_ids], "iterations": iterations}
-        )
-        return {str(row["node_id"]): float(row["pagerank"]) for row in rows}
+        return _apoc_pagerank(node_ids, iterations)
     except Exception:
         # Fallback: simple degree-based ranking
         query = """
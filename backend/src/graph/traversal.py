@@ -1,5 +1,5 @@
 """Graph traversal operations: subgraph extraction, path finding."""
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from src.infrastructure.database.neo4j_client import neo4j_client
 from src.infrastructure.logging import get_logger
@@ -96,6 +96,8 @@ def extract_subgraph(
     WITH start, nodes, rels_between + rels_to_start as relationships
     RETURN 
         start.id as center_id,
+        labels(start) as center_labels,
+        properties(start) as center_props,
         [x in nodes | {{
             id: coalesce(x.id, toString(id(x))), 
             labels: labels(x), 
@@ -116,21 +118,18 @@ def extract_subgraph(
         GraphNode(id=str(n["id"]), labels=n.get("labels", []), properties=n.get("props", {}))
         for n in row.get("nodes", [])
     ]
-    # Add center node if not already included
+    # Add center node if not already included; its labels and properties come
+    # back with the traversal, so no second lookup is needed
     center_id = str(row.get("center_id", node_id))
     if not any(n.id == center_id for n in nodes):
-        # Try to find center node by id property
-        # Add tenant filter to center node query
-        center_query = "MATCH (n {id: $node_id}) WHERE n.tenant_id = $tenant_id RETURN n, labels(n) as labels LIMIT 1"
-        center_params = {"node_id": center_id}
-        if tenant:
-            center_params["tenant_id"] = tenant.tenant_id
-        center_rows = neo4j_client.execute_cypher(center_query, center_params, skip_tenant_filter=True)
-        if center_rows:
-            center_data = center_rows[0]
-            center_node = center_data.get("n", {})
-            center_labels = center_data.get("labels", [])
-            nodes.insert(0, GraphNode(id=center_id, labels=center_labels, properties=center_node))
+        nodes.insert(
+            0,
+            GraphNode(
+                id=center_id,
+                labels=row.get("center_labels", []),
+                properties=row.get("center_props", {}),
+            ),
+        )
 
     rels = [
         GraphRelationship(
@@ -200,14 +199,14 @@ def find_shortest_path(
     return Path(nodes=nodes, relationships=rels, length=row.get("path_length", 0))
 
 
-def find_all_paths(
+def _all_paths_query(
     start_id: str,
     end_id: str,
-    max_depth: int = 5,
-    limit: int = 100,
-    rel_types: Optional[List[str]] = None,
-) -> List[Path]:
-    """Find all paths between two nodes (up to limit)."""
+    max_depth: int,
+    limit: int,
+    rel_types: Optional[List[str]],
+) -> Tuple[str, Dict]:
+    """Build the tenant-filtered all-paths query and its parameters."""
     rel_filter = ""
     if rel_types:
         types_str = "|".join(rel_types)
@@ -234,23 +233,58 @@ def find_all_paths(
     LIMIT $limit
     """
     params = {"start_id": start_id, "end_id": end_id, "limit": limit, **tenant_params}
+    return query, params
+
+
+def _row_to_path(row: Dict) -> Path:
+    """Build a Path from one all-paths result row."""
+    nodes = [
+        GraphNode(id=str(n["id"]), labels=n.get("labels", []), properties=n.get("props", {}))
+        for n in row.get("nodes", [])
+    ]
+    rels = [
+        GraphRelationship(
+            type=r["type"],
+            from_id=str(r["from"]),
+            to_id=str(r["to"]),
+            properties=r.get("props", {}),
+        )
+        for r in row.get("rels", [])
+    ]
+    return Path(nodes=nodes, relationships=rels, length=row.get("path_length", 0))
+
+
+def find_all_paths(
+    start_id: str,
+    end_id: str,
+    max_depth: int = 5,
+    limit: int = 100,
+    rel_types: Optional[List[str]] = None,
+) -> List[Path]:
+    """Find all paths between two nodes (up to limit)."""
+    query, params = _all_paths_query(start_id, end_id, max_depth, limit, rel_types)
     rows = neo4j_client.execute_cypher(query, params, skip_tenant_filter=True)
+    return [_row_to_path(row) for row in rows]
+
+
+def iter_all_paths(
+    start_id: str,
+    end_id: str,
+    max_depth: int = 5,
+    limit: int = 100,
+    rel_types: Optional[List[str]] = None,
+) -> Iterator[Path]:
+    """
+    Like find_all_paths, but yield each Path as its record arrives.
+
+    The query (and tenant) is bound on call; the Neo4j session stays open
+    until the iterator is exhausted or closed.
+    """
+    query, params = _all_paths_query(start_id, end_id, max_depth, limit, rel_types)
 
-    paths = []
-    for row in rows:
-        nodes = [
-            GraphNode(id=str(n["id"]), labels=n.get("labels", []), properties=n.get("props", {}))
-            for n in row.get("nodes", [])
-        ]
-        rels = [
-            GraphRelationship(
-                type=r["type"],
-                from_id=str(r["from"]),
-                to_id=str(r["to"]),
-                properties=r.get("props", {}),
-            )
-            for r in row.get("rels", [])
-        ]
-        paths.append(Path(nodes=nodes, relationships=rels, length=row.get("path_length", 0)))
+    def _paths() -> Iterator[Path]:
+        with neo4j_client.stream_cypher(query, params) as rows:
+            for row in rows:
+                yield _row_to_path(row)
 
-    return paths
+    return _paths()
@@ -79,6 +79,14 @@ class RedisClient:
             logger.warning("Redis exists operation failed", key=key, error=str(e))
             return False
     
+    def publish(self, channel: str, message: str) -> int:
+        """Publish message to a pub/sub channel. Returns number of subscribers reached."""
+        try:
+            return int(self.client.publish(channel, message))
+        except (ConnectionError, TimeoutError) as e:
+            logger.warning("Redis publish operation failed", channel=channel, error=str(e))
+            return 0
+    
     def health_check(self) -> bool:
         """Check if Redis connection is healthy."""
         try:
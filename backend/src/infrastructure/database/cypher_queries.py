@@ -155,3 +155,16 @@ def merge_relationship_by_business_id_query(from_label: str, to_label: str, rel_
     )
 
 
+# ---------------------------------------------------------------------------
+# Denormalized counters
+# ---------------------------------------------------------------------------
+
+
+def refresh_person_transaction_count_query() -> str:
+    """UNWIND $person_ids ... SET p.transaction_count from each Person's own INVOLVES edges.
+    Recomputed rather than incremented, so it is safe to re-run after MERGE upserts (which
+    replace all properties) and dedup merges/unmerges. Ids that are not Person nodes are ignored."""
+    return (
+        "UNWIND $person_ids AS pid MATCH (p:Person {id: pid}) "
+        "SET p.transaction_count = COUNT { (p)<-[:INVOLVES]-(:Transaction) }"
+    )
@@ -0,0 +1,20 @@
+-- Anomaly alerts raised by the detection pipeline
+CREATE TABLE IF NOT EXISTS anomaly_alerts (
+    id CHAR(32) PRIMARY KEY,
+    entity_id VARCHAR(255) NOT NULL,
+    entity_type VARCHAR(50) NOT NULL,
+    anomaly_score FLOAT NOT NULL,
+    severity VARCHAR(20) NOT NULL,
+    description TEXT NOT NULL,
+    detected_at TIMESTAMP NOT NULL,
+    acknowledged BOOLEAN DEFAULT FALSE,
+    acknowledged_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_anomaly_alerts_entity ON anomaly_alerts(entity_id);
+CREATE INDEX IF NOT EXISTS idx_anomaly_alerts_severity ON anomaly_alerts(severity);
+CREATE INDEX IF NOT EXISTS idx_anomaly_alerts_acknowledged ON anomaly_alerts(acknowledged);
+CREATE INDEX IF NOT EXISTS idx_anomaly_alerts_detected_at ON anomaly_alerts(detected_at DESC);
+CREATE INDEX IF NOT EXISTS idx_anomaly_alerts_severity_detected ON anomaly_alerts(severity, detected_at DESC);
+CREATE INDEX IF NOT EXISTS idx_anomaly_alerts_unacknowledged ON anomaly_alerts(detected_at DESC) WHERE acknowledged = FALSE;
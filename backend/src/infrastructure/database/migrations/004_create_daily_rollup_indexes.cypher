@@ -0,0 +1,3 @@
+// Daily transaction rollups (DailyTxnStats) maintained by the refresh_daily_rollups task.
+// One node per business per day; MERGE and the time-series reads look it up by (business_id, day).
+CREATE INDEX daily_txn_stats_business_day IF NOT EXISTS FOR (n:DailyTxnStats) ON (n.business_id, n.day);
@@ -0,0 +1,7 @@
+// Denormalized Person.transaction_count (number of Transactions INVOLVing the person).
+// Maintained by the mobile-money writer and dedup merge/unmerge; /graph/people sorts by it.
+CREATE INDEX person_transaction_count IF NOT EXISTS FOR (n:Person) ON (n.transaction_count);
+
+// Backfill existing people
+MATCH (p:Person)
+SET p.transaction_count = COUNT { (p)<-[:INVOLVES]-(:Transaction) };
@@ -25,6 +25,10 @@ logger = get_logger(__name__)
 
 DEADLOCK_INDICATORS = ("deadlock", "lock", "lockexception", "acquirelock")
 
+# Bolt connections kept per process; sync route handlers run on the
+# threadpool, which is sized to match at startup (see api.main lifespan)
+NEO4J_POOL_SIZE = 50
+
 
 class Neo4jClient:
     """Neo4j client with connection pooling, retry, CRUD, traversal, batch, and pagination."""
@@ -42,7 +46,7 @@ class Neo4jClient:
                 settings.neo4j_uri,
                 auth=(settings.neo4j_user, settings.neo4j_password),
                 max_connection_lifetime=3600,
-                max_connection_pool_size=50,
+                max_connection_pool_size=NEO4J_POOL_SIZE,
                 connection_acquisition_timeout=60,
             )
             self.driver.verify_connectivity()
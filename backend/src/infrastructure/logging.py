@@ -61,7 +61,8 @@ def configure_logging(log_level: str = "INFO") -> None:
         ),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(),
-        cache_logger_on_first_use=False,
+        # Bind each module logger once instead of on every log call
+        cache_logger_on_first_use=True,
     )
 
 
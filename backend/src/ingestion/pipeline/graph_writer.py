@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional
 from src.config.settings import settings
 from src.infrastructure.audit import audit_logger
 from src.infrastructure.database.neo4j_client import neo4j_client
+import src.infrastructure.database.cypher_queries as cypher_queries
 from src.cache.invalidation import invalidate_graph_cache
 
 from src.ingestion.normalizers.canonical import (
@@ -51,6 +52,7 @@ def write_mobile_money(
     """
     bid = (default_business_id or getattr(settings, "default_business_id", None) or "default").strip()
     nodes, rels = 0, 0
+    person_ids = set()
 
     for t in transactions:
         tid = (t.source_id or "").strip()
@@ -116,6 +118,16 @@ def write_mobile_money(
             }
         )
         rels += 1
+        person_ids.add(person_id)
+
+    if person_ids:
+        # Keep Person.transaction_count (the /graph/people sort key) in step with
+        # INVOLVES; recomputed per node from its own edges, so no tenant filter needed
+        neo4j_client.execute_cypher(
+            cypher_queries.refresh_person_transaction_count_query(),
+            {"person_ids": list(person_ids)},
+            skip_tenant_filter=True,
+        )
 
     if transactions:
         audit_logger.log_system("ingestion.mobile_money.write", extra={"count": len(transactions), "nodes": nodes, "rels": rels})
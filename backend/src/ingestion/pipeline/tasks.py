@@ -1,4 +1,4 @@
-"""Celery tasks for the ingestion pipeline: mobile money, accounting; DLQ; Beat schedule."""
+"""Celery tasks for the ingestion pipeline: mobile money, accounting, daily rollups, cashflow alerts; DLQ; Beat schedule."""
 from datetime import datetime
 from typing import Any, Dict, Optional
 
@@ -33,6 +33,14 @@ app.conf.beat_schedule = {
         "task": "src.ingestion.pipeline.tasks.scheduled_accounting",
         "schedule": crontab(minute=30, hour="*/6"),
     },
+    "refresh-daily-rollups": {
+        "task": "src.ingestion.pipeline.tasks.refresh_daily_rollups",
+        "schedule": crontab(minute="*/15"),
+    },
+    "scan-negative-cashflow": {
+        "task": "src.ingestion.pipeline.tasks.scan_negative_cashflow",
+        "schedule": crontab(minute=0, hour=2),  # daily; months only close once a day
+    },
 }
 
 
@@ -250,3 +258,27 @@ def scheduled_accounting() -> Optional[Dict[str, Any]]:
     ingest_accounting.delay(connector, tenant_id=tenant or None, job_id=jid)
     return {"job_id": jid, "scheduled": True}
 
+
+@app.task
+def refresh_daily_rollups() -> Dict[str, Any]:
+    """Beat: rebuild DailyTxnStats rollups used by time-series anomaly detection."""
+    from src.anomaly.rollup import refresh_daily_rollups as _refresh
+
+    _ensure_connections()
+    return {"rollups": _refresh()}
+
+
+@app.task
+def scan_negative_cashflow() -> Dict[str, Any]:
+    """Beat: evaluate the negative cashflow alert rule for every active tenant."""
+    from src.alerts.engine import initialize_rules
+    from src.alerts.integrations import scan_all_businesses_for_cashflow
+    from src.tenancy.context import get_tenant_manager
+
+    _ensure_connections()
+    initialize_rules()
+    alerts = 0
+    tenants = get_tenant_manager().list_tenants(status="active", limit=10000)
+    for tenant in tenants:
+        alerts += len(scan_all_businesses_for_cashflow(tenant_id=tenant.tenant_id))
+    return {"tenants": len(tenants), "alerts": alerts}
@@ -0,0 +1,223 @@
+"""Unit tests for anomaly detection helpers."""
+import pytest
+import numpy as np
+from datetime import datetime
+
+from src.anomaly.utils import build_isolation_forest, normalize01, rolling_mean_std
+
+
+@pytest.mark.unit
+class TestNormalize01:
+    """Test min-max score normalization."""
+
+    def test_scales_to_unit_range(self):
+        """Test that scores are scaled to [0, 1] in place."""
+        scores = np.array([2.0, 4.0, 6.0])
+        result = normalize01(scores)
+        assert result is scores
+        np.testing.assert_allclose(result, [0.0, 0.5, 1.0])
+
+    def test_constant_scores(self):
+        """Test that a zero-range array becomes zeros."""
+        result = normalize01(np.array([3.0, 3.0, 3.0]))
+        np.testing.assert_array_equal(result, [0.0, 0.0, 0.0])
+
+
+@pytest.mark.unit
+class TestRollingMeanStd:
+    """Test the single-pass rolling mean/std kernel."""
+
+    def test_matches_partial_windows(self):
+        """Test mean and sample std over leading partial and full windows."""
+        mean, std = rolling_mean_std(np.array([1.0, 2.0, 4.0, 8.0]), 3)
+        np.testing.assert_allclose(mean, [1.0, 1.5, 7 / 3, 14 / 3])
+        assert np.isnan(std[0])
+        expected = [np.std(w, ddof=1) for w in ([1, 2], [1, 2, 4], [2, 4, 8])]
+        np.testing.assert_allclose(std[1:], expected)
+
+    def test_large_offset_is_stable(self):
+        """Test that a large constant offset does not produce cancellation error."""
+        mean, std = rolling_mean_std(np.full(50, 1e9) + np.arange(50) % 2, 10)
+        np.testing.assert_allclose(std[10:], np.std([0, 1] * 5, ddof=1), rtol=1e-6)
+
+    def test_min_periods_masks_partial_windows(self):
+        """Test that windows shorter than min_periods are NaN."""
+        mean, std = rolling_mean_std(np.array([1.0, 2.0, 4.0, 8.0]), 3, min_periods=3)
+        assert np.isnan(mean[:2]).all() and np.isnan(std[:2]).all()
+        np.testing.assert_allclose(mean[2:], [7 / 3, 14 / 3])
+
+
+@pytest.mark.unit
+class TestBuildIsolationForest:
+    """Test the data-sized IsolationForest factory."""
+
+    def test_small_input_fits_and_predicts(self):
+        """Test a forest for a small sample is sized down and can fit/predict."""
+        forest = build_isolation_forest(0.1, 50)
+        assert forest.n_estimators == 32
+        assert forest.max_samples == 50
+        X = np.vstack([np.zeros((49, 2)), [[100.0, 100.0]]])
+        labels = forest.fit_predict(X)
+        assert labels.shape == (50,)
+        assert labels[-1] == -1
+
+    def test_large_input_caps_trees_and_samples(self):
+        """Test tree count and per-tree samples are capped for large inputs."""
+        forest = build_isolation_forest(0.05, 50_000)
+        assert forest.n_estimators == 100
+        assert forest.max_samples == 256
+        assert forest.contamination == 0.05
+
+
+@pytest.mark.unit
+class TestDetectionCache:
+    """Test per-tenant reuse of detection batches."""
+
+    def test_batches_are_not_shared_across_tenants(self):
+        """Test a tenant never receives another tenant's cached detections."""
+        import contextvars
+        from unittest.mock import Mock
+
+        from src.anomaly import scoring
+        from src.tenancy.context import set_current_tenant
+        from src.tenancy.models import Tenant
+
+        def lookup(tenant_id, detector):
+            def run():
+                set_current_tenant(Tenant(tenant_id=tenant_id, name=tenant_id))
+                return scoring._cached_detections("transaction", detector)
+            return contextvars.copy_context().run(run)
+
+        scoring._detection_cache.clear()
+        detector_a = Mock(return_value=[Mock(entity_id="tx-a")])
+        detector_b = Mock(return_value=[Mock(entity_id="tx-b")])
+
+        assert set(lookup("tenant-a", detector_a)) == {"tx-a"}
+        assert set(lookup("tenant-b", detector_b)) == {"tx-b"}
+        assert set(lookup("tenant-a", detector_b)) == {"tx-a"}
+        detector_a.assert_called_once()
+        detector_b.assert_called_once()
+        scoring._detection_cache.clear()
+
+
+@pytest.mark.unit
+class TestSeriesCache:
+    """Test tenant scoping of cached time series."""
+
+    def test_key_includes_tenant(self):
+        """Test two tenants asking for the same business get distinct keys."""
+        import contextvars
+
+        from src.anomaly.timeseries import _series_cache_key
+        from src.tenancy.context import set_current_tenant
+        from src.tenancy.models import Tenant
+
+        def key_for(tenant_id):
+            def run():
+                set_current_tenant(Tenant(tenant_id=tenant_id, name=tenant_id))
+                return _series_cache_key("biz-1", "transaction_volume", "2026-01-01")
+            return contextvars.copy_context().run(run)
+
+        assert key_for("tenant-a") != key_for("tenant-b")
+        assert "tenant-a" in key_for("tenant-a")
+
+    def test_empty_series_is_not_cached(self):
+        """Test an empty series comes back as None so cache_aside skips it."""
+        from unittest.mock import patch
+
+        from src.anomaly import timeseries
+
+        with patch.object(timeseries.neo4j_client, "execute_cypher", return_value=[]):
+            assert timeseries._fetch_series("biz-1", "transaction_volume", "2026-01-01") is None
+
+
+def _mock_session():
+    """A MagicMock session plus a get_session stand-in yielding it."""
+    from contextlib import contextmanager
+    from unittest.mock import MagicMock
+
+    session = MagicMock()
+
+    @contextmanager
+    def get_session():
+        yield session
+
+    return session, get_session
+
+
+@pytest.mark.unit
+class TestAnomalyAlertsTable:
+    """Test the startup schema check for anomaly_alerts."""
+
+    def test_runs_migration_statements_in_one_session(self):
+        """Test each migration statement is executed through get_session."""
+        from unittest.mock import patch
+
+        from src.anomaly import alerts
+
+        session, get_session = _mock_session()
+        with patch.object(alerts.postgres_client, "get_session", get_session):
+            alerts.ensure_anomaly_alerts_table()
+        statements = [str(call.args[0]) for call in session.execute.call_args_list]
+        assert statements[0].lstrip().startswith("CREATE TABLE IF NOT EXISTS anomaly_alerts")
+        assert len(statements) == 7
+        assert not any(stmt.lstrip().startswith("--") for stmt in statements)
+
+
+@pytest.mark.unit
+class TestSaveAlerts:
+    """Test batched anomaly alert inserts."""
+
+    def test_inserts_batch_with_named_parameters(self):
+        """Test one INSERT per batch binds every alert and returns the new IDs."""
+        from unittest.mock import patch
+
+        from src.anomaly import alerts
+        from src.anomaly.models import AnomalyAlert
+
+        batch = [
+            AnomalyAlert(
+                id=f"{i:032d}",
+                entity_id=f"biz-{i}",
+                entity_type="business",
+                anomaly_score=0.9,
+                severity="high",
+                description="test",
+                detected_at=datetime(2026, 1, 1),
+            )
+            for i in range(3)
+        ]
+        session, get_session = _mock_session()
+        session.execute.return_value.scalars.return_value.all.return_value = [batch[0].id, batch[2].id]
+        with patch.object(alerts.postgres_client, "get_session", get_session), \
+                patch.object(alerts, "_SAVE_BATCH_SIZE", 2):
+            saved = alerts.save_alerts(batch)
+
+        assert saved == [batch[0].id, batch[2].id] * 2
+        assert session.execute.call_count == 2
+        first_sql, first_params = session.execute.call_args_list[0].args
+        assert ":entity_id1" in str(first_sql) and "$1" not in str(first_sql)
+        assert first_params["entity_id1"] == "biz-1"
+        assert set(session.execute.call_args_list[1].args[1]) >= {"id2", "detected_at2"}
+
+
+@pytest.mark.unit
+class TestListAlerts:
+    """Test keyset pagination of anomaly alerts."""
+
+    def test_pages_on_detected_at_and_id(self):
+        """Test the cursor binds both detected_at and id so ties are not skipped."""
+        from unittest.mock import patch
+
+        from src.anomaly import alerts
+
+        session, get_session = _mock_session()
+        session.execute.return_value.fetchall.return_value = []
+        cursor = (datetime(2026, 1, 1), "0" * 32)
+        with patch.object(alerts.postgres_client, "get_session", get_session):
+            assert alerts.list_alerts(limit=10, before=cursor) == []
+
+        sql, params = session.execute.call_args.args
+        assert "(detected_at, id) <" in str(sql)
+        assert "ORDER BY detected_at DESC, id DESC" in str(sql)
+        assert (params["before_ts"], params["before_id"]) == cursor
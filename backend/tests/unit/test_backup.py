@@ -0,0 +1,41 @@
+"""Unit tests for backup API routes."""
+from pathlib import Path
+
+import pytest
+from unittest.mock import Mock, patch
+
+from fastapi import HTTPException
+
+from src.api.routes import backup
+from src.backup.retention import RetentionPolicy
+
+
+@pytest.mark.unit
+class TestBackupRoutes:
+    """Test backup route module and path handling."""
+
+    def test_module_constants_resolved_at_import(self):
+        """Test the module imports and derives its constants from settings."""
+        assert backup._BACKUP_ROOT == Path(backup._BACKUP_DIR).resolve()
+        assert backup._TESTER is not None
+        assert isinstance(backup._RETENTION, RetentionPolicy)
+
+    def test_backup_path_outside_root_rejected(self, tmp_path):
+        """Test a path escaping the backup directory returns 400 without testing."""
+        tester = Mock()
+        with patch.object(backup, "_BACKUP_ROOT", tmp_path.resolve()), patch.object(backup, "_TESTER", tester):
+            with pytest.raises(HTTPException) as exc:
+                backup.test_backup("../neo4j/etc/passwd")
+        assert exc.value.status_code == 400
+        tester.test_neo4j_backup.assert_not_called()
+
+    def test_backup_path_inside_root_dispatched_by_type(self, tmp_path):
+        """Test a contained path is resolved and sent to the matching tester."""
+        tester = Mock()
+        tester.test_postgres_backup.return_value = {"valid": True}
+        with patch.object(backup, "_BACKUP_ROOT", tmp_path.resolve()), patch.object(backup, "_TESTER", tester):
+            result = backup.test_backup("postgres/backup_20240101.dump")
+        assert result == {"valid": True}
+        tester.test_postgres_backup.assert_called_once_with(
+            str(tmp_path.resolve() / "postgres" / "backup_20240101.dump")
+        )
@@ -45,6 +45,18 @@ class TestCacheService:
         assert result is True
         mock_redis.delete.assert_called_once_with("test:key")
 
+    @patch("src.cache.service.redis_client")
+    def test_delete_pattern_scans_until_cursor_wraps(self, mock_redis):
+        """Test pattern delete walks SCAN pages and unlinks each batch."""
+        mock_redis.client.scan.side_effect = [(7, ["a", "b"]), (3, []), (0, ["c"])]
+        mock_redis.client.unlink.side_effect = lambda *keys: len(keys)
+
+        result = CacheService.delete_pattern("risk:score:*")
+        assert result == 3
+        assert mock_redis.client.scan.call_count == 3
+        assert mock_redis.client.unlink.call_count == 2
+        mock_redis.client.keys.assert_not_called()
+
 
 @pytest.mark.unit
 class TestCacheDecorator:
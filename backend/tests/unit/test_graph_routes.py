@@ -0,0 +1,69 @@
+"""Unit tests for graph API routes."""
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from src.api.routes import graph
+from src.graph.models import Path
+
+
+def _drain(response):
+    """Collect a StreamingResponse body (Starlette wraps sync iterators as async)."""
+    async def _collect():
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    return asyncio.run(_collect())
+
+
+def _stream(*paths):
+    """Stand in for the iter_all_paths generator."""
+    yield from paths
+
+
+@pytest.mark.unit
+class TestGetAllPaths:
+    """Test streaming of the all-paths endpoint."""
+
+    def test_query_failure_raised_before_response(self):
+        """Test an error on the first record propagates instead of a 200 stream."""
+        def _paths():
+            raise RuntimeError("neo4j unavailable")
+            yield  # pragma: no cover
+
+        with patch.object(graph, "iter_all_paths", return_value=_paths()):
+            with pytest.raises(RuntimeError):
+                graph.get_all_paths(graph.PathRequest(start_id="a", end_id="b"), limit=10)
+
+    def test_paths_streamed_as_json(self):
+        """Test all paths, including the prefetched first one, are streamed."""
+        paths = [Path(nodes=[], relationships=[], length=i) for i in (1, 2)]
+        with patch.object(graph, "iter_all_paths", return_value=_stream(*paths)):
+            response = graph.get_all_paths(graph.PathRequest(start_id="a", end_id="b"), limit=10)
+        body = _drain(response)
+        assert body.startswith(b'{"paths":[{')
+        assert body.endswith(b'],"count":2}')
+
+    def test_empty_result_streamed(self):
+        """Test no paths still produces a well-formed body."""
+        with patch.object(graph, "iter_all_paths", return_value=_stream()):
+            response = graph.get_all_paths(graph.PathRequest(start_id="a", end_id="b"), limit=10)
+        assert _drain(response) == b'{"paths":[],"count":0}'
+
+    def test_mid_stream_failure_aborts_and_closes(self):
+        """Test a later failure is logged, aborts the body, and closes the stream."""
+        closed = []
+
+        def _paths():
+            try:
+                yield Path(nodes=[], relationships=[], length=1)
+                raise RuntimeError("connection lost")
+            finally:
+                closed.append(True)
+
+        with patch.object(graph, "iter_all_paths", return_value=_paths()):
+            response = graph.get_all_paths(graph.PathRequest(start_id="a", end_id="b"), limit=10)
+        with patch.object(graph, "logger") as logger, pytest.raises(RuntimeError):
+            _drain(response)
+        logger.exception.assert_called_once()
+        assert closed == [True]